@@ -27,6 +27,16 @@ def env_int(name: str, default: int = 0) -> int:
         return default
 
 
+def env_float(name: str, default: float = 0.0) -> float:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
 def env_list(name: str, default: str = "") -> list[str]:
     return [item.strip() for item in os.getenv(name, default).split(",") if item.strip()]
 
@@ -159,6 +169,15 @@ AUTH_CSRF_THROTTLE_RATE = os.getenv("AUTH_CSRF_THROTTLE_RATE", "120/minute")
 
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_RENDERER_CLASSES": [
+        "racing.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "racing.renderers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "racing.authentication.CookieJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
@@ -177,7 +196,7 @@ REST_FRAMEWORK = {
         "auth_logout": AUTH_LOGOUT_THROTTLE_RATE,
         "auth_csrf": AUTH_CSRF_THROTTLE_RATE,
     },
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "racing.pagination.PageNumberOrCursorPagination",
     "PAGE_SIZE": 10,
     "EXCEPTION_HANDLER": "racing.exceptions.api_exception_handler",
 }
@@ -207,9 +226,13 @@ SPECTACULAR_SETTINGS = {
     "SERVE_INCLUDE_SCHEMA": False,
 }
 
+# RequestIdMiddleware wraps everything after it: the profiler (so profiles carry the request ID)
+# and compression (so request timings and metrics include its cost).
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "racing.middleware.RequestIdMiddleware",
+    "racing.middleware.RequestProfilerMiddleware",
+    "racing.middleware.ApiCompressionMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "racing.middleware.ContentSecurityPolicyMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -260,6 +283,35 @@ else:
         }
     }
 
+# Standings payloads are keyed by a per-season generation; after a write the previous one covers the rebuild.
+STANDINGS_CACHE_TIMEOUT = env_int("STANDINGS_CACHE_TIMEOUT", 3600)
+# Stats payloads are keyed by a counters generation bumped on every counted write.
+STATS_CACHE_TIMEOUT = env_int("STATS_CACHE_TIMEOUT", 3600)
+# In-process L1 in front of the shared cache for versioned standings/stats keys.
+LOCAL_CACHE_MAX_ENTRIES = env_int("LOCAL_CACHE_MAX_ENTRIES", 256)
+LOCAL_CACHE_TIMEOUT = env_int("LOCAL_CACHE_TIMEOUT", 60)
+# gzip/brotli compression of /api/ responses (brotli needs the optional ``brotli`` package).
+API_COMPRESSION_ENABLED = env_bool("API_COMPRESSION_ENABLED", True)
+API_COMPRESSION_MIN_BYTES = env_int("API_COMPRESSION_MIN_BYTES", 1024)
+API_COMPRESSION_GZIP_LEVEL = env_int("API_COMPRESSION_GZIP_LEVEL", 6)
+API_COMPRESSION_BROTLI_QUALITY = env_int("API_COMPRESSION_BROTLI_QUALITY", 5)
+# Tag-invalidated list/retrieve payload cache for the model viewsets (0, the default, disables it).
+API_RESPONSE_CACHE_TIMEOUT = env_int("API_RESPONSE_CACHE_TIMEOUT", 0)
+# Most points one driver can score in a race (win plus fastest lap) for clinch/elimination maths.
+CHAMPIONSHIP_MAX_POINTS_PER_RACE = env_int("CHAMPIONSHIP_MAX_POINTS_PER_RACE", 26)
+# Directory for per-worker metric files; set it whenever gunicorn runs more than one worker.
+METRICS_MULTIPROCESS_DIR = os.getenv("METRICS_MULTIPROCESS_DIR", "").strip()
+# Expose per-request database time and total time to browsers via a Server-Timing header.
+API_SERVER_TIMING_ENABLED = env_bool("API_SERVER_TIMING_ENABLED", False)
+# Per-worker SQL fingerprint statistics (/api/sql-stats/ and the costliest N in /api/metrics/), off by default.
+SQL_STATS_ENABLED = env_bool("SQL_STATS_ENABLED", False)
+SQL_STATS_MAX_ENTRIES = env_int("SQL_STATS_MAX_ENTRIES", 500)
+SQL_STATS_METRICS_TOP_N = env_int("SQL_STATS_METRICS_TOP_N", 20)
+# Share of requests run under cProfile (0 disables); the slowest ones above the threshold are kept per worker.
+PROFILER_SAMPLE_RATE = env_float("PROFILER_SAMPLE_RATE", 0.0)
+PROFILER_THRESHOLD_MS = env_int("PROFILER_THRESHOLD_MS", 500)
+PROFILER_MAX_PROFILES = env_int("PROFILER_MAX_PROFILES", 20)
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -3,13 +3,22 @@ from django.urls import include, path
 from django.views.generic.base import RedirectView
 
 from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
-from racing.views import health_check, metrics_export
+from racing.views import (
+    health_check,
+    metrics_export,
+    request_profile_download,
+    request_profiles,
+    sql_statement_stats,
+)
 
 urlpatterns = [
     path("", RedirectView.as_view(pattern_name="swagger-ui", permanent=False), name="root"),
     path("admin/", admin.site.urls),
     path("api/health/", health_check, name="api-health"),
     path("api/metrics/", metrics_export, name="api-metrics"),
+    path("api/sql-stats/", sql_statement_stats, name="api-sql-stats"),
+    path("api/profiles/", request_profiles, name="api-profiles"),
+    path("api/profiles/<str:request_id>/", request_profile_download, name="api-profile-download"),
     path("api/v1/", include(("racing.urls", "racing"), namespace="api-v1")),
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
     path("api/docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
@@ -0,0 +1,17 @@
+"""Gunicorn server hooks, loaded automatically from the working directory."""
+
+import os
+
+from racing.metrics import clear_multiprocess_dir, mark_process_dead
+
+metrics_multiprocess_dir = os.getenv("METRICS_MULTIPROCESS_DIR", "").strip()
+
+
+def on_starting(server):
+    if metrics_multiprocess_dir:
+        clear_multiprocess_dir(metrics_multiprocess_dir)
+
+
+def child_exit(server, worker):
+    if metrics_multiprocess_dir:
+        mark_process_dead(worker.pid, metrics_multiprocess_dir)
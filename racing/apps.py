@@ -8,3 +8,6 @@ class RacingConfig(AppConfig):
     def ready(self):
         # Register drf-spectacular schema extensions.
         from . import schema  # noqa: F401
+
+        # Invalidate tagged API response cache entries on model writes.
+        from . import signals  # noqa: F401
@@ -0,0 +1,123 @@
+import time
+from collections.abc import Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.http import parse_etags, quote_etag
+
+SEASON_GENERATION_KEY = "standings:generation:season:{season_id}"
+SEASON_DIRECTORY_GENERATION_KEY = "standings:generation:seasons"
+RESPONSE_TAG_KEY = "api:tag:{tag}"
+STATS_GENERATION_KEY = "stats:generation"
+
+
+def _initial_generation() -> int:
+    # Time-based seeds keep generations unique even after the cache lost a counter,
+    # so a stale ETag can never match a freshly recreated counter.
+    return time.time_ns()
+
+
+def get_generation(key: str) -> int:
+    generation = cache.get(key)
+    if generation is None:
+        generation = _initial_generation()
+        if not cache.add(key, generation, timeout=None):
+            generation = cache.get(key, generation)
+    return int(generation)
+
+
+def bump_generation(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _initial_generation(), timeout=None)
+
+
+def _bump_now_and_on_commit(keys: list[str]) -> None:
+    # Bumping immediately makes the writer's own transaction read fresh data; bumping again
+    # on commit discards payloads other workers cached from pre-commit rows in the meantime.
+    for key in keys:
+        bump_generation(key)
+
+    def bump_committed():
+        for key in keys:
+            bump_generation(key)
+
+    transaction.on_commit(bump_committed)
+
+
+def season_generation(season_id: int) -> int:
+    return get_generation(SEASON_GENERATION_KEY.format(season_id=season_id))
+
+
+def season_directory_generation() -> int:
+    return get_generation(SEASON_DIRECTORY_GENERATION_KEY)
+
+
+def season_and_directory_generations(season_id: int) -> tuple[int, int]:
+    """``(season_generation, season_directory_generation)`` read in one cache round-trip."""
+    keys = [SEASON_GENERATION_KEY.format(season_id=season_id), SEASON_DIRECTORY_GENERATION_KEY]
+    found = cache.get_many(keys)
+    season, directory = (int(found[key]) if key in found else get_generation(key) for key in keys)
+    return season, directory
+
+
+def bump_season_generations(season_ids: Iterable[int]) -> None:
+    keys = [
+        SEASON_GENERATION_KEY.format(season_id=season_id)
+        for season_id in sorted({season_id for season_id in season_ids if season_id})
+    ]
+    if keys:
+        _bump_now_and_on_commit(keys)
+
+
+def bump_season_directory_generation() -> None:
+    _bump_now_and_on_commit([SEASON_DIRECTORY_GENERATION_KEY])
+
+
+def stats_generation() -> int:
+    return get_generation(STATS_GENERATION_KEY)
+
+
+def bump_stats_generation() -> None:
+    _bump_now_and_on_commit([STATS_GENERATION_KEY])
+
+
+def model_tags(model_tag: str, pk, season_id: int | None = None) -> list[str]:
+    """Tags a write to one row invalidates: the model wildcard, the row and its season scope."""
+    tags = [f"{model_tag}:*", f"{model_tag}:{pk}"]
+    if season_id:
+        tags.append(f"{model_tag}:season:{season_id}")
+    return tags
+
+
+def tag_versions(tags: Iterable[str]) -> list[int]:
+    keys = [RESPONSE_TAG_KEY.format(tag=tag) for tag in tags]
+    found = cache.get_many(keys)
+    return [int(found[key]) if key in found else get_generation(key) for key in keys]
+
+
+def bump_tags(tags: Iterable[str]) -> None:
+    """Give every tag a fresh version in one cache round-trip (again on commit)."""
+    keys = sorted({RESPONSE_TAG_KEY.format(tag=tag) for tag in tags})
+    if not keys:
+        return
+
+    def bump():
+        version = _initial_generation()
+        cache.set_many({key: version for key in keys}, timeout=None)
+
+    bump()
+    transaction.on_commit(bump)
+
+
+def build_etag(*parts) -> str:
+    return quote_etag("-".join(str(part) for part in parts))
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison, as If-None-Match requires: compressed responses carry ``W/`` validators."""
+    if not if_none_match:
+        return False
+    etags = {candidate.removeprefix("W/") for candidate in parse_etags(if_none_match)}
+    return "*" in etags or etag.removeprefix("W/") in etags
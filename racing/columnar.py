@@ -0,0 +1,57 @@
+"""Columnar list responses for analytics clients.
+
+``?format=columnar`` (or ``Accept: application/vnd.motorsport.columnar+json``) turns a list
+page's ``results`` into ``{"columns": [...], "data": {column: [values]}}``. Rows come straight
+from ``.values()`` over the viewset's ``columnar_fields`` lookups, so no model instances or
+serializers are built and every key is written once per page instead of once per row.
+Pagination, filtering and the response cache behave as for the row-oriented list.
+"""
+
+from rest_framework.exceptions import NotAcceptable
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from .pagination import unique_ordering
+from .renderers import ColumnarJSONRenderer
+
+
+def columnar_payload(rows, columns: dict[str, str]) -> dict:
+    """Transpose ``.values()`` rows into one list per output column."""
+    return {
+        "columns": list(columns),
+        "data": {column: [row[lookup] for row in rows] for column, lookup in columns.items()},
+    }
+
+
+class ColumnarListMixin:
+    """Serve the ``list`` action in the columnar format when the client negotiates it.
+
+    ``columnar_fields`` maps each output column to the ORM lookup it is read from.
+    """
+
+    columnar_fields: dict[str, str] = {}
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, ColumnarJSONRenderer]
+
+    def wants_columnar(self, request) -> bool:
+        return getattr(request, "accepted_renderer", None) is not None and (
+            request.accepted_renderer.format == ColumnarJSONRenderer.format
+        )
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if self.wants_columnar(request) and self.action != "list":
+            raise NotAcceptable("The columnar format is only available for list endpoints.")
+
+    def list(self, request, *args, **kwargs):
+        if not self.wants_columnar(request):
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        # Keyset cursors read the ordering values back from each row, so they are always selected.
+        ordering = [field.lstrip("-") for field in unique_ordering(queryset)]
+        rows = queryset.values(*dict.fromkeys([*self.columnar_fields.values(), *ordering]))
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(columnar_payload(page, self.columnar_fields))
+        return Response(columnar_payload(rows, self.columnar_fields))
@@ -0,0 +1,106 @@
+"""Sparse fieldsets (``?fields=``) and opt-in expansion (``?expand=``) for the model serializers.
+
+Both parameters take comma-separated, dotted paths (``fields=id,position,driver.name``,
+``expand=driver.team``). Without either parameter responses are unchanged and every nested
+relation is embedded. Once a read request sends one of them, relations listed in a serializer's
+``expandable_fields`` collapse to their primary key unless they are expanded, either through
+``expand`` or by selecting one of their sub-fields in ``fields``.
+
+The joins a queryset needs follow from the pruned fields (``related_paths``), so a request
+for collapsed relations no longer drags their tables into the ``SELECT``.
+"""
+
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+FIELDS_QUERY_PARAM = "fields"
+EXPAND_QUERY_PARAM = "expand"
+
+
+def parse_paths(value: str) -> dict:
+    """``"id,driver.name,driver.team"`` -> ``{"id": {}, "driver": {"name": {}, "team": {}}}``."""
+    tree = {}
+    for path in value.split(","):
+        node = tree
+        for part in filter(None, (part.strip() for part in path.split("."))):
+            node = node.setdefault(part, {})
+    return tree
+
+
+def requested_selection(request) -> tuple[dict, dict] | None:
+    """The ``(fields, expand)`` trees of a read request, or ``None`` when it asks for neither."""
+    if request is None or request.method not in ("GET", "HEAD", "OPTIONS"):
+        return None
+    params = request.query_params
+    if FIELDS_QUERY_PARAM not in params and EXPAND_QUERY_PARAM not in params:
+        return None
+    return parse_paths(params.get(FIELDS_QUERY_PARAM, "")), parse_paths(params.get(EXPAND_QUERY_PARAM, ""))
+
+
+def serializer_path(serializer) -> list[str]:
+    """Field names leading from the root serializer to ``serializer`` (list wrappers skipped)."""
+    path = []
+    node = serializer
+    while node.parent is not None:
+        if not isinstance(node.parent, serializers.ListSerializer):
+            path.append(node.field_name)
+        node = node.parent
+    return path[::-1]
+
+
+def related_paths(serializer) -> list[str]:
+    """``select_related`` paths needed by the readable, forward-relation fields of ``serializer``."""
+    paths = []
+    for field in serializer.fields.values():
+        if field.write_only or isinstance(field, serializers.ListSerializer) or not field.source_attrs:
+            continue
+        if isinstance(field, serializers.BaseSerializer):
+            prefix = "__".join(field.source_attrs)
+            paths += [prefix, *(f"{prefix}__{path}" for path in related_paths(field))]
+        elif len(field.source_attrs) > 1:
+            paths.append("__".join(field.source_attrs[:-1]))
+    return list(dict.fromkeys(paths))
+
+
+class SparseFieldsMixin:
+    """Prune a ``ModelSerializer``'s fields to the request's ``?fields=`` / ``?expand=`` selection.
+
+    ``expandable_fields`` maps each nested relation to the attribute holding its primary key,
+    which is rendered in its place while the relation is collapsed.
+    """
+
+    expandable_fields: dict[str, str] = {}
+
+    def get_fields(self):
+        fields = super().get_fields()
+        selection = requested_selection(self.context.get("request"))
+        if selection is None:
+            return fields
+
+        path = serializer_path(self)
+        only, expand = selection
+        for name in path:
+            only, expand = only.get(name, {}), expand.get(name, {})
+        prefix = "".join(f"{name}." for name in path)
+
+        unknown_expand = [prefix + name for name in expand if name not in self.expandable_fields]
+        if unknown_expand:
+            raise ValidationError({EXPAND_QUERY_PARAM: [f"Unknown relations: {', '.join(unknown_expand)}."]})
+
+        for name, pk_attribute in self.expandable_fields.items():
+            if name not in expand and not only.get(name):
+                fields[name] = serializers.IntegerField(source=pk_attribute, read_only=True)
+
+        unknown_fields = [
+            prefix + name
+            for name, children in only.items()
+            if name not in fields
+            or fields[name].write_only
+            or (children and not isinstance(fields[name], serializers.BaseSerializer))
+        ]
+        if unknown_fields:
+            raise ValidationError({FIELDS_QUERY_PARAM: [f"Unknown fields: {', '.join(unknown_fields)}."]})
+
+        if only:
+            fields = {name: field for name, field in fields.items() if name in only or field.write_only}
+        return fields
@@ -0,0 +1,362 @@
+import bisect
+import random
+import threading
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from io import BytesIO
+from urllib.parse import parse_qs, urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Sum
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from racing import metrics
+from racing.columnar import columnar_payload
+from racing.middleware import compress, supported_encodings
+from racing.models import Driver, DriverSeasonStanding, Race, RaceResult, Season, Team
+from racing.pagination import KeysetCursorPagination
+from racing.renderers import FastJSONParser, FastJSONRenderer
+from racing.serializers import DriverSerializer, RaceResultSerializer, RaceSerializer
+from racing.views import RaceResultViewSet
+
+DRIVERS_PER_RACE = 20
+RANKING_ROUNDS = 24
+POINTS_BY_POSITION = (25, 18, 15, 12, 10, 8, 6, 4, 2, 1)
+COMPRESSION_REPEATS = 20
+RENDERER_REPEATS = 20
+METRICS_REQUESTS_PER_RUN = 64000
+
+
+class BenchmarkRollback(Exception):
+    """Raised to roll back benchmark fixtures once measurements are collected."""
+
+
+def legacy_recalculate_points_for_ids(driver_ids):
+    normalized_ids = sorted({int(driver_id) for driver_id in driver_ids if driver_id})
+    totals = {
+        row["id"]: row["total_points"] or 0
+        for row in Driver.objects.filter(id__in=normalized_ids)
+        .annotate(total_points=Sum("race_results__points_earned"))
+        .values("id", "total_points")
+    }
+    for driver_id in normalized_ids:
+        Driver.objects.filter(id=driver_id).update(points=totals.get(driver_id, 0))
+    return totals
+
+
+class LegacyLockedMetrics:
+    """The previous recorder: every call takes one process-wide lock."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.inflight = 0
+        self.requests_total = defaultdict(int)
+        self.duration_sum = defaultdict(float)
+        self.duration_count = defaultdict(int)
+        self.duration_buckets = defaultdict(lambda: [0] * (len(metrics.LATENCY_BUCKETS_MS) + 1))
+
+    def increment_inflight_requests(self):
+        with self.lock:
+            self.inflight += 1
+
+    def decrement_inflight_requests(self):
+        with self.lock:
+            self.inflight = max(0, self.inflight - 1)
+
+    def observe_request(self, method, route, status_code, duration_ms):
+        request_key = (method.upper(), route, str(status_code))
+        duration_key = (method.upper(), route)
+        bucket = bisect.bisect_left(metrics.LATENCY_BUCKETS_MS, duration_ms)
+        with self.lock:
+            self.requests_total[request_key] += 1
+            self.duration_sum[duration_key] += float(duration_ms)
+            self.duration_count[duration_key] += 1
+            self.duration_buckets[duration_key][bucket] += 1
+
+
+def record_requests_concurrently(recorder, thread_count: int) -> float:
+    """Requests recorded per second when ``thread_count`` threads share ``METRICS_REQUESTS_PER_RUN``."""
+    per_thread = METRICS_REQUESTS_PER_RUN // thread_count
+    barrier = threading.Barrier(thread_count + 1)
+
+    def record():
+        barrier.wait()
+        for index in range(per_thread):
+            recorder.increment_inflight_requests()
+            recorder.observe_request("GET", "/api/v1/drivers/{pk}/", 200, index % 700)
+            recorder.decrement_inflight_requests()
+
+    threads = [threading.Thread(target=record) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    started_at = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return per_thread * thread_count / (time.perf_counter() - started_at)
+
+
+def legacy_rank_season(season_id):
+    return list(
+        DriverSeasonStanding.objects.filter(season_id=season_id)
+        .order_by("-points", "-wins", "driver__name")
+        .values_list("driver_id", flat=True)
+    )
+
+
+def countback_rank_season(season_id):
+    DriverSeasonStanding.objects.filter(season_id=season_id).update(position=0)
+    DriverSeasonStanding.rerank(season_id)
+
+
+def results_request(params):
+    return Request(APIRequestFactory().get("/api/v1/results/", params, HTTP_HOST="localhost"))
+
+
+def crawl_page_numbers(queryset):
+    page_number = 1
+    while True:
+        paginator = PageNumberPagination()
+        paginator.paginate_queryset(queryset, results_request({"page": page_number}))
+        if not paginator.page.has_next():
+            return page_number
+        page_number += 1
+
+
+def crawl_cursors(queryset):
+    params, pages = {}, 0
+    while True:
+        paginator = KeysetCursorPagination()
+        paginator.paginate_queryset(queryset, results_request(params))
+        pages += 1
+        if paginator.get_next_link() is None:
+            return pages
+        params = {"cursor": parse_qs(urlsplit(paginator.get_next_link()).query)["cursor"][0]}
+
+
+def measure(callback):
+    round_trips = 0
+
+    def count_round_trip(execute, sql, params, many, context):
+        nonlocal round_trips
+        round_trips += 1
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(count_round_trip):
+        started_at = time.perf_counter()
+        callback()
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+    return round_trips, elapsed_ms
+
+
+def create_points_fixture(driver_count: int) -> list[int]:
+    team = Team.objects.create(name=f"Benchmark Team {driver_count}", country="Benchmark")
+    drivers = Driver.objects.bulk_create(
+        Driver(name=f"Benchmark Driver {index}", team=team) for index in range(driver_count)
+    )
+    season = Season.objects.create(year=9000 + driver_count % 1000, name="Benchmark Season")
+
+    results = []
+    for race_index in range(0, driver_count, DRIVERS_PER_RACE):
+        race = Race.objects.create(
+            season=season,
+            round_number=race_index // DRIVERS_PER_RACE + 1,
+            name=f"Benchmark Race {race_index}",
+            country="Benchmark",
+            race_date=date(2026, 1, 1) + timedelta(days=race_index // DRIVERS_PER_RACE),
+        )
+        for position, driver in enumerate(drivers[race_index : race_index + DRIVERS_PER_RACE], start=1):
+            results.append(RaceResult(race=race, driver=driver, position=position, points_earned=position))
+    RaceResult.objects.bulk_create(results, batch_size=500)
+    return [driver.id for driver in drivers]
+
+
+def create_ranking_fixture(driver_count: int) -> int:
+    team = Team.objects.create(name=f"Ranking Team {driver_count}", country="Benchmark")
+    drivers = Driver.objects.bulk_create(
+        Driver(name=f"Ranking Driver {index}", team=team) for index in range(driver_count)
+    )
+    season = Season.objects.create(year=8000 + driver_count % 1000, name="Ranking Season")
+    randomizer = random.Random(driver_count)
+
+    results = []
+    for round_number in range(1, RANKING_ROUNDS + 1):
+        race = Race.objects.create(
+            season=season,
+            round_number=round_number,
+            name=f"Ranking Race {round_number}",
+            country="Benchmark",
+            race_date=date(2026, 1, 1) + timedelta(days=round_number),
+        )
+        classified = randomizer.sample(drivers, len(drivers))
+        for position, driver in enumerate(classified, start=1):
+            points = POINTS_BY_POSITION[position - 1] if position <= len(POINTS_BY_POSITION) else 0
+            results.append(RaceResult(race=race, driver=driver, position=position, points_earned=points))
+    RaceResult.objects.bulk_create(results, batch_size=500)
+    Season.rebuild_standings(season.id)
+    return season.id
+
+
+class Command(BaseCommand):
+    help = "Run in-database performance benchmarks against throwaway fixtures (always rolled back)"
+
+    suites = ("points", "ranking", "compression", "renderer", "pagination", "columnar", "metrics")
+    default_sizes = {
+        "points": "1,100,10000",
+        "ranking": "30,60",
+        "compression": "10,100,1000",
+        "renderer": "1000",
+        "pagination": "1000,2500",
+        "columnar": "1000,2500",
+        "metrics": "1,8,32",
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument("--suite", choices=self.suites, default="points")
+        parser.add_argument(
+            "--sizes",
+            help="Comma separated fixture sizes for suites that scale with affected rows (defaults per suite).",
+        )
+
+    def handle(self, *args, **options):
+        raw_sizes = options["sizes"] or self.default_sizes[options["suite"]]
+        try:
+            sizes = [int(size) for size in raw_sizes.split(",") if size.strip()]
+        except ValueError as exc:
+            raise CommandError("--sizes must be a comma separated list of integers.") from exc
+
+        handler = getattr(self, f"run_{options['suite']}_suite")
+        try:
+            with transaction.atomic():
+                handler(sizes)
+                raise BenchmarkRollback
+        except BenchmarkRollback:
+            pass
+
+    def write_row(self, *columns):
+        self.stdout.write("".join(str(column).ljust(18) for column in columns).rstrip())
+
+    def run_points_suite(self, sizes):
+        self.write_row("drivers", "engine", "round_trips", "wall_ms")
+        for size in sizes:
+            driver_ids = create_points_fixture(size)
+            for engine_name, engine in (
+                ("legacy_loop", legacy_recalculate_points_for_ids),
+                ("set_based", Driver.recalculate_points_for_ids),
+            ):
+                round_trips, elapsed_ms = measure(lambda: engine(driver_ids))
+                self.write_row(size, engine_name, round_trips, f"{elapsed_ms:.2f}")
+
+    def run_ranking_suite(self, sizes):
+        self.write_row("drivers", "engine", "round_trips", "wall_ms")
+        for size in sizes:
+            season_id = create_ranking_fixture(size)
+            for engine_name, engine in (
+                ("legacy_order_by", legacy_rank_season),
+                ("countback_rerank", countback_rank_season),
+                ("full_rebuild", Season.rebuild_standings),
+            ):
+                round_trips, elapsed_ms = measure(lambda: engine(season_id))
+                self.write_row(size, engine_name, round_trips, f"{elapsed_ms:.2f}")
+
+    def run_compression_suite(self, sizes):
+        self.write_row("endpoint", "rows", "encoding", "bytes", "ratio", "cpu_ms")
+        for size in sizes:
+            create_points_fixture(size)
+            endpoints = (
+                ("results", RaceResultSerializer, RaceResult.objects.select_related("race__season", "driver__team")),
+                ("drivers", DriverSerializer, Driver.objects.select_related("team")),
+                ("races", RaceSerializer, Race.objects.select_related("season")),
+            )
+            for endpoint, serializer_class, queryset in endpoints:
+                rows = list(queryset.order_by("-id")[:size])
+                content = JSONRenderer().render(serializer_class(rows, many=True).data)
+                self.write_row(endpoint, len(rows), "identity", len(content), "1.00", "0.00")
+                for encoding in supported_encodings():
+                    started_at = time.process_time()
+                    for _ in range(COMPRESSION_REPEATS):
+                        compressed = compress(content, encoding)
+                    cpu_ms = (time.process_time() - started_at) * 1000 / COMPRESSION_REPEATS
+                    ratio = len(compressed) / len(content)
+                    self.write_row(endpoint, len(rows), encoding, len(compressed), f"{ratio:.2f}", f"{cpu_ms:.3f}")
+
+    def run_renderer_suite(self, sizes):
+        self.write_row("rows", "engine", "render_ms", "parse_ms", "bytes")
+        for size in sizes:
+            create_points_fixture(size)
+            queryset = RaceResult.objects.select_related("race__season", "driver__team").order_by("-id")[:size]
+            data = RaceResultSerializer(list(queryset), many=True).data
+            for engine_name, renderer, parser in (
+                ("drf_json", JSONRenderer(), JSONParser()),
+                ("orjson", FastJSONRenderer(), FastJSONParser()),
+            ):
+                started_at = time.process_time()
+                for _ in range(RENDERER_REPEATS):
+                    content = renderer.render(data)
+                render_ms = (time.process_time() - started_at) * 1000 / RENDERER_REPEATS
+                started_at = time.process_time()
+                for _ in range(RENDERER_REPEATS):
+                    parser.parse(BytesIO(content))
+                parse_ms = (time.process_time() - started_at) * 1000 / RENDERER_REPEATS
+                self.write_row(size, engine_name, f"{render_ms:.3f}", f"{parse_ms:.3f}", len(content))
+
+    def run_pagination_suite(self, sizes):
+        self.write_row("results", "engine", "pages", "round_trips", "wall_ms")
+        for size in sizes:
+            create_points_fixture(size)
+            queryset = (
+                RaceResult.objects.select_related("race", "race__season", "driver", "driver__team")
+                .filter(driver__team__name=f"Benchmark Team {size}")
+                .order_by("race__race_date", "position")
+            )
+            for engine_name, engine in (("page_number", crawl_page_numbers), ("keyset_cursor", crawl_cursors)):
+                pages = 0
+
+                def crawl():
+                    nonlocal pages
+                    pages = engine(queryset)
+
+                round_trips, elapsed_ms = measure(crawl)
+                self.write_row(queryset.count(), engine_name, pages, round_trips, f"{elapsed_ms:.2f}")
+
+    def run_columnar_suite(self, sizes):
+        self.write_row("rows", "engine", "round_trips", "wall_ms", "bytes")
+        columns = RaceResultViewSet.columnar_fields
+        for size in sizes:
+            create_points_fixture(size)
+            queryset = RaceResult.objects.filter(driver__team__name=f"Benchmark Team {size}").order_by(
+                "race__race_date", "position"
+            )
+            engines = (
+                (
+                    "serializer_rows",
+                    lambda: RaceResultSerializer(
+                        queryset.select_related("race__season", "driver__team"), many=True
+                    ).data,
+                ),
+                ("values_columnar", lambda: columnar_payload(queryset.values(*columns.values()), columns)),
+            )
+            for engine_name, build in engines:
+                content = b""
+
+                def render():
+                    nonlocal content
+                    content = FastJSONRenderer().render(build())
+
+                round_trips, elapsed_ms = measure(render)
+                self.write_row(size, engine_name, round_trips, f"{elapsed_ms:.2f}", len(content))
+
+    def run_metrics_suite(self, sizes):
+        self.write_row("threads", "engine", "requests_per_s")
+        for thread_count in sizes:
+            for engine_name, recorder in (("global_lock", LegacyLockedMetrics()), ("thread_shards", metrics)):
+                metrics.reset_metrics_state()
+                throughput = record_requests_concurrently(recorder, thread_count)
+                self.write_row(thread_count, engine_name, f"{throughput:,.0f}")
+        metrics.reset_metrics_state()
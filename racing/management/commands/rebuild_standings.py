@@ -0,0 +1,157 @@
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections, transaction
+
+from racing.caching import bump_season_generations
+from racing.models import (
+    ConstructorRoundStanding,
+    ConstructorSeasonStanding,
+    Driver,
+    DriverRoundStanding,
+    DriverSeasonStanding,
+    RaceResult,
+    Season,
+)
+
+
+class DryRunRollback(Exception):
+    """Raised to discard a rebuild once its drift has been measured."""
+
+
+def derived_rows(season_id: int) -> set[tuple]:
+    rows = set()
+    for model, subject_field in (
+        (DriverSeasonStanding, "driver_id"),
+        (ConstructorSeasonStanding, "team_id"),
+        (DriverRoundStanding, "driver_id"),
+        (ConstructorRoundStanding, "team_id"),
+    ):
+        race_field = "race_id" if hasattr(model, "race") else "season_id"
+        rows.update(
+            (model._meta.model_name, *row)
+            for row in model.objects.filter(season_id=season_id).values_list(
+                race_field, subject_field, "position", "points", "wins", "podiums"
+            )
+        )
+    return rows
+
+
+def rebuild_season(season_id: int, dry_run: bool) -> tuple[int, int, float]:
+    """Rebuild one season's standings and snapshots; returns ``(season_id, drifted_rows, elapsed_ms)``."""
+    started_at = time.perf_counter()
+    drifted_rows = 0
+    try:
+        with transaction.atomic():
+            before = derived_rows(season_id)
+            Season.rebuild_standings(season_id)
+            drifted_rows = len(before ^ derived_rows(season_id))
+            if dry_run:
+                raise DryRunRollback
+            bump_season_generations([season_id])
+    except DryRunRollback:
+        pass
+    return season_id, drifted_rows, (time.perf_counter() - started_at) * 1000
+
+
+def initialize_worker() -> None:
+    # Spawned workers start without Django configured; forked ones already are (setup is idempotent).
+    django.setup()
+
+
+class Command(BaseCommand):
+    help = "Rebuild driver points, season standings and round snapshots from race results"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--season",
+            action="append",
+            type=int,
+            dest="seasons",
+            metavar="YEAR",
+            help="Season year to rebuild (repeatable). Rebuilds every season when omitted.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Worker processes, each with its own database connection. 1 rebuilds inline; SQLite always uses 1.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drifted rows and timings, then roll every change back.",
+        )
+
+    def handle(self, *args, **options):
+        workers = options["workers"]
+        if workers < 1:
+            raise CommandError("--workers must be at least 1.")
+        if workers > 1 and connection.vendor == "sqlite":
+            # SQLite takes one writer at a time: parallel rebuilds would fail with "database is locked".
+            self.stderr.write(self.style.WARNING("SQLite allows a single writer; rebuilding with 1 worker."))
+            workers = 1
+        dry_run = options["dry_run"]
+
+        seasons = Season.objects.order_by("year")
+        if options["seasons"]:
+            seasons = seasons.filter(year__in=options["seasons"])
+            missing = sorted(set(options["seasons"]) - set(seasons.values_list("year", flat=True)))
+            if missing:
+                raise CommandError(f"Unknown season year(s): {', '.join(str(year) for year in missing)}.")
+        years_by_id = dict(seasons.values_list("id", "year"))
+
+        started_at = time.perf_counter()
+        self.rebuild_points(years_by_id, dry_run)
+
+        results = []
+        if workers == 1:
+            for season_id in years_by_id:
+                results.append(rebuild_season(season_id, dry_run))
+                self.write_season(years_by_id, *results[-1])
+        else:
+            # Forked workers must not inherit open connections; each opens its own on first query.
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=workers, initializer=initialize_worker) as executor:
+                futures = [executor.submit(rebuild_season, season_id, dry_run) for season_id in years_by_id]
+                for future in as_completed(futures):
+                    results.append(future.result())
+                    self.write_season(years_by_id, *results[-1])
+
+        total_ms = (time.perf_counter() - started_at) * 1000
+        drifted_rows = sum(drifted for _season_id, drifted, _elapsed_ms in results)
+        summary = (
+            f"{'Checked' if dry_run else 'Rebuilt'} {len(results)} season(s) with {workers} worker(s) "
+            f"in {total_ms:.0f} ms; {drifted_rows} drifted standings row(s)."
+        )
+        if dry_run:
+            summary += " Dry run: no changes were kept."
+        self.stdout.write(self.style.SUCCESS(summary))
+
+    def rebuild_points(self, years_by_id, dry_run):
+        if not years_by_id:
+            return
+        driver_ids = set(
+            RaceResult.objects.filter(race__season_id__in=years_by_id).values_list("driver_id", flat=True)
+        )
+        if len(years_by_id) == Season.objects.count():
+            # A full rebuild also zeroes drivers whose results were all removed.
+            driver_ids |= set(Driver.objects.values_list("id", flat=True))
+
+        started_at = time.perf_counter()
+        try:
+            with transaction.atomic():
+                before = dict(Driver.objects.filter(id__in=driver_ids).values_list("id", "points"))
+                after = Driver.recalculate_points_for_ids(driver_ids)
+                drifted = sum(before.get(driver_id) != points for driver_id, points in after.items())
+                if dry_run:
+                    raise DryRunRollback
+        except DryRunRollback:
+            pass
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+        self.stdout.write(f"driver points: {len(driver_ids)} driver(s), {drifted} drifted, {elapsed_ms:.1f} ms")
+
+    def write_season(self, years_by_id, season_id, drifted_rows, elapsed_ms):
+        self.stdout.write(f"season {years_by_id[season_id]}: {drifted_rows} drifted row(s), {elapsed_ms:.1f} ms")
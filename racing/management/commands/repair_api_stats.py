@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from racing.models import ApiStats
+
+COUNTER_COLUMNS = ("total_teams", "total_drivers", "total_seasons", "total_races", "total_results", "top_points")
+
+
+class Command(BaseCommand):
+    help = "Recount the counters served by /api/v1/stats/ and report any drift"
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        previous = (
+            ApiStats.objects.select_for_update()
+            .filter(pk=ApiStats.SINGLETON_ID)
+            .values(*COUNTER_COLUMNS)
+            .first()
+        )
+        stats = ApiStats.repair()
+
+        drifted = 0
+        for column in COUNTER_COLUMNS:
+            stored = previous[column] if previous else None
+            actual = getattr(stats, column)
+            if stored != actual:
+                drifted += 1
+                self.stdout.write(f"{column}: {stored} -> {actual}")
+        self.stdout.write(self.style.SUCCESS(f"API stats repaired; {drifted} counter(s) drifted."))
@@ -1,100 +1,304 @@
+"""Prometheus text exposition of request metrics, recorded into per-thread shards.
+
+Shards live in memory, or with ``METRICS_MULTIPROCESS_DIR`` in per-thread mmap files merged across workers.
+"""
+
+import bisect
+import itertools
+import os
+import re
 import time
 from collections import defaultdict
+from pathlib import Path
 from threading import Lock
 
-_metrics_lock = Lock()
+from django.conf import settings
+from django.test.signals import setting_changed
+
+from .metrics_mmap import MmapedDict, fold_metrics_files, read_metrics_file
+from .sql_stats import render_statement_metrics
+from .thread_shards import ThreadShards
+
+# Upper bounds (inclusive, milliseconds) of the latency histogram buckets; ``+Inf`` is implicit.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+UNMATCHED_ROUTE = "unmatched"
+
+# Histogram series name -> (exposed metric, help text, label names).
+HISTOGRAMS = {
+    "duration": (
+        "motorsport_http_request_duration_ms",
+        "HTTP request duration in milliseconds.",
+        ("method", "route"),
+    ),
+    "db_duration": (
+        "motorsport_http_request_db_duration_ms",
+        "Time spent in database queries per HTTP request, in milliseconds.",
+        ("method", "route"),
+    ),
+}
+
+ROUTE_PARAMETER_RE = re.compile(r"\(\?P<(\w+)>[^)]*\)|<(?:\w+:)?(\w+)>")
+
 _process_start_time = time.time()
 
-_inflight_requests = 0
-_requests_total = defaultdict(int)
-_request_duration_ms_sum = defaultdict(float)
-_request_duration_ms_count = defaultdict(int)
+_retired_values = defaultdict(float)  # Folded-in in-memory shards of exited threads.
+_shard_ids = itertools.count()
+_unset = object()
+_multiprocess_dir = _unset  # Cached: ``settings`` attribute access is too slow for every request.
 
 
 def _escape_label(value: str) -> str:
     return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
 
 
-def _request_labels_key(method: str, path: str, status_code: int) -> tuple[str, str, str]:
-    return method.upper(), path, str(status_code)
+def route_label(resolver_match) -> str:
+    """URL template of the matched route (``/api/v1/drivers/{pk}/``), keeping label cardinality bounded."""
+    if resolver_match is None or not resolver_match.route:
+        return UNMATCHED_ROUTE
+    route = ROUTE_PARAMETER_RE.sub(lambda match: "{%s}" % (match.group(1) or match.group(2)), resolver_match.route)
+    return "/" + route.replace("^", "").replace("$", "")
+
+
+def _histogram_series(histogram_key: tuple, total: float, count: int, buckets) -> dict:
+    name, *labels = histogram_key
+    values = {(name, "sum", *labels): total, (name, "count", *labels): count}
+    for index, bucket_count in enumerate(buckets):
+        if bucket_count:
+            values[(name, "bucket", *labels, index)] = bucket_count
+    return values
+
+
+def multiprocess_dir() -> Path | None:
+    global _multiprocess_dir
+    if _multiprocess_dir is _unset:
+        directory = getattr(settings, "METRICS_MULTIPROCESS_DIR", "")
+        _multiprocess_dir = Path(directory) if directory else None
+    return _multiprocess_dir
+
+
+def _reload_multiprocess_dir(*, setting, **kwargs) -> None:
+    global _multiprocess_dir
+    if setting == "METRICS_MULTIPROCESS_DIR":
+        _multiprocess_dir = _unset
+
+
+setting_changed.connect(_reload_multiprocess_dir)
+
+
+class _MemoryShard:
+    """One thread's series in memory; the owning thread is the only writer."""
+
+    def __init__(self):
+        self.lock = Lock()
+        self.inflight = 0
+        self.requests_total = defaultdict(int)
+        self.histograms = {}  # (name, *labels) -> [sum, count, *bucket counts]
+
+    def add_inflight(self, delta: int) -> None:
+        self.inflight += delta  # Single writer, and readers only need the latest value.
+
+    def record(self, request_key: tuple, observations) -> None:
+        """Count one request and add its ``(histogram_key, value)`` observations."""
+        with self.lock:
+            self.requests_total[request_key] += 1
+            for histogram_key, value in observations:
+                histogram = self.histograms.get(histogram_key)
+                if histogram is None:
+                    histogram = self.histograms[histogram_key] = [0.0, 0] + [0] * (len(LATENCY_BUCKETS_MS) + 1)
+                histogram[0] += value
+                histogram[1] += 1
+                histogram[2 + bisect.bisect_left(LATENCY_BUCKETS_MS, value)] += 1
+
+    def series(self) -> dict:
+        with self.lock:
+            requests_total = dict(self.requests_total)
+            histograms = {key: list(histogram) for key, histogram in self.histograms.items()}
+        values = {("requests_total", *key): count for key, count in requests_total.items()}
+        for key, (total, count, *buckets) in histograms.items():
+            values.update(_histogram_series(key, total, count, buckets))
+        values[("inflight",)] = self.inflight
+        return values
+
+    def close(self) -> None:
+        pass
+
+
+class _FileShard:
+    """One thread's series in its own memory-mapped file (multi-process mode)."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.values = MmapedDict(directory / f"thread_{os.getpid()}_{next(_shard_ids)}.db")
+        self.values.set(("process_start_time",), _process_start_time)
+
+    def add_inflight(self, delta: int) -> None:
+        self.values.increment(("inflight",), delta)
+
+    def record(self, request_key: tuple, observations) -> None:
+        self.values.increment(("requests_total", *request_key), 1)
+        for (name, *labels), value in observations:
+            bucket = bisect.bisect_left(LATENCY_BUCKETS_MS, value)
+            self.values.increment((name, "sum", *labels), value)
+            self.values.increment((name, "count", *labels), 1)
+            self.values.increment((name, "bucket", *labels, bucket), 1)
+
+    def retire(self) -> None:
+        """Fold this exited thread's file into its process file; its in-flight count is over."""
+        self.close()
+        fold_metrics_files([self.values.path], self.directory / f"process_{os.getpid()}.db", drop=(("inflight",),))
+
+    def close(self) -> None:
+        self.values.close()
+
+
+def _create_shard(directory: Path | None):
+    return _MemoryShard() if directory is None else _FileShard(directory)
+
 
+_shards = ThreadShards(_create_shard)
 
-def _duration_labels_key(method: str, path: str) -> tuple[str, str]:
-    return method.upper(), path
+
+def _current_shard():
+    return _shards.current(multiprocess_dir())
+
+
+def _forget_shards() -> None:
+    global _process_start_time
+    _process_start_time = time.time()  # With ``preload_app`` the module was imported by the master.
+    _shards.reset_after_fork()
+    _retired_values.clear()
+
+
+os.register_at_fork(after_in_child=_forget_shards)
+
+
+def clear_multiprocess_dir(directory: str | Path) -> None:
+    """Start a fresh aggregation: called by the gunicorn master before it forks workers."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for path in directory.glob("*.db"):
+        path.unlink(missing_ok=True)
+
+
+def mark_process_dead(pid: int, directory: str | Path) -> None:
+    """Fold an exited worker's files into the dead workers' file, dropping its in-flight gauge."""
+    directory = Path(directory)
+    sources = [*directory.glob(f"thread_{pid}_*.db"), *directory.glob(f"process_{pid}.db")]
+    if sources:
+        fold_metrics_files(sources, directory / "dead_workers.db", drop=(("inflight",),))
 
 
 def increment_inflight_requests() -> None:
-    global _inflight_requests
-    with _metrics_lock:
-        _inflight_requests += 1
+    _current_shard().add_inflight(1)
 
 
 def decrement_inflight_requests() -> None:
-    global _inflight_requests
-    with _metrics_lock:
-        _inflight_requests = max(0, _inflight_requests - 1)
-
+    _current_shard().add_inflight(-1)
 
-def observe_request(method: str, path: str, status_code: int, duration_ms: int) -> None:
-    request_key = _request_labels_key(method, path, status_code)
-    duration_key = _duration_labels_key(method, path)
 
-    with _metrics_lock:
-        _requests_total[request_key] += 1
-        _request_duration_ms_sum[duration_key] += float(max(0, duration_ms))
-        _request_duration_ms_count[duration_key] += 1
+def observe_request(method: str, route: str, status_code: int, duration_ms: int, db_duration_ms: float = 0.0) -> None:
+    method = method.upper()
+    _current_shard().record(
+        (method, route, str(status_code)),
+        (
+            (("duration", method, route), max(0, duration_ms)),
+            (("db_duration", method, route), max(0.0, db_duration_ms)),
+        ),
+    )
 
 
 def reset_metrics_state() -> None:
-    global _inflight_requests
-    with _metrics_lock:
-        _inflight_requests = 0
-        _requests_total.clear()
-        _request_duration_ms_sum.clear()
-        _request_duration_ms_count.clear()
+    with _shards.lock:
+        for shard in _shards.clear():
+            shard.close()
+        _retired_values.clear()
+        directory = multiprocess_dir()
+        if directory is not None:
+            clear_multiprocess_dir(directory)
+
+
+def _retire_shard(shard) -> None:
+    if isinstance(shard, _MemoryShard):
+        for key, value in shard.series().items():
+            _retired_values[key] += value
+    else:
+        shard.retire()
+
+
+def _prune_exited_shards() -> tuple[list, dict]:
+    """Fold away the shards of exited threads; return the live shards and the retired series."""
+    with _shards.lock:
+        return _shards.prune(_retire_shard), dict(_retired_values)
+
+
+def _memory_values() -> dict:
+    live_shards, retired_values = _prune_exited_shards()
+    values = defaultdict(float, retired_values)
+    for shard in live_shards:
+        if isinstance(shard, _MemoryShard):
+            for key, value in shard.series().items():
+                values[key] += value
+    return values
+
+
+def _multiprocess_values(directory: Path) -> dict:
+    values = defaultdict(float)
+    for path in directory.glob("*.db"):
+        for key, value in read_metrics_file(path):
+            if key == ("process_start_time",):
+                values[key] = min(values.get(key, value), value)
+            else:
+                values[key] += value
+    return values
 
 
 def render_metrics() -> str:
-    with _metrics_lock:
-        inflight = _inflight_requests
-        requests_total = sorted(_requests_total.items())
-        durations_sum = sorted(_request_duration_ms_sum.items())
-        durations_count = sorted(_request_duration_ms_count.items())
-        process_start_time = _process_start_time
+    directory = multiprocess_dir()
+    if directory is None:
+        values = _memory_values()
+    else:
+        _prune_exited_shards()
+        values = _multiprocess_values(directory)
+
+    requests_total = sorted((key[1:], int(value)) for key, value in values.items() if key[0] == "requests_total")
+    inflight = max(0, int(values.get(("inflight",), 0)))
+    process_start_time = values.get(("process_start_time",), _process_start_time)
 
     lines = [
         "# HELP motorsport_http_requests_total Total HTTP requests served by the API.",
         "# TYPE motorsport_http_requests_total counter",
     ]
-    for (method, path, status_code), value in requests_total:
+    for (method, route, status_code), value in requests_total:
         lines.append(
-            'motorsport_http_requests_total{method="%s",path="%s",status="%s"} %s'
-            % (_escape_label(method), _escape_label(path), _escape_label(status_code), value)
+            'motorsport_http_requests_total{method="%s",route="%s",status="%s"} %s'
+            % (_escape_label(method), _escape_label(route), _escape_label(status_code), value)
         )
 
-    lines.extend(
-        [
-            "# HELP motorsport_http_request_duration_ms_sum Sum of HTTP request duration in milliseconds.",
-            "# TYPE motorsport_http_request_duration_ms_sum counter",
-        ]
-    )
-    for (method, path), value in durations_sum:
-        lines.append(
-            'motorsport_http_request_duration_ms_sum{method="%s",path="%s"} %s'
-            % (_escape_label(method), _escape_label(path), value)
-        )
+    bucket_bounds = [*(str(bound) for bound in LATENCY_BUCKETS_MS), "+Inf"]
+    for name, (metric, help_text, label_names) in HISTOGRAMS.items():
+        series = defaultdict(lambda: [0.0, 0, [0] * len(bucket_bounds)])
+        for key, value in values.items():
+            if key[0] != name:
+                continue
+            if key[1] == "bucket":
+                series[key[2:-1]][2][int(key[-1])] += int(value)
+            elif key[1] == "sum":
+                series[key[2:]][0] += value
+            else:
+                series[key[2:]][1] += int(value)
 
-    lines.extend(
-        [
-            "# HELP motorsport_http_request_duration_ms_count Count of observed HTTP requests for duration metric.",
-            "# TYPE motorsport_http_request_duration_ms_count counter",
-        ]
-    )
-    for (method, path), value in durations_count:
-        lines.append(
-            'motorsport_http_request_duration_ms_count{method="%s",path="%s"} %s'
-            % (_escape_label(method), _escape_label(path), value)
-        )
+        lines.extend([f"# HELP {metric} {help_text}", f"# TYPE {metric} histogram"])
+        for label_values, (total, count, buckets) in sorted(series.items()):
+            labels = ",".join(
+                '%s="%s"' % (label_name, _escape_label(str(label_value)))
+                for label_name, label_value in zip(label_names, label_values)
+            )
+            cumulative = 0
+            for bound, bucket_count in zip(bucket_bounds, buckets):
+                cumulative += bucket_count
+                lines.append('%s_bucket{%s,le="%s"} %s' % (metric, labels, bound, cumulative))
+            lines.append("%s_sum{%s} %s" % (metric, labels, float(total)))
+            lines.append("%s_count{%s} %s" % (metric, labels, count))
 
     lines.extend(
         [
@@ -106,5 +310,6 @@ def render_metrics() -> str:
             f"motorsport_process_start_time_seconds {process_start_time}",
         ]
     )
+    lines.extend(render_statement_metrics(settings.SQL_STATS_METRICS_TOP_N))
 
     return "\n".join(lines) + "\n"
@@ -0,0 +1,117 @@
+"""Memory-mapped metric files for multi-worker deployments: one writer per file, any process reads.
+
+Layout: an 8-byte header (used bytes), then entries of ``int32`` key length, a padded JSON key and a ``float64``.
+"""
+
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+
+INITIAL_FILE_SIZE = 64 * 1024
+HEADER_SIZE = 8
+
+
+def _padded_key(key: tuple) -> tuple[bytes, bytes]:
+    encoded = json.dumps(key, separators=(",", ":")).encode()
+    return encoded, encoded + b" " * (8 - (len(encoded) + 4) % 8)
+
+
+def _entries(data) -> list[tuple[tuple, float, int]]:
+    """``(key, value, value_offset)`` for every complete entry of a mapped or read file."""
+    used = struct.unpack_from("i", data, 0)[0] if len(data) >= HEADER_SIZE else 0
+    entries = []
+    position = HEADER_SIZE
+    while position < used:
+        key_length = struct.unpack_from("i", data, position)[0]
+        key_end = position + 4 + key_length
+        value_offset = key_end + (8 - (key_length + 4) % 8)
+        key = tuple(json.loads(bytes(data[position + 4 : key_end])))
+        entries.append((key, struct.unpack_from("d", data, value_offset)[0], value_offset))
+        position = value_offset + 8
+    return entries
+
+
+class MmapedDict:
+    """Append-only ``key -> float`` store backed by one metrics file.
+
+    Not thread-safe: each file must have exactly one writer. ``racing.metrics`` gives every
+    thread its own file, so writes need no lock; other processes only ever read them.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = open(path, "a+b")
+        capacity = os.fstat(self._file.fileno()).st_size
+        if capacity == 0:
+            capacity = INITIAL_FILE_SIZE
+            self._file.truncate(capacity)
+        self._capacity = capacity
+        self._map = mmap.mmap(self._file.fileno(), capacity)
+        self._positions = {key: offset for key, _, offset in _entries(self._map)}
+        self._used = struct.unpack_from("i", self._map, 0)[0] or HEADER_SIZE
+
+    def _offset(self, key: tuple) -> int:
+        offset = self._positions.get(key)
+        if offset is None:
+            encoded, padded = _padded_key(key)
+            size = 4 + len(padded) + 8
+            if self._used + size > self._capacity:
+                while self._used + size > self._capacity:
+                    self._capacity *= 2
+                self._map.close()
+                self._file.truncate(self._capacity)
+                self._map = mmap.mmap(self._file.fileno(), self._capacity)
+            struct.pack_into(f"i{len(padded)}sd", self._map, self._used, len(encoded), padded, 0.0)
+            offset = self._used + 4 + len(padded)
+            self._used += size
+            struct.pack_into("i", self._map, 0, self._used)
+            self._positions[key] = offset
+        return offset
+
+    def increment(self, key: tuple, amount: float) -> None:
+        offset = self._offset(key)
+        struct.pack_into("d", self._map, offset, struct.unpack_from("d", self._map, offset)[0] + amount)
+
+    def get(self, key: tuple) -> float | None:
+        offset = self._positions.get(key)
+        return None if offset is None else struct.unpack_from("d", self._map, offset)[0]
+
+    def set(self, key: tuple, value: float) -> None:
+        struct.pack_into("d", self._map, self._offset(key), value)
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+
+def read_metrics_file(path: Path) -> list[tuple[tuple, float]]:
+    """All ``(key, value)`` pairs of a metrics file written by any process."""
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:  # The worker was marked dead between listing and reading.
+        return []
+    return [(key, value) for key, value, _ in _entries(data)]
+
+
+def fold_metrics_files(sources: list[Path], target: Path, drop: tuple = ()) -> None:
+    """Add the series of ``sources`` (whose writers have exited) to ``target``, then unlink them.
+
+    ``process_start_time`` keeps the earliest value and keys in ``drop`` are discarded.
+    """
+    store = MmapedDict(target)
+    try:
+        for source in sources:
+            for key, value in read_metrics_file(source):
+                if key in drop:
+                    continue
+                if key == ("process_start_time",):
+                    current = store.get(key)
+                    store.set(key, value if current is None else min(current, value))
+                else:
+                    store.increment(key, value)
+    finally:
+        store.close()
+    for source in sources:
+        source.unlink(missing_ok=True)
@@ -1,17 +1,101 @@
+import cProfile
+import gzip
 import logging
+import random
+import re
 import time
 import uuid
+from contextlib import ExitStack, contextmanager
 
 from django.conf import settings
+from django.db import connections
+from django.utils.cache import patch_vary_headers
 
-from .metrics import decrement_inflight_requests, increment_inflight_requests, observe_request
+try:
+    import brotli
+except ImportError:  # Optional: install ``brotli`` to serve ``br`` encoded responses.
+    brotli = None
+
+from .metrics import decrement_inflight_requests, increment_inflight_requests, observe_request, route_label
+from .profiling import profile_store
 from .request_context import reset_request_id, set_request_id
+from .sql_stats import statement_stats
 
 request_logger = logging.getLogger("racing.request")
 
+ACCEPT_ENCODING_ITEM_RE = re.compile(r"^\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([0-9.]+))?\s*$")
+
+
+def supported_encodings() -> tuple[str, ...]:
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def preferred_encoding(accept_encoding: str, supported: tuple[str, ...]) -> str | None:
+    """Pick the supported coding with the highest ``q`` value; earlier ``supported`` entries win ties."""
+    weights = {}
+    for item in accept_encoding.split(","):
+        match = ACCEPT_ENCODING_ITEM_RE.match(item)
+        if not match:
+            continue
+        try:
+            weights[match.group(1).lower()] = float(match.group(2) or 1)
+        except ValueError:
+            continue
+
+    best, best_weight = None, 0.0
+    for encoding in supported:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def compress(content: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(content, quality=settings.API_COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(content, compresslevel=settings.API_COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+class QueryCollector:
+    """``execute_wrapper`` that counts a request's SQL queries and their total time.
+
+    With ``SQL_STATS_ENABLED`` every statement is also added to the per-fingerprint statistics.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration_ms = 0.0
+        self.record_statements = settings.SQL_STATS_ENABLED
+
+    def __call__(self, execute, sql, params, many, context):
+        started_at = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed_ms = (time.perf_counter() - started_at) * 1000
+            self.count += 1
+            self.duration_ms += elapsed_ms
+            if self.record_statements:
+                statement_stats.record(sql, elapsed_ms, getattr(context["cursor"], "rowcount", -1))
+
+    @contextmanager
+    def collecting(self):
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(self))
+            yield self
+
+
+def server_timing(duration_ms: int, queries: QueryCollector) -> str:
+    return f'db;dur={queries.duration_ms:.2f};desc="{queries.count} queries", total;dur={duration_ms}'
+
 
 class RequestIdMiddleware:
-    """Attach request IDs to logs and responses for easier tracing."""
+    """Attach request IDs to logs and responses for easier tracing.
+
+    Also counts each request's SQL queries and database time for the log line, the metrics and
+    an optional ``Server-Timing`` header (``API_SERVER_TIMING_ENABLED``).
+    """
 
     def __init__(self, get_response):
         self.get_response = get_response
@@ -23,29 +107,39 @@ class RequestIdMiddleware:
         token = set_request_id(request_id)
         started_at = time.perf_counter()
         increment_inflight_requests()
+        queries = QueryCollector()
 
         try:
-            response = self.get_response(request)
+            with queries.collecting():
+                response = self.get_response(request)
         except Exception:
             duration_ms = int((time.perf_counter() - started_at) * 1000)
-            observe_request(request.method, request.path, 500, duration_ms)
+            route = route_label(request.resolver_match)
+            observe_request(request.method, route, 500, duration_ms, queries.duration_ms)
             request_logger.exception(
-                "request_failed method=%s path=%s duration_ms=%s",
+                "request_failed method=%s path=%s duration_ms=%s db_queries=%s db_ms=%.2f",
                 request.method,
                 request.get_full_path(),
                 duration_ms,
+                queries.count,
+                queries.duration_ms,
             )
             raise
         else:
             duration_ms = int((time.perf_counter() - started_at) * 1000)
             response["X-Request-ID"] = request_id
-            observe_request(request.method, request.path, response.status_code, duration_ms)
+            if settings.API_SERVER_TIMING_ENABLED:
+                response["Server-Timing"] = server_timing(duration_ms, queries)
+            route = route_label(request.resolver_match)
+            observe_request(request.method, route, response.status_code, duration_ms, queries.duration_ms)
             request_logger.info(
-                "request_completed method=%s path=%s status=%s duration_ms=%s",
+                "request_completed method=%s path=%s status=%s duration_ms=%s db_queries=%s db_ms=%.2f",
                 request.method,
                 request.get_full_path(),
                 response.status_code,
                 duration_ms,
+                queries.count,
+                queries.duration_ms,
             )
             return response
         finally:
@@ -53,6 +147,37 @@ class RequestIdMiddleware:
             reset_request_id(token)
 
 
+class RequestProfilerMiddleware:
+    """Run a ``PROFILER_SAMPLE_RATE`` share of requests under ``cProfile`` and keep the slowest.
+
+    Runs inside ``RequestIdMiddleware`` (see ``MIDDLEWARE``) so stored profiles carry the request ID.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if random.random() >= settings.PROFILER_SAMPLE_RATE:
+            return self.get_response(request)
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:  # Another profiler is already active; skip rather than fail the request.
+            return self.get_response(request)
+
+        started_at = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            profiler.disable()
+
+        duration_ms = int((time.perf_counter() - started_at) * 1000)
+        if profile_store.admits(duration_ms):
+            profile_store.add(request, response.status_code, duration_ms, profiler)
+        return response
+
+
 class ContentSecurityPolicyMiddleware:
     """Attach a baseline CSP header when not set by upstream proxy."""
 
@@ -64,3 +189,42 @@ class ContentSecurityPolicyMiddleware:
         if "Content-Security-Policy" not in response and settings.CONTENT_SECURITY_POLICY:
             response["Content-Security-Policy"] = settings.CONTENT_SECURITY_POLICY
         return response
+
+
+class ApiCompressionMiddleware:
+    """Compress ``/api/`` responses above a size threshold with brotli (when installed) or gzip.
+
+    Runs inside ``RequestIdMiddleware`` (see ``MIDDLEWARE``) so request timings and metrics
+    include the compression cost.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not settings.API_COMPRESSION_ENABLED or not request.path.startswith("/api/"):
+            return response
+        if response.streaming or response.has_header("Content-Encoding"):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if len(response.content) < settings.API_COMPRESSION_MIN_BYTES:
+            return response
+
+        encoding = preferred_encoding(request.headers.get("Accept-Encoding", ""), supported_encodings())
+        if encoding is None:
+            return response
+
+        compressed = compress(response.content, encoding)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response["Content-Length"] = str(len(compressed))
+        response["Content-Encoding"] = encoding
+        # The encoded bytes differ from the identity representation, so strong validators become weak.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = f"W/{etag}"
+        return response
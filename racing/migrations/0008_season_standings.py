@@ -0,0 +1,85 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def backfill_season_standings(apps, schema_editor):
+    RaceResult = apps.get_model("racing", "RaceResult")
+    Season = apps.get_model("racing", "Season")
+    DriverSeasonStanding = apps.get_model("racing", "DriverSeasonStanding")
+    ConstructorSeasonStanding = apps.get_model("racing", "ConstructorSeasonStanding")
+
+    for season_id in Season.objects.values_list("id", flat=True):
+        for model, subject_field, result_lookup, name_lookup in (
+            (DriverSeasonStanding, "driver_id", "driver_id", "driver__name"),
+            (ConstructorSeasonStanding, "team_id", "driver__team_id", "driver__team__name"),
+        ):
+            rows = (
+                RaceResult.objects.filter(race__season_id=season_id)
+                .order_by()
+                .values(result_lookup, name_lookup)
+                .annotate(
+                    points=Sum("points_earned"),
+                    wins=Count("id", filter=Q(position=1)),
+                    podiums=Count("id", filter=Q(position__lte=3)),
+                )
+                .order_by("-points", "-wins", name_lookup, result_lookup)
+            )
+            model.objects.bulk_create(
+                model(
+                    season_id=season_id,
+                    position=position,
+                    points=row["points"] or 0,
+                    wins=row["wins"],
+                    podiums=row["podiums"],
+                    **{subject_field: row[result_lookup]},
+                )
+                for position, row in enumerate(rows, start=1)
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('racing', '0007_unique_fastest_lap_per_race'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConstructorSeasonStanding',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField(default=0)),
+                ('points', models.PositiveIntegerField(default=0)),
+                ('wins', models.PositiveIntegerField(default=0)),
+                ('podiums', models.PositiveIntegerField(default=0)),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='constructor_standings', to='racing.season')),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='season_standings', to='racing.team')),
+            ],
+            options={
+                'ordering': ['season__year', 'position'],
+                'indexes': [models.Index(fields=['season', 'position'], name='team_standing_position_idx')],
+                'constraints': [models.UniqueConstraint(fields=('season', 'team'), name='unique_constructor_standing_per_season')],
+            },
+        ),
+        migrations.CreateModel(
+            name='DriverSeasonStanding',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField(default=0)),
+                ('points', models.PositiveIntegerField(default=0)),
+                ('wins', models.PositiveIntegerField(default=0)),
+                ('podiums', models.PositiveIntegerField(default=0)),
+                ('driver', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='season_standings', to='racing.driver')),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='driver_standings', to='racing.season')),
+            ],
+            options={
+                'ordering': ['season__year', 'position'],
+                'indexes': [models.Index(fields=['season', 'position'], name='driver_standing_position_idx')],
+                'constraints': [models.UniqueConstraint(fields=('season', 'driver'), name='unique_driver_standing_per_season')],
+            },
+        ),
+        migrations.RunPython(backfill_season_standings, migrations.RunPython.noop),
+    ]
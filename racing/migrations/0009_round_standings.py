@@ -0,0 +1,124 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:41
+
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# Frozen copy of the ranking this migration shipped with (points, wins, name); 0012 re-ranks by
+# countback. Migrations must not import live app code, which keeps changing after them.
+def cumulative_round_standings(race_ids, results, subject_key, name_key):
+    results_by_race = defaultdict(list)
+    for result in results:
+        results_by_race[result["race_id"]].append(result)
+
+    totals = {}
+    tables = {}
+    for race_id in race_ids:
+        for result in results_by_race[race_id]:
+            subject_id = result[subject_key]
+            row = totals.get(subject_id)
+            if row is None:
+                row = totals[subject_id] = {
+                    "subject_id": subject_id,
+                    "name": result[name_key],
+                    "points": 0,
+                    "wins": 0,
+                    "podiums": 0,
+                }
+            row["points"] += result["points_earned"]
+            row["wins"] += result["position"] == 1
+            row["podiums"] += result["position"] <= 3
+        rows = sorted(
+            (dict(row) for row in totals.values()),
+            key=lambda row: (-row["points"], -row["wins"], row["name"], row["subject_id"]),
+        )
+        for position, row in enumerate(rows, start=1):
+            row["position"] = position
+        tables[race_id] = rows
+    return tables
+
+
+def backfill_round_standings(apps, schema_editor):
+    Race = apps.get_model("racing", "Race")
+    RaceResult = apps.get_model("racing", "RaceResult")
+    Season = apps.get_model("racing", "Season")
+    DriverRoundStanding = apps.get_model("racing", "DriverRoundStanding")
+    ConstructorRoundStanding = apps.get_model("racing", "ConstructorRoundStanding")
+
+    for season_id in Season.objects.values_list("id", flat=True):
+        race_ids = list(Race.objects.filter(season_id=season_id).order_by("round_number").values_list("id", flat=True))
+        for model, subject_field, result_lookup, name_lookup in (
+            (DriverRoundStanding, "driver_id", "driver_id", "driver__name"),
+            (ConstructorRoundStanding, "team_id", "driver__team_id", "driver__team__name"),
+        ):
+            results = (
+                RaceResult.objects.filter(race__season_id=season_id)
+                .order_by()
+                .values("race_id", "position", "points_earned", result_lookup, name_lookup)
+            )
+            tables = cumulative_round_standings(race_ids, results, result_lookup, name_lookup)
+            model.objects.bulk_create(
+                (
+                    model(
+                        season_id=season_id,
+                        race_id=race_id,
+                        position=row["position"],
+                        points=row["points"],
+                        wins=row["wins"],
+                        podiums=row["podiums"],
+                        **{subject_field: row["subject_id"]},
+                    )
+                    for race_id, rows in tables.items()
+                    for row in rows
+                ),
+                batch_size=500,
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('racing', '0008_season_standings'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConstructorRoundStanding',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField(default=0)),
+                ('points', models.PositiveIntegerField(default=0)),
+                ('wins', models.PositiveIntegerField(default=0)),
+                ('podiums', models.PositiveIntegerField(default=0)),
+                ('race', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='constructor_standings', to='racing.race')),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='constructor_round_standings', to='racing.season')),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='round_standings', to='racing.team')),
+            ],
+            options={
+                'ordering': ['race__season__year', 'race__round_number', 'position'],
+                'indexes': [models.Index(fields=['race', 'position'], name='team_round_position_idx')],
+                'constraints': [models.UniqueConstraint(fields=('race', 'team'), name='unique_constructor_standing_per_round')],
+            },
+        ),
+        migrations.CreateModel(
+            name='DriverRoundStanding',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField(default=0)),
+                ('points', models.PositiveIntegerField(default=0)),
+                ('wins', models.PositiveIntegerField(default=0)),
+                ('podiums', models.PositiveIntegerField(default=0)),
+                ('driver', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='round_standings', to='racing.driver')),
+                ('race', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='driver_standings', to='racing.race')),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='driver_round_standings', to='racing.season')),
+            ],
+            options={
+                'ordering': ['race__season__year', 'race__round_number', 'position'],
+                'indexes': [models.Index(fields=['race', 'position'], name='driver_round_position_idx')],
+                'constraints': [models.UniqueConstraint(fields=('race', 'driver'), name='unique_driver_standing_per_round')],
+            },
+        ),
+        migrations.RunPython(backfill_round_standings, migrations.RunPython.noop),
+    ]
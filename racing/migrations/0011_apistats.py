@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:40
+
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def backfill_api_stats(apps, schema_editor):
+    ApiStats = apps.get_model("racing", "ApiStats")
+    Driver = apps.get_model("racing", "Driver")
+    ApiStats.objects.update_or_create(
+        pk=1,
+        defaults={
+            "total_teams": apps.get_model("racing", "Team").objects.count(),
+            "total_drivers": Driver.objects.count(),
+            "total_seasons": apps.get_model("racing", "Season").objects.count(),
+            "total_races": apps.get_model("racing", "Race").objects.count(),
+            "total_results": apps.get_model("racing", "RaceResult").objects.count(),
+            "top_points": Driver.objects.aggregate(top=Max("points"))["top"] or 0,
+        },
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('racing', '0010_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApiStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_teams', models.PositiveBigIntegerField(default=0)),
+                ('total_drivers', models.PositiveBigIntegerField(default=0)),
+                ('total_seasons', models.PositiveBigIntegerField(default=0)),
+                ('total_races', models.PositiveBigIntegerField(default=0)),
+                ('total_results', models.PositiveBigIntegerField(default=0)),
+                ('top_points', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'API stats',
+                'verbose_name_plural': 'API stats',
+            },
+        ),
+        migrations.RunPython(backfill_api_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,125 @@
+from collections import defaultdict
+
+from django.db import migrations
+
+
+# Frozen copies of the countback ranking in ``racing.ranking`` as of this migration; migrations
+# must not import live app code, which keeps changing after them.
+def assign_positions(rows):
+    """Order by points, then most P1s, P2s, ... down the histogram, then name and id."""
+    depth = max((max(row["histogram"], default=0) for row in rows), default=0)
+    rows.sort(
+        key=lambda row: (
+            -row["points"],
+            *(-row["histogram"].get(position, 0) for position in range(1, depth + 1)),
+            row["name"],
+            row["subject_id"],
+        )
+    )
+    for position, row in enumerate(rows, start=1):
+        row["position"] = position
+    return rows
+
+
+def cumulative_round_standings(race_ids, results, subject_key, name_key):
+    """Countback-ranked cumulative tables after every race of ``race_ids`` (in round order)."""
+    results_by_race = defaultdict(list)
+    for result in results:
+        results_by_race[result["race_id"]].append(result)
+
+    totals = {}
+    tables = {}
+    for race_id in race_ids:
+        for result in results_by_race[race_id]:
+            row = totals.setdefault(
+                result[subject_key],
+                {"subject_id": result[subject_key], "name": result[name_key], "points": 0, "histogram": {}},
+            )
+            row["points"] += result["points_earned"]
+            row["histogram"][result["position"]] = row["histogram"].get(result["position"], 0) + 1
+        tables[race_id] = assign_positions([{**row, "histogram": dict(row["histogram"])} for row in totals.values()])
+    return tables
+
+
+def rerank_standings(apps, schema_editor):
+    """Renumber rows backfilled before countback ranking (0008/0009 ordered by points, wins, name)."""
+    Race = apps.get_model("racing", "Race")
+    RaceResult = apps.get_model("racing", "RaceResult")
+    Season = apps.get_model("racing", "Season")
+
+    for season_id in Season.objects.values_list("id", flat=True):
+        race_ids = list(Race.objects.filter(season_id=season_id).order_by("round_number").values_list("id", flat=True))
+        for season_model, round_model, subject_field, result_lookup, result_name_lookup, name_lookup in (
+            ("DriverSeasonStanding", "DriverRoundStanding", "driver_id", "driver_id", "driver__name", "driver__name"),
+            (
+                "ConstructorSeasonStanding",
+                "ConstructorRoundStanding",
+                "team_id",
+                "driver__team_id",
+                "driver__team__name",
+                "team__name",
+            ),
+        ):
+            SeasonStanding = apps.get_model("racing", season_model)
+            RoundStanding = apps.get_model("racing", round_model)
+            results = list(
+                RaceResult.objects.filter(race__season_id=season_id)
+                .order_by()
+                .values("race_id", "position", "points_earned", result_lookup, result_name_lookup)
+            )
+
+            histograms = defaultdict(lambda: defaultdict(int))
+            for result in results:
+                histograms[result[result_lookup]][result["position"]] += 1
+            season_rows = assign_positions(
+                [
+                    {
+                        "pk": row["pk"],
+                        "current_position": row["position"],
+                        "subject_id": row[subject_field],
+                        "name": row[name_lookup],
+                        "points": row["points"],
+                        "histogram": histograms[row[subject_field]],
+                    }
+                    for row in SeasonStanding.objects.filter(season_id=season_id).values(
+                        "pk", "position", "points", subject_field, name_lookup
+                    )
+                ]
+            )
+            SeasonStanding.objects.bulk_update(
+                [
+                    SeasonStanding(pk=row["pk"], position=row["position"])
+                    for row in season_rows
+                    if row["position"] != row["current_position"]
+                ],
+                ["position"],
+                batch_size=500,
+            )
+
+            tables = cumulative_round_standings(race_ids, results, result_lookup, result_name_lookup)
+            positions = {
+                (race_id, row["subject_id"]): row["position"] for race_id, rows in tables.items() for row in rows
+            }
+            RoundStanding.objects.bulk_update(
+                [
+                    RoundStanding(pk=row["pk"], position=positions[key])
+                    for row in RoundStanding.objects.filter(season_id=season_id).values(
+                        "pk", "race_id", "position", subject_field
+                    )
+                    if (key := (row["race_id"], row[subject_field])) in positions
+                    and positions[key] != row["position"]
+                ],
+                ["position"],
+                batch_size=500,
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('racing', '0011_apistats'),
+    ]
+
+    operations = [
+        migrations.RunPython(rerank_standings, migrations.RunPython.noop),
+    ]
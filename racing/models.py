@@ -1,12 +1,32 @@
+from collections import Counter, defaultdict
 from collections.abc import Iterable
 
-from django.db import models
-from django.db.models import Q, Sum
+from django.db import models, transaction
+from django.db.models import Count, F, IntegerField, Max, Min, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .caching import (
+    bump_season_directory_generation,
+    bump_season_generations,
+    bump_stats_generation,
+    bump_tags,
+    model_tags,
+)
+from .ranking import assign_positions, cumulative_round_standings
+
+RACE_RESULT_STAGING_OFFSET = 1_000_000
+
+
+def result_response_tags(results: Iterable[tuple[int, int]]) -> list[str]:
+    """Response tags of the given ``(result_id, season_id)`` pairs."""
+    return [tag for result_id, season_id in results for tag in model_tags("result", result_id, season_id)]
 
 
 class Team(models.Model):
     name = models.CharField(max_length=100, unique=True)
     country = models.CharField(max_length=100)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["name"]
@@ -14,11 +34,31 @@ class Team(models.Model):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        previous_state = None
+        if self.pk:
+            previous_state = type(self).objects.filter(pk=self.pk).values_list("name", "country").first()
+
+        super().save(*args, **kwargs)
+
+        if previous_state is not None:
+            results = list(RaceResult.objects.filter(driver__team=self).values_list("pk", "race__season_id"))
+            season_ids = {season_id for _, season_id in results}
+            if previous_state[0] != self.name:
+                # Team names break ties, so a rename can reorder constructor tables.
+                for season_id in season_ids:
+                    Season.rebuild_standings(season_id)
+            if previous_state != (self.name, self.country):
+                # Result payloads embed the driver's team.
+                bump_tags(result_response_tags(results))
+            bump_season_generations(season_ids)
+
 
 class Driver(models.Model):
     name = models.CharField(max_length=100)
     team = models.ForeignKey(Team, on_delete=models.PROTECT, related_name="drivers")
     points = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-points", "name"]
@@ -30,6 +70,10 @@ class Driver(models.Model):
         return f"{self.name} ({self.team})"
 
     def save(self, *args, **kwargs):
+        previous_state = None
+        if self.pk:
+            previous_state = type(self).objects.filter(pk=self.pk).values_list("team_id", "name").first()
+
         super().save(*args, **kwargs)
 
         if self.pk:
@@ -37,28 +81,76 @@ class Driver(models.Model):
             if self.points != refreshed_points:
                 self.points = refreshed_points
 
+        if previous_state:
+            results = list(self.race_results.values_list("pk", "race__season_id"))
+            season_ids = {season_id for _, season_id in results}
+            if previous_state != (self.team_id, self.name):
+                # Team changes move constructor points and names break ties in every table.
+                for season_id in season_ids:
+                    Season.rebuild_standings(season_id)
+                # Result payloads embed the driver's name and team.
+                bump_tags(result_response_tags(results))
+            bump_season_generations(season_ids)
+
+    def delete(self, *args, **kwargs):
+        season_ids = list(self.race_results.values_list("race__season_id", flat=True).distinct())
+        deleted = super().delete(*args, **kwargs)
+        for season_id in season_ids:
+            Season.rebuild_standings(season_id)
+        bump_season_generations(season_ids)
+        return deleted
+
+    @classmethod
+    def sync_points_for_ids(cls, driver_ids: Iterable[int]) -> int:
+        """Recompute stored points for the given drivers with one set-based UPDATE."""
+        normalized_ids = sorted({int(driver_id) for driver_id in driver_ids if driver_id})
+        if not normalized_ids:
+            return 0
+
+        points_total = (
+            RaceResult.objects.filter(driver_id=OuterRef("pk"))
+            .order_by()
+            .values("driver_id")
+            .annotate(total_points=Sum("points_earned"))
+            .values("total_points")
+        )
+        updated = cls.objects.filter(id__in=normalized_ids).update(
+            points=Coalesce(Subquery(points_total, output_field=IntegerField()), Value(0)),
+            updated_at=timezone.now(),
+        )
+        # Queryset updates skip model signals, so responses embedding these drivers' points are
+        # dropped here: the drivers, their team details and their results. Driver lists and their
+        # order follow result writes through their ``result`` dependency.
+        embedding = list(
+            cls.objects.filter(id__in=normalized_ids).values_list(
+                "team_id", "race_results__id", "race_results__race__season_id"
+            )
+        )
+        bump_tags(
+            [
+                *(f"driver:{driver_id}" for driver_id in normalized_ids),
+                *{f"team:{team_id}" for team_id, _, _ in embedding},
+                *result_response_tags((result_id, season_id) for _, result_id, season_id in embedding if result_id),
+            ]
+        )
+        ApiStats.sync_top_points()
+        return updated
+
     @classmethod
     def recalculate_points_for_ids(cls, driver_ids: Iterable[int]) -> dict[int, int]:
         normalized_ids = sorted({int(driver_id) for driver_id in driver_ids if driver_id})
         if not normalized_ids:
             return {}
 
-        totals = {
-            row["id"]: row["total_points"] or 0
-            for row in cls.objects.filter(id__in=normalized_ids)
-            .annotate(total_points=Sum("race_results__points_earned"))
-            .values("id", "total_points")
-        }
-
-        for driver_id in normalized_ids:
-            cls.objects.filter(id=driver_id).update(points=totals.get(driver_id, 0))
-
+        cls.sync_points_for_ids(normalized_ids)
+        totals = dict(cls.objects.filter(id__in=normalized_ids).values_list("id", "points"))
         return {driver_id: totals.get(driver_id, 0) for driver_id in normalized_ids}
 
 
 class Season(models.Model):
     year = models.PositiveIntegerField(unique=True)
     name = models.CharField(max_length=120, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-year"]
@@ -66,6 +158,81 @@ class Season(models.Model):
     def __str__(self):
         return self.name or str(self.year)
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        bump_season_directory_generation()
+        bump_season_generations([self.pk])
+
+    def delete(self, *args, **kwargs):
+        season_id = self.pk
+        driver_ids = set(RaceResult.objects.filter(race__season=self).values_list("driver_id", flat=True))
+        deleted = super().delete(*args, **kwargs)
+        Driver.sync_points_for_ids(driver_ids)
+        bump_season_directory_generation()
+        bump_season_generations([season_id])
+        return deleted
+
+    @classmethod
+    def sync_standings(cls, season_id: int, driver_ids: Iterable[int], from_round: int | None = None) -> None:
+        """Refresh standings of the given drivers and their teams, plus round snapshots from ``from_round``."""
+        driver_ids = {driver_id for driver_id in driver_ids if driver_id}
+        if not season_id or not driver_ids:
+            return
+
+        team_ids = set(Driver.objects.filter(id__in=driver_ids).values_list("team_id", flat=True))
+        DriverSeasonStanding.refresh_for_ids(season_id, driver_ids)
+        ConstructorSeasonStanding.refresh_for_ids(season_id, team_ids)
+        DriverRoundStanding.rebuild_for_season(season_id, from_round)
+        ConstructorRoundStanding.rebuild_for_season(season_id, from_round)
+
+    @classmethod
+    def rebuild_standings(cls, season_id: int) -> None:
+        season_results = RaceResult.objects.filter(race__season_id=season_id)
+        DriverSeasonStanding.refresh_for_ids(
+            season_id,
+            set(season_results.values_list("driver_id", flat=True))
+            | set(DriverSeasonStanding.objects.filter(season_id=season_id).values_list("driver_id", flat=True)),
+        )
+        ConstructorSeasonStanding.refresh_for_ids(
+            season_id,
+            set(season_results.values_list("driver__team_id", flat=True))
+            | set(ConstructorSeasonStanding.objects.filter(season_id=season_id).values_list("team_id", flat=True)),
+        )
+        DriverRoundStanding.rebuild_for_season(season_id)
+        ConstructorRoundStanding.rebuild_for_season(season_id)
+
+    @classmethod
+    def apply_result_change(cls, previous: dict | None, current: dict | None) -> None:
+        """Move one result's contribution from its previous to its current state (``None`` for no row).
+
+        Both carry ``season_id``, ``round_number``, ``driver_id``, ``team_id``, ``position`` and
+        ``points_earned``, as returned by ``RaceResult.standings_entry``.
+        """
+        if previous == current:
+            return
+
+        entries_by_season = defaultdict(list)
+        for entry, sign in ((previous, -1), (current, 1)):
+            if entry is not None:
+                entries_by_season[entry["season_id"]].append((entry, sign))
+
+        for season_id, entries in entries_by_season.items():
+            from_round = min(entry["round_number"] for entry, _sign in entries)
+            round_numbers = dict(
+                Race.objects.filter(season_id=season_id, round_number__gte=from_round).values_list("id", "round_number")
+            )
+            for season_model, round_model, key in (
+                (DriverSeasonStanding, DriverRoundStanding, "driver_id"),
+                (ConstructorSeasonStanding, ConstructorRoundStanding, "team_id"),
+            ):
+                changes = [
+                    (entry[key], entry["round_number"], entry["position"], entry["points_earned"], sign)
+                    for entry, sign in entries
+                ]
+                # Season standings equal the snapshot after the last race, which every change reaches.
+                last_round_changes = round_model.apply_result_changes(season_id, round_numbers, changes)
+                season_model.apply_round_changes(season_id, last_round_changes)
+
 
 class Race(models.Model):
     season = models.ForeignKey(Season, on_delete=models.CASCADE, related_name="races")
@@ -73,6 +240,7 @@ class Race(models.Model):
     name = models.CharField(max_length=120)
     country = models.CharField(max_length=100)
     race_date = models.DateField()
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["season__year", "round_number"]
@@ -83,6 +251,98 @@ class Race(models.Model):
     def __str__(self):
         return f"{self.season.year} R{self.round_number} - {self.name}"
 
+    def save(self, *args, **kwargs):
+        previous_season_id = previous_round = None
+        if self.pk:
+            previous_season_id, previous_round = (
+                type(self).objects.filter(pk=self.pk).values_list("season_id", "round_number").first()
+                or (None, None)
+            )
+
+        super().save(*args, **kwargs)
+
+        if previous_season_id and previous_season_id != self.season_id:
+            Season.rebuild_standings(previous_season_id)
+            Season.rebuild_standings(self.season_id)
+        elif previous_round is None:
+            # A new race has no results yet, so its snapshots repeat the round before it.
+            DriverRoundStanding.copy_previous_round(self)
+            ConstructorRoundStanding.copy_previous_round(self)
+        elif previous_round != self.round_number:
+            # Renumbered rounds reorder the cumulative snapshots between the old and new place.
+            from_round = min(previous_round, self.round_number)
+            DriverRoundStanding.rebuild_for_season(self.season_id, from_round)
+            ConstructorRoundStanding.rebuild_for_season(self.season_id, from_round)
+        bump_season_generations([previous_season_id, self.season_id])
+
+    def delete(self, *args, **kwargs):
+        season_id = self.season_id
+        driver_ids = set(self.results.values_list("driver_id", flat=True))
+        deleted = super().delete(*args, **kwargs)
+        Driver.sync_points_for_ids(driver_ids)
+        Season.rebuild_standings(season_id)
+        bump_season_generations([season_id])
+        return deleted
+
+    @transaction.atomic
+    def replace_results(self, entries: Iterable[dict]) -> list["RaceResult"]:
+        """Replace the whole classification with bulk writes and sync derived data once.
+
+        ``entries`` must already be validated: unique drivers and positions, at most one
+        fastest lap. Rows of drivers that stay classified keep their primary keys.
+        """
+        type(self).objects.select_for_update().filter(pk=self.pk).first()
+
+        entries_by_driver = {entry["driver_id"]: entry for entry in entries}
+        existing = {result.driver_id: result for result in self.results.order_by()}
+        fields = ["position", "points_earned", "fastest_lap"]
+
+        removed_ids = [result.pk for driver_id, result in existing.items() if driver_id not in entries_by_driver]
+        if removed_ids:
+            RaceResult.objects.filter(pk__in=removed_ids).delete()
+
+        changed = [
+            result
+            for driver_id, result in existing.items()
+            if driver_id in entries_by_driver
+            and any(getattr(result, field) != entries_by_driver[driver_id][field] for field in fields)
+        ]
+
+        # Unique (race, position) and fastest-lap constraints are checked row by row, so changed
+        # rows are parked on free positions first to allow swaps inside one classification.
+        if changed:
+            for result in changed:
+                result.position += RACE_RESULT_STAGING_OFFSET
+                result.fastest_lap = False
+            RaceResult.objects.bulk_update(changed, ["position", "fastest_lap"])
+
+        created = RaceResult.objects.bulk_create(
+            RaceResult(race=self, **entry)
+            for driver_id, entry in entries_by_driver.items()
+            if driver_id not in existing
+        )
+        if created:
+            # bulk_create skips post_save, so the result counter is adjusted once here.
+            ApiStats.adjust(RaceResult, len(created))
+
+        if changed:
+            updated_at = timezone.now()
+            for result in changed:
+                for field in fields:
+                    setattr(result, field, entries_by_driver[result.driver_id][field])
+                result.updated_at = updated_at
+            RaceResult.objects.bulk_update(changed, [*fields, "updated_at"])
+
+        affected_driver_ids = set(existing) | set(entries_by_driver)
+        Driver.sync_points_for_ids(affected_driver_ids)
+        Season.sync_standings(self.season_id, affected_driver_ids, from_round=self.round_number)
+        bump_season_generations([self.season_id])
+
+        results = list(self.results.order_by("position"))
+        # Bulk writes skip model signals; removed rows were tagged by their delete signals.
+        bump_tags(tag for result in results for tag in model_tags("result", result.pk, self.season_id))
+        return results
+
 
 class RaceResult(models.Model):
     race = models.ForeignKey(Race, on_delete=models.CASCADE, related_name="results")
@@ -90,6 +350,7 @@ class RaceResult(models.Model):
     position = models.PositiveIntegerField()
     points_earned = models.PositiveIntegerField(default=0)
     fastest_lap = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["race__race_date", "position"]
@@ -107,21 +368,588 @@ class RaceResult(models.Model):
         return f"{self.race} - P{self.position}: {self.driver.name}"
 
     def save(self, *args, **kwargs):
-        previous_driver_id = None
+        previous = None
         if self.pk:
-            previous_driver_id = (
-                type(self).objects.filter(pk=self.pk).values_list("driver_id", flat=True).first()
+            previous = (
+                type(self)
+                .objects.filter(pk=self.pk)
+                .values(
+                    "driver_id",
+                    "position",
+                    "points_earned",
+                    team_id=F("driver__team_id"),
+                    season_id=F("race__season_id"),
+                    round_number=F("race__round_number"),
+                )
+                .first()
             )
 
         super().save(*args, **kwargs)
 
         affected_driver_ids = {self.driver_id}
-        if previous_driver_id and previous_driver_id != self.driver_id:
-            affected_driver_ids.add(previous_driver_id)
+        if previous:
+            affected_driver_ids.add(previous["driver_id"])
 
-        Driver.recalculate_points_for_ids(affected_driver_ids)
+        Driver.sync_points_for_ids(affected_driver_ids)
+        current = self.standings_entry()
+        Season.apply_result_change(previous, current)
+        bump_season_generations([previous and previous["season_id"], current["season_id"]])
 
     def delete(self, *args, **kwargs):
-        affected_driver_id = self.driver_id
-        super().delete(*args, **kwargs)
-        Driver.recalculate_points_for_ids([affected_driver_id])
+        previous = self.standings_entry()
+        deleted = super().delete(*args, **kwargs)
+        Driver.sync_points_for_ids([previous["driver_id"]])
+        Season.apply_result_change(previous, None)
+        bump_season_generations([previous["season_id"]])
+        return deleted
+
+    def standings_entry(self) -> dict:
+        """What this row adds to the standings of its season."""
+        return {
+            "season_id": self.race.season_id,
+            "round_number": self.race.round_number,
+            "driver_id": self.driver_id,
+            "team_id": self.driver.team_id,
+            "position": self.position,
+            "points_earned": self.points_earned,
+        }
+
+
+class StandingTotals(models.Model):
+    """Ranked totals shared by the standings read models."""
+
+    # Subject column on the standings row, its lookup from RaceResult and its display name lookup.
+    subject_id_field = ""
+    result_subject_lookup = ""
+    name_lookup = ""
+    TOTAL_FIELDS = ("points", "wins", "podiums")
+
+    position = models.PositiveIntegerField(default=0)
+    points = models.PositiveIntegerField(default=0)
+    wins = models.PositiveIntegerField(default=0)
+    podiums = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def shift_rows(cls, rows: models.QuerySet, delta: tuple) -> None:
+        """Move ``rows`` by one ``(position, points, wins, podiums)`` delta with a relative UPDATE."""
+        fields = ("position", *cls.TOTAL_FIELDS)
+        rows.update(**{field: F(field) + change for field, change in zip(fields, delta) if change})
+
+
+class SeasonStanding(StandingTotals):
+    """Per-season standings row maintained from race results (read model)."""
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def apply_round_changes(cls, season_id: int, changes: dict) -> None:
+        """Replay the row changes of the season's last round snapshot, which ranks the same totals."""
+        subject_field = cls.subject_id_field
+        if changes["stale"]:
+            cls.objects.filter(season_id=season_id, **{f"{subject_field}__in": changes["stale"]}).delete()
+        if changes["created"]:
+            cls.objects.bulk_create(
+                [
+                    cls(season_id=season_id, **{subject_field: subject_id}, position=position, **totals)
+                    for subject_id, (position, totals) in changes["created"].items()
+                ]
+            )
+        for delta, subject_ids in changes["shifts"].items():
+            cls.shift_rows(cls.objects.filter(season_id=season_id, **{f"{subject_field}__in": subject_ids}), delta)
+
+    @classmethod
+    def refresh_for_ids(cls, season_id: int, subject_ids: Iterable[int]) -> None:
+        """Re-aggregate rows of the given subjects for one season and re-rank the season."""
+        normalized_ids = sorted({int(subject_id) for subject_id in subject_ids if subject_id})
+        if not normalized_ids:
+            return
+
+        subject_id_field = cls.subject_id_field
+        totals = {
+            row[cls.result_subject_lookup]: row
+            for row in RaceResult.objects.filter(
+                race__season_id=season_id,
+                **{f"{cls.result_subject_lookup}__in": normalized_ids},
+            )
+            .order_by()
+            .values(cls.result_subject_lookup)
+            .annotate(
+                points=Sum("points_earned"),
+                wins=Count("id", filter=Q(position=1)),
+                podiums=Count("id", filter=Q(position__lte=3)),
+            )
+        }
+        existing = {
+            getattr(standing, subject_id_field): standing
+            for standing in cls.objects.filter(
+                season_id=season_id,
+                **{f"{subject_id_field}__in": normalized_ids},
+            )
+        }
+
+        to_create = []
+        to_update = []
+        stale_ids = []
+        for subject_id in normalized_ids:
+            row = totals.get(subject_id)
+            standing = existing.get(subject_id)
+            if row is None:
+                if standing is not None:
+                    stale_ids.append(standing.pk)
+                continue
+
+            values = {"points": row["points"] or 0, "wins": row["wins"], "podiums": row["podiums"]}
+            if standing is None:
+                to_create.append(cls(season_id=season_id, **{subject_id_field: subject_id}, **values))
+            elif any(getattr(standing, field) != value for field, value in values.items()):
+                for field, value in values.items():
+                    setattr(standing, field, value)
+                to_update.append(standing)
+
+        if stale_ids:
+            cls.objects.filter(pk__in=stale_ids).delete()
+        if to_create:
+            cls.objects.bulk_create(to_create)
+        if to_update:
+            cls.objects.bulk_update(to_update, ["points", "wins", "podiums"])
+        cls.rerank(season_id)
+
+    @classmethod
+    def rerank(cls, season_id: int) -> None:
+        """Number the season's rows by points and full countback of finishing positions."""
+        histograms = defaultdict(dict)
+        for row in (
+            RaceResult.objects.filter(race__season_id=season_id)
+            .order_by()
+            .values(cls.result_subject_lookup, "position")
+            .annotate(finishes=Count("id"))
+        ):
+            histograms[row[cls.result_subject_lookup]][row["position"]] = row["finishes"]
+
+        rows = assign_positions(
+            [
+                {
+                    "pk": row["pk"],
+                    "current_position": row["position"],
+                    "subject_id": row[cls.subject_id_field],
+                    "name": row[cls.name_lookup],
+                    "points": row["points"],
+                    "histogram": histograms[row[cls.subject_id_field]],
+                }
+                for row in cls.objects.filter(season_id=season_id).values(
+                    "pk", "position", "points", cls.subject_id_field, cls.name_lookup
+                )
+            ]
+        )
+        changed = [
+            cls(pk=row["pk"], position=row["position"])
+            for row in rows
+            if row["position"] != row["current_position"]
+        ]
+        if changed:
+            cls.objects.bulk_update(changed, ["position"])
+
+
+class DriverSeasonStanding(SeasonStanding):
+    subject_id_field = "driver_id"
+    result_subject_lookup = "driver_id"
+    name_lookup = "driver__name"
+
+    season = models.ForeignKey(Season, on_delete=models.CASCADE, related_name="driver_standings")
+    driver = models.ForeignKey(Driver, on_delete=models.CASCADE, related_name="season_standings")
+
+    class Meta:
+        ordering = ["season__year", "position"]
+        constraints = [
+            models.UniqueConstraint(fields=["season", "driver"], name="unique_driver_standing_per_season"),
+        ]
+        indexes = [
+            models.Index(fields=["season", "position"], name="driver_standing_position_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.season} P{self.position}: {self.driver.name}"
+
+
+class ConstructorSeasonStanding(SeasonStanding):
+    subject_id_field = "team_id"
+    result_subject_lookup = "driver__team_id"
+    name_lookup = "team__name"
+
+    season = models.ForeignKey(Season, on_delete=models.CASCADE, related_name="constructor_standings")
+    team = models.ForeignKey(Team, on_delete=models.CASCADE, related_name="season_standings")
+
+    class Meta:
+        ordering = ["season__year", "position"]
+        constraints = [
+            models.UniqueConstraint(fields=["season", "team"], name="unique_constructor_standing_per_season"),
+        ]
+        indexes = [
+            models.Index(fields=["season", "position"], name="team_standing_position_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.season} P{self.position}: {self.team.name}"
+
+
+class RoundStanding(StandingTotals):
+    """Cumulative standings snapshot after one race (one row per subject per round)."""
+
+    # Lookup from RaceResult to the subject name used as the ranking tie-break.
+    result_name_lookup = ""
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def first_classified_rounds(cls, season_id: int, changes: list[tuple]) -> dict[int, int | None]:
+        """First classified round (or ``None``) of subjects that lost a result without gaining an earlier one."""
+        subject_ids = {
+            subject_id
+            for subject_id, round_number, _position, _points, sign in changes
+            if sign < 0
+            and not any(
+                change[0] == subject_id and change[4] > 0 and change[1] <= round_number for change in changes
+            )
+        }
+        if not subject_ids:
+            return {}
+
+        first_rounds = dict.fromkeys(subject_ids)
+        first_rounds.update(
+            RaceResult.objects.filter(
+                race__season_id=season_id, **{f"{cls.result_subject_lookup}__in": subject_ids}
+            )
+            .order_by()
+            .values_list(cls.result_subject_lookup)
+            .annotate(first_round=Min("race__round_number"))
+        )
+        return first_rounds
+
+    @classmethod
+    def countback_inputs(cls, season_id: int, subject_ids: set[int]) -> tuple[dict, dict]:
+        """Names and ``(round_number, position)`` finishes of the given subjects in one season."""
+        names = {}
+        finishes = defaultdict(list)
+        if not subject_ids:
+            return names, finishes
+        for row in (
+            RaceResult.objects.filter(race__season_id=season_id, **{f"{cls.result_subject_lookup}__in": subject_ids})
+            .order_by()
+            .values(cls.result_subject_lookup, cls.result_name_lookup, "race__round_number", "position")
+        ):
+            subject_id = row[cls.result_subject_lookup]
+            names[subject_id] = row[cls.result_name_lookup]
+            finishes[subject_id].append((row["race__round_number"], row["position"]))
+        return names, finishes
+
+    @classmethod
+    def apply_result_changes(cls, season_id: int, round_numbers: dict[int, int], changes: list[tuple]) -> dict:
+        """Add result deltas to snapshots of ``round_numbers`` races and renumber only the moved points band.
+
+        ``changes`` holds ``(subject_id, round_number, position, points, sign)`` tuples. Returns the row
+        changes of the last of those races, for ``SeasonStanding.apply_round_changes``.
+        """
+        subject_field = cls.subject_id_field
+        subject_ids = {change[0] for change in changes}
+        first_rounds = cls.first_classified_rounds(season_id, changes)
+        existing = {
+            (row["race_id"], row[subject_field]): row
+            for row in cls.objects.filter(race_id__in=list(round_numbers), **{f"{subject_field}__in": subject_ids})
+            .values("pk", "race_id", subject_field, "position", *cls.TOTAL_FIELDS)
+        }
+
+        written = {}  # (race, subject) -> new totals, or None when the row goes.
+        bands = {}  # race -> [lowest, highest] points of the rows that may change places.
+        for race_id, cutoff in round_numbers.items():
+            for subject_id in subject_ids:
+                counted = [change for change in changes if change[0] == subject_id and change[1] <= cutoff]
+                histogram_delta = defaultdict(int)
+                for _subject_id, _round_number, position, _points, sign in counted:
+                    histogram_delta[position] += sign
+                if not any(histogram_delta.values()) and not sum(change[3] * change[4] for change in counted):
+                    continue
+
+                previous = existing.get((race_id, subject_id))
+                totals = {field: previous[field] if previous else 0 for field in cls.TOTAL_FIELDS}
+                for _subject_id, _round_number, position, points, sign in counted:
+                    totals["points"] += sign * points
+                    totals["wins"] += sign * (position == 1)
+                    totals["podiums"] += sign * (position <= 3)
+                if subject_id in first_rounds:
+                    classified = first_rounds[subject_id] is not None and first_rounds[subject_id] <= cutoff
+                else:
+                    classified = previous is not None or any(change[4] > 0 for change in counted)
+
+                if not classified and previous is None:
+                    continue
+                written[race_id, subject_id] = totals if classified else None
+                touched = [totals["points"] if classified else 0, previous["points"] if previous else 0]
+                band = bands.setdefault(race_id, [min(touched), max(touched)])
+                band[0], band[1] = min(band[0], *touched), max(band[1], *touched)
+
+        last_race_id = max(round_numbers, key=round_numbers.get)
+        last_round_changes = {"stale": [], "created": {}, "shifts": defaultdict(list)}
+        if not written:
+            return last_round_changes
+
+        # One range covering every band keeps the query simple; rows outside their own band are skipped.
+        tables = defaultdict(dict)
+        for row in cls.objects.filter(
+            race_id__in=list(bands),
+            points__gte=min(low for low, _high in bands.values()),
+            points__lte=max(high for _low, high in bands.values()),
+        ).values("pk", "race_id", subject_field, "position", *cls.TOTAL_FIELDS):
+            low, high = bands[row["race_id"]]
+            if low <= row["points"] <= high:
+                row["totals"] = {field: row[field] for field in cls.TOTAL_FIELDS}
+                tables[row["race_id"]][row[subject_field]] = row
+
+        # Rows above the band keep their places, so the band starts right after them.
+        offsets = {race_id: min(row["position"] for row in rows.values()) - 1 for race_id, rows in tables.items()}
+        unplaced = {race_id: 0 for race_id in bands if race_id not in offsets}
+        if unplaced:
+            offsets.update(unplaced)
+            offsets.update(
+                cls.objects.filter(race_id__in=list(unplaced))
+                .order_by()
+                .values_list("race_id")
+                .annotate(rows=Count("pk"))
+            )
+
+        for (race_id, subject_id), totals in written.items():
+            rows = tables[race_id]
+            if totals is None:
+                rows.pop(subject_id, None)
+                if race_id == last_race_id:
+                    last_round_changes["stale"].append(subject_id)
+            elif subject_id in rows:
+                rows[subject_id]["totals"] = totals
+            else:
+                rows[subject_id] = {"pk": None, "totals": totals}
+
+        # Only rows level on points need the countback histograms and names.
+        tied_ids = set()
+        for rows in tables.values():
+            points_seen = defaultdict(list)
+            for subject_id, row in rows.items():
+                points_seen[row["totals"]["points"]].append(subject_id)
+            tied_ids.update(subject_id for ids in points_seen.values() if len(ids) > 1 for subject_id in ids)
+        names, finishes = cls.countback_inputs(season_id, tied_ids)
+
+        to_create = []
+        shifts = defaultdict(list)  # (position, points, wins, podiums) deltas -> row ids
+        for race_id, rows in tables.items():
+            cutoff = round_numbers[race_id]
+            ranked = assign_positions(
+                [
+                    {
+                        "row": row,
+                        "subject_id": subject_id,
+                        "name": names.get(subject_id, ""),
+                        "points": row["totals"]["points"],
+                        "histogram": Counter(
+                            position for round_number, position in finishes[subject_id] if round_number <= cutoff
+                        ),
+                    }
+                    for subject_id, row in rows.items()
+                ]
+            )
+            for entry in ranked:
+                row, subject_id = entry["row"], entry["subject_id"]
+                position = offsets[race_id] + entry["position"]
+                if row["pk"] is None:
+                    keys = {"season_id": season_id, "race_id": race_id, subject_field: subject_id}
+                    to_create.append(cls(**keys, position=position, **row["totals"]))
+                    if race_id == last_race_id:
+                        last_round_changes["created"][subject_id] = (position, row["totals"])
+                    continue
+                delta = (position - row["position"], *(row["totals"][field] - row[field] for field in cls.TOTAL_FIELDS))
+                if any(delta):
+                    shifts[delta].append(row["pk"])
+                    if race_id == last_race_id:
+                        last_round_changes["shifts"][delta].append(subject_id)
+
+        stale_ids = [existing[key]["pk"] for key, totals in written.items() if totals is None and key in existing]
+        if stale_ids:
+            cls.objects.filter(pk__in=stale_ids).delete()
+        if to_create:
+            cls.objects.bulk_create(to_create, batch_size=500)
+        # Band rows mostly move by the same amounts, so each distinct delta is one UPDATE.
+        for delta, row_ids in shifts.items():
+            cls.shift_rows(cls.objects.filter(pk__in=row_ids), delta)
+        return last_round_changes
+
+    @classmethod
+    def copy_previous_round(cls, race: "Race") -> None:
+        """Seed the snapshot of a race without results from the round before it."""
+        previous_race = (
+            Race.objects.filter(season_id=race.season_id, round_number__lt=race.round_number)
+            .order_by("-round_number")
+            .values("id")[:1]
+        )
+        cls.objects.bulk_create(
+            [
+                cls(season_id=race.season_id, race_id=race.pk, **row)
+                for row in cls.objects.filter(race_id=Subquery(previous_race)).values(
+                    cls.subject_id_field, "position", "points", "wins", "podiums"
+                )
+            ],
+            batch_size=500,
+        )
+
+    @classmethod
+    def rebuild_for_season(cls, season_id: int, from_round: int | None = None) -> None:
+        """Recompute snapshots of every round from ``from_round`` (all rounds when omitted)."""
+        subject_id_field = cls.subject_id_field
+        races = list(Race.objects.filter(season_id=season_id).order_by("round_number").values_list("id", "round_number"))
+        results = (
+            RaceResult.objects.filter(race__season_id=season_id)
+            .order_by()
+            .values("race_id", "position", "points_earned", cls.result_subject_lookup, cls.result_name_lookup)
+        )
+        tables = cumulative_round_standings(
+            [race_id for race_id, _round_number in races],
+            results,
+            cls.result_subject_lookup,
+            cls.result_name_lookup,
+        )
+
+        target_race_ids = [
+            race_id for race_id, round_number in races if from_round is None or round_number >= from_round
+        ]
+        existing_rows = cls.objects.filter(season_id=season_id)
+        if from_round is not None:
+            existing_rows = existing_rows.filter(race_id__in=target_race_ids)
+        existing = {(row.race_id, getattr(row, subject_id_field)): row for row in existing_rows}
+
+        fields = ["position", "points", "wins", "podiums"]
+        to_create = []
+        to_update = []
+        for race_id in target_race_ids:
+            for row in tables[race_id]:
+                values = {field: row[field] for field in fields}
+                snapshot = existing.pop((race_id, row["subject_id"]), None)
+                if snapshot is None:
+                    to_create.append(
+                        cls(season_id=season_id, race_id=race_id, **{subject_id_field: row["subject_id"]}, **values)
+                    )
+                elif any(getattr(snapshot, field) != value for field, value in values.items()):
+                    for field, value in values.items():
+                        setattr(snapshot, field, value)
+                    to_update.append(snapshot)
+
+        if existing:
+            cls.objects.filter(pk__in=[row.pk for row in existing.values()]).delete()
+        if to_create:
+            cls.objects.bulk_create(to_create, batch_size=500)
+        if to_update:
+            cls.objects.bulk_update(to_update, fields, batch_size=500)
+
+
+class DriverRoundStanding(RoundStanding):
+    subject_id_field = "driver_id"
+    result_subject_lookup = "driver_id"
+    result_name_lookup = "driver__name"
+    name_lookup = "driver__name"
+
+    season = models.ForeignKey(Season, on_delete=models.CASCADE, related_name="driver_round_standings")
+    race = models.ForeignKey(Race, on_delete=models.CASCADE, related_name="driver_standings")
+    driver = models.ForeignKey(Driver, on_delete=models.CASCADE, related_name="round_standings")
+
+    class Meta:
+        ordering = ["race__season__year", "race__round_number", "position"]
+        constraints = [
+            models.UniqueConstraint(fields=["race", "driver"], name="unique_driver_standing_per_round"),
+        ]
+        indexes = [
+            models.Index(fields=["race", "position"], name="driver_round_position_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.race} P{self.position}: {self.driver.name}"
+
+
+class ConstructorRoundStanding(RoundStanding):
+    subject_id_field = "team_id"
+    result_subject_lookup = "driver__team_id"
+    result_name_lookup = "driver__team__name"
+    name_lookup = "team__name"
+
+    season = models.ForeignKey(Season, on_delete=models.CASCADE, related_name="constructor_round_standings")
+    race = models.ForeignKey(Race, on_delete=models.CASCADE, related_name="constructor_standings")
+    team = models.ForeignKey(Team, on_delete=models.CASCADE, related_name="round_standings")
+
+    class Meta:
+        ordering = ["race__season__year", "race__round_number", "position"]
+        constraints = [
+            models.UniqueConstraint(fields=["race", "team"], name="unique_constructor_standing_per_round"),
+        ]
+        indexes = [
+            models.Index(fields=["race", "position"], name="team_round_position_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.race} P{self.position}: {self.team.name}"
+
+
+class ApiStats(models.Model):
+    """Single-row counters behind ``/api/v1/stats/``, adjusted by ``racing.signals`` on every write."""
+
+    SINGLETON_ID = 1
+    COUNTER_FIELDS = {
+        Team: "total_teams",
+        Driver: "total_drivers",
+        Season: "total_seasons",
+        Race: "total_races",
+        RaceResult: "total_results",
+    }
+
+    total_teams = models.PositiveBigIntegerField(default=0)
+    total_drivers = models.PositiveBigIntegerField(default=0)
+    total_seasons = models.PositiveBigIntegerField(default=0)
+    total_races = models.PositiveBigIntegerField(default=0)
+    total_results = models.PositiveBigIntegerField(default=0)
+    top_points = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "API stats"
+        verbose_name_plural = "API stats"
+
+    def __str__(self):
+        return "API stats"
+
+    @classmethod
+    def adjust(cls, model: type[models.Model], delta: int) -> None:
+        field = cls.COUNTER_FIELDS[model]
+        updated = cls.objects.filter(pk=cls.SINGLETON_ID).update(
+            **{field: F(field) + delta, "updated_at": timezone.now()}
+        )
+        if not updated:
+            cls.repair()
+        bump_stats_generation()
+
+    @classmethod
+    def sync_top_points(cls) -> None:
+        top_points = Driver.objects.order_by("-points").values("points")[:1]
+        updated = cls.objects.filter(pk=cls.SINGLETON_ID).update(
+            top_points=Coalesce(Subquery(top_points), Value(0)),
+            updated_at=timezone.now(),
+        )
+        if not updated:
+            cls.repair()
+        bump_stats_generation()
+
+    @classmethod
+    def repair(cls) -> "ApiStats":
+        """Recount every counter and store the result on the singleton row."""
+        counts = {field: model.objects.count() for model, field in cls.COUNTER_FIELDS.items()}
+        counts["top_points"] = Driver.objects.aggregate(top=Max("points"))["top"] or 0
+        stats, _created = cls.objects.update_or_create(pk=cls.SINGLETON_ID, defaults=counts)
+        bump_stats_generation()
+        return stats
@@ -0,0 +1,191 @@
+"""Keyset (cursor) pagination for the model viewsets.
+
+Page-number pagination runs ``COUNT(*)`` over the whole filtered queryset on every page and
+makes the database walk past ``OFFSET`` rows, so crawling a long list costs O(pages²). A
+keyset cursor instead carries the ordering values of the last row it returned, and the next
+page filters on ``(a, b, pk) > (x, y, z)`` (spelled ``a > x OR (a = x AND b > y) OR ...``,
+honouring each field's direction). Every page costs the same and no count is needed.
+
+The queryset's ordering is made unique by appending ``pk`` unless it already contains a
+unique field, so rows sharing a race date or a points total are never skipped or repeated.
+"""
+
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+CURSOR_QUERY_PARAM = "cursor"
+PAGINATION_QUERY_PARAM = "pagination"
+
+
+def unique_ordering(queryset) -> list[str]:
+    """The queryset's field ordering, with ``pk`` appended unless a unique field already ends ties."""
+    query = queryset.query
+    ordering = list(query.order_by or (queryset.model._meta.ordering if query.default_ordering else ()))
+    if not all(isinstance(field, str) and field != "?" for field in ordering):
+        raise ImproperlyConfigured("Keyset pagination needs an ordering made of field names.")
+
+    opts = queryset.model._meta
+    unique_fields = {"pk", opts.pk.name} | {field.name for field in opts.concrete_fields if field.unique}
+    if not any(field.lstrip("-") in unique_fields for field in ordering):
+        ordering.append("pk")
+    return ordering
+
+
+def ordering_value(instance, field: str):
+    if isinstance(instance, dict):  # ``.values()`` rows are keyed by the lookup itself.
+        return instance[field.lstrip("-")]
+    value = instance
+    for part in field.lstrip("-").split("__"):
+        value = getattr(value, part)
+    return value
+
+
+def keyset_filter(ordering: list[str], values: list, reverse: bool = False) -> Q:
+    """Rows strictly after ``values`` in ``ordering`` (strictly before when ``reverse``)."""
+    after = Q()
+    equal = Q()
+    for field, value in zip(ordering, values):
+        name = field.lstrip("-")
+        descending = field.startswith("-") != reverse
+        after |= equal & Q(**{f"{name}__{'lt' if descending else 'gt'}": value})
+        equal &= Q(**{name: value})
+    return after
+
+
+def invert_ordering(ordering: list[str]) -> list[str]:
+    return [field[1:] if field.startswith("-") else f"-{field}" for field in ordering]
+
+
+def wants_cursor(request) -> bool:
+    return bool(request.query_params.get(CURSOR_QUERY_PARAM)) or (
+        request.query_params.get(PAGINATION_QUERY_PARAM, "").strip().lower() == CURSOR_QUERY_PARAM
+    )
+
+
+class KeysetCursorPagination(BasePagination):
+    """Opaque ``?cursor=`` pages of ``PAGE_SIZE`` rows with ``next``/``previous`` links and no count."""
+
+    cursor_query_param = CURSOR_QUERY_PARAM
+    page_size = api_settings.PAGE_SIZE
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.base_url = remove_query_param(request.build_absolute_uri(), "page")
+        self.ordering = unique_ordering(queryset)
+        reverse, values = self.decode_cursor(request)
+
+        if values is not None:
+            try:
+                queryset = queryset.filter(keyset_filter(self.ordering, values, reverse))
+            except (DjangoValidationError, TypeError, ValueError) as exc:
+                raise ValidationError({"cursor": ["Invalid cursor."]}) from exc
+        queryset = queryset.order_by(*(invert_ordering(self.ordering) if reverse else self.ordering))
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.next_link = self.previous_link = None
+        if rows:
+            # A backward page always has rows after it, and a forward page from a cursor has rows before it.
+            has_next = has_more or reverse
+            has_previous = has_more if reverse else values is not None
+            if has_next:
+                self.next_link = self.build_link(False, rows[-1])
+            if has_previous:
+                self.previous_link = self.build_link(True, rows[0])
+        elif values is not None:
+            self.previous_link = remove_query_param(self.base_url, self.cursor_query_param)
+        return rows
+
+    def decode_cursor(self, request) -> tuple[bool, list | None]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return False, None
+        try:
+            reverse, values = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+        except (binascii.Error, TypeError, ValueError) as exc:
+            raise ValidationError({"cursor": ["Invalid cursor."]}) from exc
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise ValidationError({"cursor": ["Invalid cursor."]})
+        return bool(reverse), values
+
+    def build_link(self, reverse: bool, instance) -> str:
+        values = [ordering_value(instance, field) for field in self.ordering]
+        # str() keeps full precision for dates, datetimes and decimals; filters accept it back.
+        payload = json.dumps([int(reverse), values], default=str, separators=(",", ":"))
+        cursor = base64.urlsafe_b64encode(payload.encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_next_link(self):
+        return self.next_link
+
+    def get_previous_link(self):
+        return self.previous_link
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.next_link, "previous": self.previous_link, "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        link = {"type": "string", "nullable": True, "format": "uri"}
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {"next": link, "previous": link, "results": schema},
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Opaque keyset cursor taken from a previous page's next/previous link.",
+                "schema": {"type": "string"},
+            }
+        ]
+
+
+class PageNumberOrCursorPagination(PageNumberPagination):
+    """Page numbers by default; keyset cursors when a request sends ``?cursor=`` or ``?pagination=cursor``.
+
+    Viewsets that should always page by cursor set ``pagination_class = KeysetCursorPagination``.
+    """
+
+    cursor_pagination_class = KeysetCursorPagination
+    cursor_paginator = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if wants_cursor(request):
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *super().get_schema_operation_parameters(view),
+            *self.cursor_pagination_class().get_schema_operation_parameters(view),
+            {
+                "name": PAGINATION_QUERY_PARAM,
+                "required": False,
+                "in": "query",
+                "description": "Set to `cursor` to page with keyset cursors instead of page numbers.",
+                "schema": {"type": "string", "enum": [CURSOR_QUERY_PARAM]},
+            },
+        ]
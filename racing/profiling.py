@@ -0,0 +1,99 @@
+"""Per-worker store of the slowest sampled request profiles.
+
+``RequestProfilerMiddleware`` runs a ``PROFILER_SAMPLE_RATE`` share of requests under
+``cProfile``. Profiles of requests slower than ``PROFILER_THRESHOLD_MS`` go into a store
+that holds the ``PROFILER_MAX_PROFILES`` slowest ones; a slower profile displaces the fastest
+when the store is full. Profiles are kept in the ``pstats`` file format (the marshalled stats
+dictionary), so a download opens directly with ``python -m pstats`` or snakeviz.
+"""
+
+import heapq
+import itertools
+import marshal
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+
+from django.conf import settings
+
+
+@dataclass(order=True)
+class RequestProfile:
+    duration_ms: int
+    sequence: int  # Breaks duration ties so ``data`` is never compared.
+    request_id: str = field(compare=False)
+    method: str = field(compare=False)
+    path: str = field(compare=False)
+    status_code: int = field(compare=False)
+    captured_at: float = field(compare=False)
+    data: bytes = field(compare=False, repr=False)
+
+    def summary(self) -> dict:
+        return {
+            "request_id": self.request_id,
+            "method": self.method,
+            "path": self.path,
+            "status": self.status_code,
+            "duration_ms": self.duration_ms,
+            "captured_at": self.captured_at,
+            "size_bytes": len(self.data),
+        }
+
+
+class ProfileStore:
+    """Thread-safe min-heap of the slowest profiles, bounded by ``PROFILER_MAX_PROFILES``."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._profiles = []
+        self._sequence = itertools.count()
+
+    def admits(self, duration_ms: int) -> bool:
+        """Whether a profile this slow would be kept, checked before it is serialized."""
+        max_profiles = settings.PROFILER_MAX_PROFILES
+        if max_profiles <= 0 or duration_ms < settings.PROFILER_THRESHOLD_MS:
+            return False
+        with self._lock:
+            return len(self._profiles) < max_profiles or duration_ms > self._profiles[0].duration_ms
+
+    def add(self, request, status_code: int, duration_ms: int, profiler) -> None:
+        profiler.create_stats()
+        profile = RequestProfile(
+            duration_ms=duration_ms,
+            sequence=next(self._sequence),
+            request_id=getattr(request, "request_id", "-"),
+            method=request.method,
+            path=request.get_full_path(),
+            status_code=status_code,
+            captured_at=time.time(),
+            data=marshal.dumps(profiler.stats),
+        )
+        max_profiles = max(0, settings.PROFILER_MAX_PROFILES)
+        with self._lock:
+            heapq.heappush(self._profiles, profile)
+            while len(self._profiles) > max_profiles:
+                heapq.heappop(self._profiles)
+
+    def list(self) -> list[RequestProfile]:
+        """Stored profiles, slowest first."""
+        with self._lock:
+            return sorted(self._profiles, reverse=True)
+
+    def get(self, request_id: str) -> RequestProfile | None:
+        with self._lock:
+            matches = [profile for profile in self._profiles if profile.request_id == request_id]
+        return max(matches, default=None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+
+    def _reset_after_fork(self) -> None:
+        """Start empty with a fresh lock, as ``ThreadShards.reset_after_fork`` does."""
+        self._lock = threading.Lock()
+        self._profiles = []
+
+
+profile_store = ProfileStore()
+os.register_at_fork(after_in_child=profile_store._reset_after_fork)
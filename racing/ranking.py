@@ -0,0 +1,98 @@
+"""Pure ranking helpers for the standings read models (migrations keep frozen copies).
+
+Standings are ordered by points, then by countback: most P1 finishes, then most P2
+finishes, and so on down the finishing-position histogram. Names and ids only settle
+rows that are identical on every count.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+
+CHAMPIONSHIP_CLINCHED = "clinched"
+CHAMPIONSHIP_CONTENDER = "contender"
+CHAMPIONSHIP_ELIMINATED = "eliminated"
+
+
+def countback_sort_key(row: dict, depth: int) -> tuple:
+    histogram = row["histogram"]
+    return (
+        -row["points"],
+        *(-histogram.get(position, 0) for position in range(1, depth + 1)),
+        row["name"],
+        row["subject_id"],
+    )
+
+
+def assign_positions(rows: list[dict]) -> list[dict]:
+    """Sort rows (``points``, ``histogram``, ``name``, ``subject_id``) by countback and number them."""
+    depth = max((max(row["histogram"], default=0) for row in rows), default=0)
+    rows.sort(key=lambda row: countback_sort_key(row, depth))
+    for position, row in enumerate(rows, start=1):
+        row["position"] = position
+    return rows
+
+
+def cumulative_round_standings(
+    race_ids: Iterable[int],
+    results: Iterable[dict],
+    subject_key: str,
+    name_key: str,
+) -> dict[int, list[dict]]:
+    """Rank cumulative totals after every race.
+
+    ``race_ids`` must be in round order and ``results`` are ``RaceResult`` value rows carrying
+    ``race_id``, ``position``, ``points_earned`` and the subject id/name keys. A subject appears
+    in every table from its first classified race onwards.
+    """
+    results_by_race = defaultdict(list)
+    for result in results:
+        results_by_race[result["race_id"]].append(result)
+
+    totals = {}
+    tables = {}
+    for race_id in race_ids:
+        for result in results_by_race[race_id]:
+            subject_id = result[subject_key]
+            row = totals.get(subject_id)
+            if row is None:
+                row = totals[subject_id] = {
+                    "subject_id": subject_id,
+                    "name": result[name_key],
+                    "points": 0,
+                    "wins": 0,
+                    "podiums": 0,
+                    "histogram": {},
+                }
+            row["points"] += result["points_earned"]
+            row["wins"] += result["position"] == 1
+            row["podiums"] += result["position"] <= 3
+            row["histogram"][result["position"]] = row["histogram"].get(result["position"], 0) + 1
+        tables[race_id] = assign_positions(
+            [{**row, "histogram": dict(row["histogram"])} for row in totals.values()]
+        )
+    return tables
+
+
+def championship_outlook(rows: list[dict], remaining_races: int, max_points_per_race: int) -> list[dict]:
+    """Flag each row of a ranked table as clinched, contender or eliminated.
+
+    ``rows`` are already ordered by ``position`` and carry ``points``. A subject is eliminated
+    once sweeping every remaining race cannot reach the leader's total; the leader has clinched
+    once no rival (including one without points yet) can reach theirs. Reaching the leader
+    exactly still counts as a contender because countback may decide the title.
+    """
+    points_available = remaining_races * max_points_per_race
+    leader_points = rows[0]["points"] if rows else 0
+    rival_ceiling = (rows[1]["points"] if len(rows) > 1 else 0) + points_available
+    leader_clinched = remaining_races == 0 or leader_points > rival_ceiling
+
+    for index, row in enumerate(rows):
+        row["max_points"] = row["points"] + points_available
+        row["points_behind"] = leader_points - row["points"]
+        if index == 0:
+            row["status"] = CHAMPIONSHIP_CLINCHED if leader_clinched else CHAMPIONSHIP_CONTENDER
+        elif leader_clinched or row["max_points"] < leader_points:
+            row["status"] = CHAMPIONSHIP_ELIMINATED
+        else:
+            row["status"] = CHAMPIONSHIP_CONTENDER
+    return rows
@@ -0,0 +1,84 @@
+"""orjson-backed DRF renderer/parser with stdlib fallbacks.
+
+Output matches ``rest_framework.renderers.JSONRenderer`` with the default settings (compact,
+UTF-8, U+2028/U+2029 escaped): dates, times, decimals, lazy strings and other types orjson
+does not handle natively go through DRF's own ``JSONEncoder.default``. Indented output (the
+browsable API), anything orjson cannot encode and payloads holding NaN or infinities (which
+orjson writes as ``null`` while DRF rejects them under ``STRICT_JSON``) fall back to the
+stdlib implementation.
+"""
+
+import codecs
+import math
+from decimal import Decimal
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # Optional: without orjson both classes behave exactly like DRF's.
+    orjson = None
+
+if orjson is not None:
+    ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+LINE_SEPARATOR = "\u2028".encode()
+PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+
+def has_non_finite_number(value) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(has_non_finite_number(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(has_non_finite_number(item) for item in value)
+    return isinstance(value, Decimal) and not value.is_finite()
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type or "", renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            content = orjson.dumps(data, default=self.encoder_class().default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # orjson writes non-finite floats as null; only then is the payload walked to look for them.
+        if b"null" in content and has_non_finite_number(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Same escaping as DRF: both separators are valid JSON but break JavaScript string literals.
+        if LINE_SEPARATOR in content or PARAGRAPH_SEPARATOR in content:
+            content = content.replace(LINE_SEPARATOR, b"\\u2028").replace(PARAGRAPH_SEPARATOR, b"\\u2029")
+        return content
+
+
+class ColumnarJSONRenderer(FastJSONRenderer):
+    """Selected by ``?format=columnar`` or its media type; see ``racing.columnar``."""
+
+    media_type = "application/vnd.motorsport.columnar+json"
+    format = "columnar"
+
+
+class FastJSONParser(JSONParser):
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        try:
+            content = stream.read()
+            if codecs.lookup(encoding).name != "utf-8":
+                content = content.decode(encoding)
+            return orjson.loads(content)
+        except (orjson.JSONDecodeError, UnicodeDecodeError) as exc:
+            raise ParseError(f"JSON parse error - {exc}") from exc
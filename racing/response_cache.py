@@ -0,0 +1,100 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+from .caching import build_etag, tag_versions
+
+
+class CachedResponseMixin:
+    """Cache list/retrieve payloads keyed by the versions of their model tags; the key doubles as the ETag."""
+
+    cache_tag_model: str = ""
+    cache_dependencies: tuple[str, ...] = ()
+    # Models whose writes only reorder or re-total lists (e.g. driver points after a result write).
+    cache_list_dependencies: tuple[str, ...] = ()
+
+    def get_cache_tags(self) -> list[str]:
+        if self.action == "retrieve":
+            tags = [f"{self.cache_tag_model}:{self.kwargs[self.lookup_url_kwarg or self.lookup_field]}"]
+            dependencies = self.cache_dependencies
+        else:
+            tags = [self.get_list_cache_tag()]
+            dependencies = (*self.cache_dependencies, *self.cache_list_dependencies)
+        return tags + [f"{dependency}:*" for dependency in dependencies]
+
+    def get_list_cache_tag(self) -> str:
+        return f"{self.cache_tag_model}:*"
+
+    def get_response_fingerprint(self, request, tags: list[str], versions: list[int]) -> str:
+        query = sorted(
+            (name, [value.strip() for value in values if value.strip()])
+            for name, values in request.query_params.lists()
+        )
+        fingerprint = json.dumps(
+            [tags, versions, sorted(self.kwargs.items()), [item for item in query if item[1]]],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+    def get_last_modified(self, versions: list[int]) -> int:
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action == "retrieve":
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        stored = queryset.order_by().aggregate(last_modified=Max("updated_at"))["last_modified"]
+        newest_tag = max(versions, default=0) // 1_000_000_000
+        return max(int(stored.timestamp()) if stored else 0, newest_tag)
+
+    def cached_response(self, handler, request, *args, **kwargs) -> Response:
+        tags = self.get_cache_tags()
+        versions = tag_versions(tags)
+        fingerprint = self.get_response_fingerprint(request, tags, versions)
+        etag = build_etag(self.basename, self.action, request.accepted_renderer.format, fingerprint[:32])
+
+        if request.headers.get("If-None-Match"):
+            # If-None-Match takes precedence over If-Modified-Since, so no timestamp is needed.
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                return self.with_validators(not_modified, etag)
+
+        timeout = settings.API_RESPONSE_CACHE_TIMEOUT
+        # The negotiated format picks the payload shape too (row-oriented vs columnar lists).
+        response_format = request.accepted_renderer.format
+        cache_key = f"api:response:{self.basename}:{self.action}:{response_format}:{fingerprint}"
+        entry = cache.get(cache_key) if timeout else None
+        if entry is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            last_modified = self.get_last_modified(versions)
+            if timeout:
+                cache.set(cache_key, (response.data, last_modified), timeout)
+        else:
+            payload, last_modified = entry
+            response = Response(payload)
+
+        if last_modified >= int(time.time()):
+            last_modified = None  # A later write within this second would not move it.
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        return self.with_validators(not_modified or response, etag, last_modified)
+
+    def with_validators(self, response, etag: str, last_modified: int | None = None):
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        response["Cache-Control"] = "no-cache"
+        patch_vary_headers(response, ["Accept"])
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
@@ -3,7 +3,9 @@ from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
 
+from .fieldsets import SparseFieldsMixin
 from .models import Driver, Race, RaceResult, Season, Team
+from .ranking import CHAMPIONSHIP_CLINCHED, CHAMPIONSHIP_CONTENDER, CHAMPIONSHIP_ELIMINATED
 
 User = get_user_model()
 
@@ -82,6 +84,7 @@ class SessionRefreshResponseSerializer(serializers.Serializer):
 
 
 class DriverSeasonStandingSerializer(serializers.Serializer):
+    position = serializers.IntegerField()
     driver_id = serializers.IntegerField()
     driver_name = serializers.CharField()
     team_name = serializers.CharField()
@@ -92,21 +95,81 @@ class DriverSeasonStandingSerializer(serializers.Serializer):
 
 class DriverSeasonStandingsResponseSerializer(serializers.Serializer):
     season = serializers.IntegerField()
+    round = serializers.IntegerField(required=False, allow_null=True)
     results = DriverSeasonStandingSerializer(many=True)
 
 
 class ConstructorSeasonStandingSerializer(serializers.Serializer):
+    position = serializers.IntegerField()
     team_id = serializers.IntegerField()
     team_name = serializers.CharField()
     total_points = serializers.IntegerField()
     wins = serializers.IntegerField()
+    podiums = serializers.IntegerField()
 
 
 class ConstructorSeasonStandingsResponseSerializer(serializers.Serializer):
     season = serializers.IntegerField()
+    round = serializers.IntegerField(required=False, allow_null=True)
     results = ConstructorSeasonStandingSerializer(many=True)
 
 
+class DriverProgressionSerializer(serializers.Serializer):
+    driver_id = serializers.IntegerField()
+    driver_name = serializers.CharField()
+    team_name = serializers.CharField()
+    points = serializers.ListField(child=serializers.IntegerField())
+
+
+class ChampionshipProgressionResponseSerializer(serializers.Serializer):
+    season = serializers.IntegerField()
+    rounds = serializers.ListField(child=serializers.IntegerField())
+    drivers = DriverProgressionSerializer(many=True)
+
+
+class ChampionshipStatusSerializer(serializers.Serializer):
+    position = serializers.IntegerField()
+    driver_id = serializers.IntegerField()
+    driver_name = serializers.CharField()
+    team_name = serializers.CharField()
+    total_points = serializers.IntegerField()
+    max_points = serializers.IntegerField()
+    points_behind = serializers.IntegerField()
+    status = serializers.ChoiceField(choices=[CHAMPIONSHIP_CLINCHED, CHAMPIONSHIP_CONTENDER, CHAMPIONSHIP_ELIMINATED])
+
+
+class ChampionshipStatusResponseSerializer(serializers.Serializer):
+    season = serializers.IntegerField()
+    remaining_races = serializers.IntegerField()
+    max_points_per_race = serializers.IntegerField()
+    points_available = serializers.IntegerField()
+    results = ChampionshipStatusSerializer(many=True)
+
+
+class TeammateHeadToHeadSerializer(serializers.Serializer):
+    driver_a_id = serializers.IntegerField()
+    driver_a_name = serializers.CharField()
+    driver_b_id = serializers.IntegerField()
+    driver_b_name = serializers.CharField()
+    races = serializers.IntegerField()
+    driver_a_ahead = serializers.IntegerField()
+    driver_b_ahead = serializers.IntegerField()
+    driver_a_points = serializers.IntegerField()
+    driver_b_points = serializers.IntegerField()
+    points_delta = serializers.IntegerField()
+
+
+class TeamHeadToHeadSerializer(serializers.Serializer):
+    team_id = serializers.IntegerField()
+    team_name = serializers.CharField()
+    pairs = TeammateHeadToHeadSerializer(many=True)
+
+
+class TeammateHeadToHeadResponseSerializer(serializers.Serializer):
+    season = serializers.IntegerField()
+    teams = TeamHeadToHeadSerializer(many=True)
+
+
 class ApiStatsSerializer(serializers.Serializer):
     total_teams = serializers.IntegerField()
     total_drivers = serializers.IntegerField()
@@ -122,21 +185,55 @@ class HealthCheckSerializer(serializers.Serializer):
     database = serializers.BooleanField()
 
 
+class SqlStatementSerializer(serializers.Serializer):
+    query_id = serializers.CharField()
+    query = serializers.CharField()
+    calls = serializers.IntegerField()
+    total_ms = serializers.FloatField()
+    mean_ms = serializers.FloatField()
+    max_ms = serializers.FloatField()
+    rows = serializers.IntegerField()
+
+
+class SqlStatementStatsResponseSerializer(serializers.Serializer):
+    pid = serializers.IntegerField()
+    fingerprints = serializers.IntegerField()
+    evicted = serializers.IntegerField()
+    results = SqlStatementSerializer(many=True)
+
+
+class RequestProfileSerializer(serializers.Serializer):
+    request_id = serializers.CharField()
+    method = serializers.CharField()
+    path = serializers.CharField()
+    status = serializers.IntegerField()
+    duration_ms = serializers.IntegerField()
+    captured_at = serializers.FloatField()
+    size_bytes = serializers.IntegerField()
+
+
+class RequestProfilesResponseSerializer(serializers.Serializer):
+    pid = serializers.IntegerField()
+    results = RequestProfileSerializer(many=True)
+
+
 class DetailMessageSerializer(serializers.Serializer):
     detail = serializers.CharField()
 
 
-class TeamSlimSerializer(serializers.ModelSerializer):
+class TeamSlimSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Team
         fields = ["id", "name", "country"]
 
 
-class DriverSerializer(serializers.ModelSerializer):
+class DriverSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     points = serializers.IntegerField(read_only=True)
     team = TeamSlimSerializer(read_only=True)
     team_id = serializers.PrimaryKeyRelatedField(source="team", queryset=Team.objects.all(), write_only=True)
 
+    expandable_fields = {"team": "team_id"}
+
     class Meta:
         model = Driver
         fields = ["id", "name", "points", "team", "team_id"]
@@ -150,13 +247,13 @@ class DriverSerializer(serializers.ModelSerializer):
         return validated
 
 
-class DriverCompactSerializer(serializers.ModelSerializer):
+class DriverCompactSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Driver
         fields = ["id", "name", "points"]
 
 
-class TeamSerializer(serializers.ModelSerializer):
+class TeamSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     driver_count = serializers.IntegerField(read_only=True)
 
     class Meta:
@@ -164,7 +261,7 @@ class TeamSerializer(serializers.ModelSerializer):
         fields = ["id", "name", "country", "driver_count"]
 
 
-class TeamDetailSerializer(serializers.ModelSerializer):
+class TeamDetailSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     drivers = DriverCompactSerializer(many=True, read_only=True)
     driver_count = serializers.IntegerField(read_only=True)
 
@@ -173,7 +270,7 @@ class TeamDetailSerializer(serializers.ModelSerializer):
         fields = ["id", "name", "country", "driver_count", "drivers"]
 
 
-class SeasonSerializer(serializers.ModelSerializer):
+class SeasonSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     race_count = serializers.IntegerField(read_only=True)
 
     class Meta:
@@ -181,7 +278,7 @@ class SeasonSerializer(serializers.ModelSerializer):
         fields = ["id", "year", "name", "race_count"]
 
 
-class RaceSerializer(serializers.ModelSerializer):
+class RaceSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     season_year = serializers.IntegerField(source="season.year", read_only=True)
     season_id = serializers.PrimaryKeyRelatedField(source="season", queryset=Season.objects.all(), write_only=True)
 
@@ -190,12 +287,14 @@ class RaceSerializer(serializers.ModelSerializer):
         fields = ["id", "name", "country", "round_number", "race_date", "season_year", "season_id"]
 
 
-class RaceResultSerializer(serializers.ModelSerializer):
+class RaceResultSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     race = RaceSerializer(read_only=True)
     driver = DriverSerializer(read_only=True)
     race_id = serializers.PrimaryKeyRelatedField(source="race", queryset=Race.objects.all(), write_only=True)
     driver_id = serializers.PrimaryKeyRelatedField(source="driver", queryset=Driver.objects.all(), write_only=True)
 
+    expandable_fields = {"race": "race_id", "driver": "driver_id"}
+
     class Meta:
         model = RaceResult
         fields = [
@@ -225,3 +324,46 @@ class RaceResultSerializer(serializers.ModelSerializer):
                 )
 
         return validated
+
+
+class RaceClassificationEntrySerializer(serializers.Serializer):
+    id = serializers.IntegerField(read_only=True)
+    driver_id = serializers.IntegerField(min_value=1)
+    position = serializers.IntegerField(min_value=1, required=False)
+    points_earned = serializers.IntegerField(min_value=0, default=0)
+    fastest_lap = serializers.BooleanField(default=False)
+
+
+class RaceClassificationSerializer(serializers.Serializer):
+    race_id = serializers.IntegerField(read_only=True)
+    results = RaceClassificationEntrySerializer(many=True, allow_empty=False)
+
+    def validate_results(self, value):
+        # Positions default to the submitted order; all checks run in memory except driver existence.
+        with_position = sum(1 for entry in value if "position" in entry)
+        if 0 < with_position < len(value):
+            raise serializers.ValidationError(
+                {"position": ["Give a position for every entry or for none of them."]}
+            )
+        entries = [
+            {**entry, "position": entry.get("position", index)}
+            for index, entry in enumerate(value, start=1)
+        ]
+
+        errors = {}
+        driver_ids = [entry["driver_id"] for entry in entries]
+        positions = [entry["position"] for entry in entries]
+        if len(set(driver_ids)) != len(driver_ids):
+            errors["driver_id"] = ["Each driver can be classified only once per race."]
+        if len(set(positions)) != len(positions):
+            errors["position"] = ["Positions must be unique within a race."]
+        if sum(1 for entry in entries if entry["fastest_lap"]) > 1:
+            errors["fastest_lap"] = ["Only one fastest lap per race is allowed."]
+
+        unknown_driver_ids = set(driver_ids) - set(Driver.objects.filter(id__in=driver_ids).values_list("id", flat=True))
+        if unknown_driver_ids:
+            errors["driver_id"] = [f"Unknown driver ids: {', '.join(map(str, sorted(unknown_driver_ids)))}."]
+
+        if errors:
+            raise serializers.ValidationError(errors)
+        return entries
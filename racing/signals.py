@@ -0,0 +1,90 @@
+"""Model write receivers: response cache invalidation and ``ApiStats`` counters.
+
+Cached API responses are dropped by tag. Tags are ``<model>:*`` for every row of a model,
+``<model>:<pk>`` for one row and ``<model>:season:<season_id>`` for season-scoped races and
+results. Writes that bypass model signals (bulk classification updates, points syncs) bump
+their tags explicitly.
+
+Row counters move by one per created or deleted row, including rows removed by cascades,
+inside the writing transaction; bulk inserts adjust them explicitly.
+"""
+
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+
+from .caching import bump_tags, model_tags
+from .models import ApiStats, Driver, Race, RaceResult, Season, Team
+
+RESPONSE_TAG_MODELS = {
+    Team: "team",
+    Driver: "driver",
+    Season: "season",
+    Race: "race",
+    RaceResult: "result",
+}
+
+
+def stored_season_id(instance) -> int | None:
+    """Season a stored race or result belongs to, read from the database."""
+    if isinstance(instance, Race):
+        return Race.objects.filter(pk=instance.pk).values_list("season_id", flat=True).first()
+    if isinstance(instance, RaceResult):
+        return RaceResult.objects.filter(pk=instance.pk).values_list("race__season_id", flat=True).first()
+    return None
+
+
+def current_season_id(instance) -> int | None:
+    if isinstance(instance, Race):
+        return instance.season_id
+    if isinstance(instance, RaceResult):
+        return Race.objects.filter(pk=instance.race_id).values_list("season_id", flat=True).first()
+    return None
+
+
+def remember_previous_response_tags(sender, instance, raw=False, **kwargs):
+    model_tag = RESPONSE_TAG_MODELS.get(sender)
+    if model_tag is None or raw:
+        return
+    # Moving a race or result to another season must also invalidate the season it left.
+    instance._previous_response_tags = (
+        model_tags(model_tag, instance.pk, stored_season_id(instance)) if instance.pk else []
+    )
+
+
+def bump_saved_response_tags(sender, instance, raw=False, **kwargs):
+    model_tag = RESPONSE_TAG_MODELS.get(sender)
+    if model_tag is None or raw:
+        return
+    bump_tags(
+        [
+            *getattr(instance, "_previous_response_tags", []),
+            *model_tags(model_tag, instance.pk, current_season_id(instance)),
+        ]
+    )
+
+
+def bump_deleted_response_tags(sender, instance, **kwargs):
+    model_tag = RESPONSE_TAG_MODELS.get(sender)
+    if model_tag is None:
+        return
+    bump_tags(model_tags(model_tag, instance.pk, stored_season_id(instance)))
+
+
+def count_created_row(sender, instance, created=False, **kwargs):
+    if created:
+        ApiStats.adjust(sender, 1)
+
+
+def count_deleted_row(sender, instance, **kwargs):
+    ApiStats.adjust(sender, -1)
+    if sender is Driver:
+        ApiStats.sync_top_points()
+
+
+# Receivers are bound to each model explicitly: a sender-less pre_delete receiver would
+# disable Django's fast cascade deletes for every other model as well.
+for model in RESPONSE_TAG_MODELS:
+    pre_save.connect(remember_previous_response_tags, sender=model)
+    post_save.connect(bump_saved_response_tags, sender=model)
+    pre_delete.connect(bump_deleted_response_tags, sender=model)
+    post_save.connect(count_created_row, sender=model)
+    post_delete.connect(count_deleted_row, sender=model)
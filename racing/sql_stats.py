@@ -0,0 +1,179 @@
+"""Per-worker ``pg_stat_statements``-style statistics of SQL statements, grouped by normalized fingerprint."""
+
+import hashlib
+import heapq
+import os
+import re
+import threading
+from functools import lru_cache
+
+from django.conf import settings
+
+from .thread_shards import ThreadShards
+
+STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+NUMBER_LITERAL_RE = re.compile(r"(?<![\w.\"`])-?\d+(?:\.\d+)?(?![\w\"`])")
+PLACEHOLDER_RE = re.compile(r"%s|\?")
+VALUE_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+REPEATED_LIST_RE = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+WHITESPACE_RE = re.compile(r"\s+")
+
+# Exposed metric, help text and ``top()`` field for the per-fingerprint series.
+STATEMENT_METRICS = (
+    ("motorsport_sql_statement_calls_total", "Calls of this worker's costliest SQL statement shapes.", "calls"),
+    (
+        "motorsport_sql_statement_duration_ms_total",
+        "Total time of this worker's costliest SQL statement shapes, in milliseconds.",
+        "total_ms",
+    ),
+    ("motorsport_sql_statement_rows_total", "Rows reported by this worker's costliest SQL statement shapes.", "rows"),
+)
+
+# Share of the entries dropped at once when the table is full, so eviction is not paid per insert.
+EVICTION_FRACTION = 0.05
+
+
+@lru_cache(maxsize=2048)
+def fingerprint_sql(sql: str) -> str:
+    """``SELECT * FROM t WHERE id IN (%s, %s) LIMIT 21`` -> ``SELECT * FROM t WHERE id IN (...) LIMIT ?``."""
+    normalized = STRING_LITERAL_RE.sub("?", sql)
+    normalized = PLACEHOLDER_RE.sub("?", normalized)
+    normalized = NUMBER_LITERAL_RE.sub("?", normalized)
+    normalized = VALUE_LIST_RE.sub("(...)", normalized)
+    normalized = REPEATED_LIST_RE.sub("(...)", normalized)
+    return WHITESPACE_RE.sub(" ", normalized).strip()
+
+
+def query_id(fingerprint: str) -> str:
+    return hashlib.sha1(fingerprint.encode()).hexdigest()[:16]
+
+
+def _merge_entries(into: dict, entries: dict) -> None:
+    for fingerprint, (calls, total_ms, max_ms, rows) in entries.items():
+        entry = into.get(fingerprint)
+        if entry is None:
+            into[fingerprint] = [calls, total_ms, max_ms, rows]
+        else:
+            entry[0] += calls
+            entry[1] += total_ms
+            entry[2] = max(entry[2], max_ms)
+            entry[3] += rows
+
+
+def _evict_cheapest(entries: dict, count: int) -> None:
+    for fingerprint in heapq.nsmallest(count, entries, key=lambda key: entries[key][1]):
+        del entries[fingerprint]
+
+
+class _StatementTable:
+    """One thread's ``fingerprint -> [calls, total_ms, max_ms, rows]`` table; the owning thread is the only writer."""
+
+    def __init__(self, key=None):
+        self.lock = threading.Lock()  # Only contended by readers merging the tables.
+        self.entries = {}
+        self.evicted = 0
+
+    def record(self, fingerprint: str, duration_ms: float, rows: int) -> None:
+        with self.lock:
+            entry = self.entries.get(fingerprint)
+            if entry is None:
+                max_entries = max(1, settings.SQL_STATS_MAX_ENTRIES)
+                if len(self.entries) >= max_entries:
+                    count = len(self.entries) - max_entries + max(1, int(max_entries * EVICTION_FRACTION))
+                    _evict_cheapest(self.entries, count)
+                    self.evicted += count
+                entry = self.entries[fingerprint] = [0, 0.0, 0.0, 0]
+            entry[0] += 1
+            entry[1] += duration_ms
+            if duration_ms > entry[2]:
+                entry[2] = duration_ms
+            if rows > 0:
+                entry[3] += rows
+
+    def snapshot(self) -> tuple[dict, int]:
+        with self.lock:
+            return {fingerprint: list(entry) for fingerprint, entry in self.entries.items()}, self.evicted
+
+
+class SqlStatementStats:
+    """Per-thread statement tables, merged when read; exited threads fold into one bounded table."""
+
+    def __init__(self):
+        self._tables = ThreadShards(_StatementTable)
+        self._retired = {}
+        self._retired_evicted = 0
+
+    def record(self, sql: str, duration_ms: float, rows: int) -> None:
+        self._tables.current().record(fingerprint_sql(sql), duration_ms, rows)
+
+    def _retire(self, table: _StatementTable) -> None:
+        entries, evicted = table.snapshot()
+        _merge_entries(self._retired, entries)
+        self._retired_evicted += evicted
+
+    def _merged(self) -> tuple[dict, int]:
+        """All fingerprints of live and exited threads, and how many entries were evicted."""
+        with self._tables.lock:
+            live_tables = self._tables.prune(self._retire)
+            overflow = len(self._retired) - max(1, settings.SQL_STATS_MAX_ENTRIES)
+            if overflow > 0:
+                _evict_cheapest(self._retired, overflow)
+                self._retired_evicted += overflow
+            merged = {fingerprint: list(entry) for fingerprint, entry in self._retired.items()}
+            evicted = self._retired_evicted
+
+        for table in live_tables:
+            entries, table_evicted = table.snapshot()
+            _merge_entries(merged, entries)
+            evicted += table_evicted
+        return merged, evicted
+
+    def top(self, limit: int) -> list[dict]:
+        """The ``limit`` fingerprints with the most total time, costliest first."""
+        entries = heapq.nlargest(limit, self._merged()[0].items(), key=lambda item: item[1][1])
+        return [
+            {
+                "query_id": query_id(fingerprint),
+                "query": fingerprint,
+                "calls": calls,
+                "total_ms": round(total_ms, 3),
+                "mean_ms": round(total_ms / calls, 3),
+                "max_ms": round(max_ms, 3),
+                "rows": rows,
+            }
+            for fingerprint, (calls, total_ms, max_ms, rows) in entries
+        ]
+
+    @property
+    def evicted(self) -> int:
+        return self._merged()[1]
+
+    def __len__(self) -> int:
+        return len(self._merged()[0])
+
+    def reset(self) -> None:
+        with self._tables.lock:
+            self._tables.clear()
+            self._retired.clear()
+            self._retired_evicted = 0
+
+    def _reset_after_fork(self) -> None:
+        self._tables.reset_after_fork()
+        self._retired = {}
+        self._retired_evicted = 0
+
+
+statement_stats = SqlStatementStats()
+os.register_at_fork(after_in_child=statement_stats._reset_after_fork)
+
+
+def render_statement_metrics(limit: int) -> list[str]:
+    """Prometheus lines for this worker's top fingerprints, labelled by ``pid`` and ``query_id``."""
+    pid = os.getpid()
+    entries = statement_stats.top(limit) if limit > 0 else []
+    lines = []
+    for metric, help_text, field in STATEMENT_METRICS:
+        lines.extend([f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"])
+        for entry in entries:
+            lines.append('%s{pid="%s",query_id="%s"} %s' % (metric, pid, entry["query_id"], entry[field]))
+    return lines
@@ -1,14 +1,22 @@
+import marshal
+import time
 from datetime import date
+from unittest import mock
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
+from django.db import connection
 from django.urls import reverse
+from django.utils.http import http_date
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
 
 from racing.models import Driver, Race, RaceResult, Season, Team
+from racing.pagination import KeysetCursorPagination
+from racing.profiling import profile_store
 from racing.views import (
     CsrfTokenView,
     LoginView,
@@ -121,8 +129,60 @@ class MotorsportApiTests(APITestCase):
         payload = response.content.decode("utf-8")
         self.assertIn("motorsport_http_requests_total", payload)
         self.assertIn("motorsport_http_request_duration_ms_sum", payload)
+        self.assertIn("motorsport_http_request_duration_ms_bucket", payload)
         self.assertIn("motorsport_http_inflight_requests", payload)
-        self.assertIn('path="/api/health/"', payload)
+        self.assertIn('route="/api/health/"', payload)
+        self.assertIn('motorsport_http_request_db_duration_ms_count{method="GET",route="/api/health/"}', payload)
+
+    @override_settings(SQL_STATS_ENABLED=True)
+    def test_sql_stats_endpoint_is_staff_only_and_lists_costliest_statements(self):
+        self.client.get(reverse("api-v1:driver-list"))
+
+        self.assertEqual(self.client.get(reverse("api-sql-stats")).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self._token_for('user', 'testpass123')}")
+        self.assertEqual(self.client.get(reverse("api-sql-stats")).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self._token_for('admin', 'testpass123')}")
+        response = self.client.get(reverse("api-sql-stats"), {"limit": 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertLessEqual(len(response.data["results"]), 3)
+        totals = [entry["total_ms"] for entry in response.data["results"]]
+        self.assertEqual(totals, sorted(totals, reverse=True))
+        response = self.client.get(reverse("api-sql-stats"), {"limit": 500})
+        queries = [entry["query"] for entry in response.data["results"]]
+        self.assertTrue(any('FROM "racing_driver"' in query and "LIMIT ?" in query for query in queries))
+
+        self.assertEqual(self.client.delete(reverse("api-sql-stats")).status_code, status.HTTP_204_NO_CONTENT)
+        self.assertLess(self.client.get(reverse("api-sql-stats")).data["fingerprints"], response.data["fingerprints"])
+
+    @override_settings(PROFILER_SAMPLE_RATE=1.0, PROFILER_THRESHOLD_MS=0, PROFILER_MAX_PROFILES=50)
+    def test_staff_can_download_sampled_request_profiles(self):
+        profile_store.clear()
+        self.addCleanup(profile_store.clear)
+        self.client.get(reverse("api-v1:driver-list"), HTTP_X_REQUEST_ID="slow-drivers")
+
+        self.assertEqual(self.client.get(reverse("api-profiles")).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self._token_for('user', 'testpass123')}")
+        download_url = reverse("api-profile-download", args=["slow-drivers"])
+        self.assertEqual(self.client.get(download_url).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self._token_for('admin', 'testpass123')}")
+        response = self.client.get(reverse("api-profiles"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("slow-drivers", [profile["request_id"] for profile in response.data["results"]])
+
+        response = self.client.get(download_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="slow-drivers.pstats"')
+        self.assertIsInstance(marshal.loads(response.content), dict)
+        missing_url = reverse("api-profile-download", args=["missing"])
+        self.assertEqual(self.client.get(missing_url).status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(API_SERVER_TIMING_ENABLED=True)
+    def test_server_timing_reports_database_queries(self):
+        response = self.client.get(reverse("api-v1:driver-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertRegex(response["Server-Timing"], r'^db;dur=[\d.]+;desc="[1-9]\d* queries", total;dur=\d+$')
 
     def test_standings_are_sorted_descending(self):
         response = self.client.get(reverse("api-v1:driver-standings"))
@@ -185,18 +245,185 @@ class MotorsportApiTests(APITestCase):
         self.assertEqual(response.data["total_drivers"], 3)
         self.assertEqual(response.data["total_seasons"], 1)
 
+    def test_stats_are_a_single_counter_read_kept_in_step_with_writes(self):
+        self.race_2.delete()
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("api-v1:api-stats"))
+
+        self.assertEqual(
+            response.data,
+            {
+                "total_teams": 2,
+                "total_drivers": 3,
+                "total_seasons": 1,
+                "total_races": 1,
+                "total_results": 2,
+                "top_points": 25,
+            },
+        )
+
     def test_driver_season_standings(self):
         response = self.client.get(reverse("api-v1:driver-season-standings"), {"season": 2026})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["season"], 2026)
         self.assertEqual(response.data["results"][0]["driver_name"], "Max Fast")
         self.assertEqual(response.data["results"][0]["total_points"], 43)
+        self.assertEqual([row["position"] for row in response.data["results"]], [1, 2])
 
     def test_constructor_standings(self):
         response = self.client.get(reverse("api-v1:constructor-season-standings"), {"season": 2026})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["results"][0]["team_name"], "Blue Arrow")
         self.assertEqual(response.data["results"][0]["total_points"], 43)
+        self.assertEqual(response.data["results"][0]["position"], 1)
+        self.assertEqual(response.data["results"][0]["podiums"], 2)
+
+    def test_standings_after_round_use_round_snapshots(self):
+        response = self.client.get(reverse("api-v1:driver-season-standings"), {"season": 2026, "after_round": 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["round"], 1)
+        self.assertEqual(
+            [(row["driver_name"], row["total_points"]) for row in response.data["results"]],
+            [("Max Fast", 25), ("Owen Pace", 18)],
+        )
+
+        constructors = self.client.get(
+            reverse("api-v1:constructor-season-standings"), {"season": 2026, "after_round": 7}
+        )
+        self.assertEqual(constructors.data["round"], 2)
+        self.assertEqual(constructors.data["results"][0]["total_points"], 43)
+
+    def test_championship_progression_returns_cumulative_matrix(self):
+        race_3 = Race.objects.create(
+            season=self.season_2026,
+            round_number=3,
+            name="Monaco Grand Prix",
+            country="Monaco",
+            race_date=date(2026, 5, 10),
+        )
+        RaceResult.objects.create(race=race_3, driver=self.driver_luca, position=1, points_earned=25)
+        RaceResult.objects.create(race=race_3, driver=self.driver_max, position=2, points_earned=18)
+
+        # Season lookup plus the single windowed results query.
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("api-v1:championship-progression"), {"season": 2026})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["rounds"], [1, 2, 3])
+        self.assertEqual(
+            [(row["driver_name"], row["points"]) for row in response.data["drivers"]],
+            [("Max Fast", [25, 43, 61]), ("Owen Pace", [18, 43, 43]), ("Luca Stone", [0, 0, 25])],
+        )
+        self.assertIn("ETag", response)
+
+    @override_settings(CHAMPIONSHIP_MAX_POINTS_PER_RACE=10)
+    def test_championship_status_flags_clinch_contention_and_elimination(self):
+        RaceResult.objects.create(race=self.race_1, driver=self.driver_luca, position=3, points_earned=15)
+        Race.objects.create(
+            season=self.season_2026,
+            round_number=3,
+            name="Monaco Grand Prix",
+            country="Monaco",
+            race_date=date(2026, 5, 10),
+        )
+        url = reverse("api-v1:championship-status")
+
+        response = self.client.get(url, {"season": 2026})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data["remaining_races"], response.data["points_available"]), (1, 10))
+        self.assertEqual(
+            [(row["driver_name"], row["max_points"], row["status"]) for row in response.data["results"]],
+            [("Max Fast", 53, "contender"), ("Owen Pace", 53, "contender"), ("Luca Stone", 25, "eliminated")],
+        )
+
+        RaceResult.objects.create(
+            race=Race.objects.get(season=self.season_2026, round_number=3),
+            driver=self.driver_max,
+            position=1,
+            points_earned=10,
+        )
+        response = self.client.get(url, {"season": 2026})
+
+        self.assertEqual(response.data["remaining_races"], 0)
+        self.assertEqual(
+            [row["status"] for row in response.data["results"]],
+            ["clinched", "eliminated", "eliminated"],
+        )
+
+    def test_teammate_head_to_head_compares_shared_races(self):
+        RaceResult.objects.create(race=self.race_1, driver=self.driver_luca, position=3, points_earned=15)
+        RaceResult.objects.create(race=self.race_2, driver=self.driver_luca, position=3, points_earned=15)
+        RaceResult.objects.get(race=self.race_2, driver=self.driver_max).delete()
+
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("api-v1:teammate-head-to-head"), {"season": 2026})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        teams = {team["team_name"]: team for team in response.data["teams"]}
+        self.assertEqual(teams["Blue Arrow"]["pairs"], [])
+        [pair] = teams["Red Apex"]["pairs"]
+        self.assertEqual((pair["driver_a_id"], pair["driver_b_id"]), (self.driver_max.id, self.driver_luca.id))
+        self.assertEqual(pair["races"], 1)
+        self.assertEqual((pair["driver_a_ahead"], pair["driver_b_ahead"]), (1, 0))
+        self.assertEqual(pair["points_delta"], 10)
+
+    def test_invalid_after_round_returns_bad_request(self):
+        response = self.client.get(reverse("api-v1:driver-season-standings"), {"after_round": "last"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("after_round", response.data["errors"])
+
+    def test_standings_support_conditional_requests(self):
+        url = reverse("api-v1:driver-season-standings")
+        first = self.client.get(url, {"season": 2026})
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertIn("ETag", first)
+
+        with self.assertNumQueries(0):
+            revalidated = self.client.get(url, {"season": 2026}, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(revalidated.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(revalidated["ETag"], first["ETag"])
+
+        with self.assertNumQueries(0):
+            cached = self.client.get(url, {"season": 2026})
+        self.assertEqual(cached.data, first.data)
+
+    @override_settings(API_COMPRESSION_MIN_BYTES=1)
+    def test_compressed_standings_revalidate_with_weak_etag(self):
+        url = reverse("api-v1:driver-season-standings")
+        first = self.client.get(url, {"season": 2026}, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(first["Content-Encoding"], "gzip")
+        self.assertTrue(first["ETag"].startswith("W/"))
+
+        revalidated = self.client.get(
+            url, {"season": 2026}, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=first["ETag"]
+        )
+        self.assertEqual(revalidated.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_standings_etag_changes_after_result_write(self):
+        url = reverse("api-v1:constructor-season-standings")
+        first = self.client.get(url, {"season": 2026})
+
+        RaceResult.objects.create(race=self.race_2, driver=self.driver_luca, position=3, points_earned=15)
+
+        response = self.client.get(url, {"season": 2026}, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], first["ETag"])
+        self.assertEqual(response.data["results"][0]["team_name"], "Red Apex")
+        self.assertEqual(response.data["results"][0]["total_points"], 58)
+
+    def test_standings_etag_changes_after_driver_rename(self):
+        url = reverse("api-v1:driver-season-standings")
+        first = self.client.get(url, {"season": 2026})
+
+        self.driver_max.name = "Max Faster"
+        self.driver_max.save()
+
+        response = self.client.get(url, {"season": 2026}, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["driver_name"], "Max Faster")
 
     def test_results_filter_by_season(self):
         response = self.client.get(reverse("api-v1:result-list"), {"season": 2026})
@@ -218,6 +445,267 @@ class MotorsportApiTests(APITestCase):
         response = self.client.post(reverse("api-v1:result-list"), payload, format="json")
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
+    def test_admin_can_post_bulk_classification_for_new_race(self):
+        token = self._token_for("admin", "testpass123")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        race_3 = Race.objects.create(
+            season=self.season_2026,
+            round_number=3,
+            name="Monaco Grand Prix",
+            country="Monaco",
+            race_date=date(2026, 5, 10),
+        )
+
+        response = self.client.post(
+            reverse("api-v1:race-results-bulk", args=[race_3.id]),
+            {
+                "results": [
+                    {"driver_id": self.driver_luca.id, "points_earned": 25, "fastest_lap": True},
+                    {"driver_id": self.driver_max.id, "points_earned": 18},
+                    {"driver_id": self.driver_owen.id, "points_earned": 15},
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([row["position"] for row in response.data["results"]], [1, 2, 3])
+        self.assertEqual(RaceResult.objects.filter(race=race_3).count(), 3)
+        self.driver_luca.refresh_from_db()
+        self.assertEqual(self.driver_luca.points, 25)
+
+        duplicate = self.client.post(
+            reverse("api-v1:race-results-bulk", args=[race_3.id]),
+            {"results": [{"driver_id": self.driver_luca.id, "points_earned": 25}]},
+            format="json",
+        )
+        self.assertEqual(duplicate.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_admin_can_replace_classification_in_bulk(self):
+        token = self._token_for("admin", "testpass123")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        max_result_id = RaceResult.objects.get(race=self.race_1, driver=self.driver_max).id
+
+        response = self.client.put(
+            reverse("api-v1:race-results-bulk", args=[self.race_1.id]),
+            {
+                "results": [
+                    {"driver_id": self.driver_luca.id, "position": 1, "points_earned": 25},
+                    {"driver_id": self.driver_max.id, "position": 2, "points_earned": 18, "fastest_lap": True},
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = list(
+            RaceResult.objects.filter(race=self.race_1)
+            .order_by("position")
+            .values_list("id", "driver_id", "position", "fastest_lap")
+        )
+        self.assertEqual(
+            rows[1],
+            (max_result_id, self.driver_max.id, 2, True),
+        )
+        self.assertEqual(rows[0][1:], (self.driver_luca.id, 1, False))
+        self.assertEqual(len(rows), 2)
+
+        self.driver_owen.refresh_from_db()
+        self.assertEqual(self.driver_owen.points, 25)
+        standings = self.client.get(reverse("api-v1:driver-season-standings"), {"season": 2026})
+        self.assertEqual(
+            [(row["driver_name"], row["total_points"]) for row in standings.data["results"]],
+            [("Max Fast", 36), ("Luca Stone", 25), ("Owen Pace", 25)],
+        )
+
+    @override_settings(API_RESPONSE_CACHE_TIMEOUT=300)
+    def test_viewset_lists_are_served_from_tagged_response_cache(self):
+        url = reverse("api-v1:driver-list")
+        first = self.client.get(url, {"team": self.team_red.id})
+
+        with self.assertNumQueries(0):
+            cached = self.client.get(url, {"team": f" {self.team_red.id}", "country": ""})
+        self.assertEqual(cached.data, first.data)
+
+        RaceResult.objects.create(race=self.race_1, driver=self.driver_luca, position=3, points_earned=15)
+
+        refreshed = self.client.get(url, {"team": self.team_red.id})
+        self.assertEqual(
+            {row["name"]: row["points"] for row in refreshed.data["results"]},
+            {"Max Fast": 43, "Luca Stone": 15},
+        )
+
+    def test_response_cache_is_off_by_default(self):
+        url = reverse("api-v1:team-detail", args=[self.team_red.id])
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreater(len(queries), 0)
+
+    @override_settings(API_RESPONSE_CACHE_TIMEOUT=300)
+    def test_points_sync_keeps_responses_of_untouched_drivers_cached(self):
+        other_url = reverse("api-v1:driver-detail", args=[self.driver_owen.id])
+        luca_url = reverse("api-v1:driver-detail", args=[self.driver_luca.id])
+        self.client.get(other_url)
+        self.client.get(luca_url)
+
+        RaceResult.objects.create(race=self.race_1, driver=self.driver_luca, position=3, points_earned=15)
+
+        with self.assertNumQueries(0):
+            self.client.get(other_url)
+        self.assertEqual(self.client.get(luca_url).data["points"], 15)
+
+    @override_settings(API_RESPONSE_CACHE_TIMEOUT=300)
+    def test_driver_rename_drops_cached_results_that_embed_the_driver(self):
+        result = RaceResult.objects.get(race=self.race_1, driver=self.driver_max)
+        detail_url = reverse("api-v1:result-detail", args=[result.id])
+        list_url = reverse("api-v1:result-list")
+        self.client.get(detail_url)
+        self.client.get(list_url, {"season": 2026})
+
+        self.driver_max.name = "Max Faster"
+        self.driver_max.save()
+
+        self.assertEqual(self.client.get(detail_url).data["driver"]["name"], "Max Faster")
+        names = {row["driver"]["name"] for row in self.client.get(list_url, {"season": 2026}).data["results"]}
+        self.assertIn("Max Faster", names)
+
+    @override_settings(API_RESPONSE_CACHE_TIMEOUT=300)
+    def test_season_scoped_lists_survive_writes_to_other_seasons(self):
+        url = reverse("api-v1:race-list")
+        self.client.get(url, {"season": 2026})
+        season_2025 = Season.objects.create(year=2025, name="World Championship 2025")
+        self.client.get(url, {"season": 2026})
+
+        Race.objects.create(
+            season=season_2025,
+            round_number=1,
+            name="Bahrain Grand Prix",
+            country="Bahrain",
+            race_date=date(2025, 3, 9),
+        )
+        with self.assertNumQueries(0):
+            self.client.get(url, {"season": 2026})
+
+        self.race_2.name = "Catalan Grand Prix"
+        self.race_2.save()
+        response = self.client.get(url, {"season": 2026})
+        self.assertEqual(
+            [race["name"] for race in response.data["results"]],
+            ["Australian Grand Prix", "Catalan Grand Prix"],
+        )
+
+    @override_settings(API_RESPONSE_CACHE_TIMEOUT=300)
+    def test_viewsets_support_conditional_requests(self):
+        url = reverse("api-v1:team-detail", args=[self.team_red.id])
+        with mock.patch("racing.response_cache.time.time", return_value=time.time() + 5):
+            first = self.client.get(url)
+        self.assertIn("ETag", first)
+        self.assertIn("Last-Modified", first)
+        self.assertIn("Accept", first["Vary"])
+
+        with self.assertNumQueries(0):
+            revalidated = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(revalidated.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with self.assertNumQueries(0), mock.patch("racing.response_cache.time.time", return_value=time.time() + 5):
+            unchanged = self.client.get(url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+        self.assertEqual(unchanged.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.driver_luca.delete()
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(changed["ETag"], first["ETag"])
+        self.assertEqual(changed.data["driver_count"], 1)
+
+    def test_last_modified_is_withheld_within_the_second_it_names(self):
+        url = reverse("api-v1:team-detail", args=[self.team_red.id])
+        write_second = int(self.team_red.updated_at.timestamp())
+        with mock.patch("racing.response_cache.time.time", return_value=write_second + 0.5):
+            first = self.client.get(url)
+            self.assertNotIn("Last-Modified", first)
+            self.assertIn("ETag", first)
+
+            # A write later in the same second: an If-Modified-Since of that second must not match.
+            self.team_red.name = "Red Apex Racing"
+            self.team_red.save()
+            Team.objects.filter(id=self.team_red.id).update(updated_at=self.team_red.updated_at)
+            response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=http_date(write_second))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["name"], "Red Apex Racing")
+
+    def test_bulk_classification_drops_cached_result_responses(self):
+        token = self._token_for("admin", "testpass123")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        result = RaceResult.objects.get(race=self.race_1, driver=self.driver_max)
+        detail_url = reverse("api-v1:result-detail", args=[result.id])
+        self.assertEqual(self.client.get(detail_url).data["position"], 1)
+
+        self.client.put(
+            reverse("api-v1:race-results-bulk", args=[self.race_1.id]),
+            {"results": [{"driver_id": self.driver_owen.id}, {"driver_id": self.driver_max.id}]},
+            format="json",
+        )
+
+        self.assertEqual(self.client.get(detail_url).data["position"], 2)
+
+    def test_bulk_classification_is_validated_in_memory(self):
+        token = self._token_for("admin", "testpass123")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        response = self.client.put(
+            reverse("api-v1:race-results-bulk", args=[self.race_1.id]),
+            {
+                "results": [
+                    {"driver_id": self.driver_luca.id, "position": 1, "fastest_lap": True},
+                    {"driver_id": self.driver_max.id, "position": 1, "fastest_lap": True},
+                    {"driver_id": 999999, "position": 3},
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.data["errors"]["results"]
+        self.assertIn("position", errors)
+        self.assertIn("fastest_lap", errors)
+        self.assertIn("driver_id", errors)
+        self.assertEqual(RaceResult.objects.filter(race=self.race_1).count(), 2)
+
+    def test_bulk_classification_rejects_mixed_implicit_and_explicit_positions(self):
+        token = self._token_for("admin", "testpass123")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        response = self.client.put(
+            reverse("api-v1:race-results-bulk", args=[self.race_1.id]),
+            {
+                "results": [
+                    {"driver_id": self.driver_luca.id, "points_earned": 25},
+                    {"driver_id": self.driver_max.id, "position": 3, "points_earned": 15},
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["errors"]["results"]["position"],
+            ["Give a position for every entry or for none of them."],
+        )
+
+    def test_non_admin_cannot_write_bulk_classification(self):
+        token = self._token_for("user", "testpass123")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        response = self.client.put(
+            reverse("api-v1:race-results-bulk", args=[self.race_1.id]),
+            {"results": [{"driver_id": self.driver_luca.id, "position": 1}]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
     def test_token_refresh_flow(self):
         token_response = self.client.post(
             reverse("api-v1:token_obtain_pair"),
@@ -528,6 +1016,121 @@ class MotorsportApiTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["count"], 2)
 
+    def test_results_sparse_fieldsets_collapse_and_expand_relations(self):
+        url = reverse("api-v1:result-list")
+        full = self.client.get(url, {"season": 2026}).data["results"][0]
+        self.assertEqual(set(full["driver"]["team"]), {"id", "name", "country"})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"season": 2026, "fields": "id,position,race,driver.name"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["results"][0],
+            {"id": full["id"], "position": 1, "race": self.race_1.id, "driver": {"name": "Max Fast"}},
+        )
+        self.assertFalse(any("racing_team" in query["sql"] for query in queries.captured_queries))
+
+        expanded = self.client.get(url, {"expand": "driver.team"}).data["results"][0]
+        self.assertEqual(expanded["race"], self.race_1.id)
+        self.assertEqual(expanded["driver"], full["driver"])
+
+    def test_unknown_sparse_fields_return_bad_request(self):
+        response = self.client.get(reverse("api-v1:result-list"), {"fields": "id,driver.nickname"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("driver.nickname", response.data["errors"]["fields"][0])
+
+        response = self.client.get(reverse("api-v1:driver-list"), {"expand": "season"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("expand", response.data["errors"])
+
+    def test_results_columnar_format_transposes_list_rows(self):
+        url = reverse("api-v1:result-list")
+        rows = self.client.get(url, {"season": 2026}).data["results"]
+
+        with self.assertNumQueries(3):
+            response = self.client.get(url, {"season": 2026, "format": "columnar"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/vnd.motorsport.columnar+json")
+        self.assertEqual(response.data["count"], 4)
+        payload = response.data["results"]
+        self.assertEqual(payload["columns"], list(payload["data"]))
+        self.assertEqual(payload["data"]["id"], [row["id"] for row in rows])
+        self.assertEqual(payload["data"]["driver_name"], [row["driver"]["name"] for row in rows])
+        self.assertEqual(payload["data"]["season_year"], [2026] * 4)
+        self.assertEqual(response.json()["results"]["data"]["race_date"][0], "2026-03-15")
+
+        accepted = self.client.get(url, {"season": 2026}, HTTP_ACCEPT="application/vnd.motorsport.columnar+json")
+        self.assertEqual(accepted.data, response.data)
+        self.assertEqual(self.client.get(url, {"season": 2026}).data["results"], rows)
+
+    @mock.patch.object(KeysetCursorPagination, "page_size", 2)
+    def test_columnar_format_pages_by_cursor(self):
+        url = reverse("api-v1:driver-list")
+        first = self.client.get(url, {"format": "columnar", "pagination": "cursor"})
+        second = self.client.get(first.data["next"])
+
+        self.assertEqual(first.data["results"]["data"]["name"], ["Max Fast", "Owen Pace"])
+        self.assertEqual(second.data["results"]["data"]["name"], ["Luca Stone"])
+        self.assertIsNone(second.data["next"])
+        self.assertNotIn("pk", first.data["results"]["data"])
+
+    def test_columnar_format_is_rejected_for_detail_endpoints(self):
+        response = self.client.get(reverse("api-v1:driver-detail", args=[self.driver_max.id]), {"format": "columnar"})
+
+        self.assertEqual(response.status_code, status.HTTP_406_NOT_ACCEPTABLE)
+
+    def _crawl_cursor_pages(self, url, params):
+        pages = []
+        response = self.client.get(url, params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            pages.append(response)
+            if response.data["next"] is None:
+                return pages
+            response = self.client.get(response.data["next"])
+
+    @mock.patch.object(KeysetCursorPagination, "page_size", 3)
+    def test_results_cursor_pagination_matches_page_number_order(self):
+        race_3 = Race.objects.create(
+            season=self.season_2026,
+            round_number=3,
+            name="Monaco Grand Prix",
+            country="Monaco",
+            race_date=date(2026, 5, 24),
+        )
+        for position, driver in enumerate((self.driver_luca, self.driver_max, self.driver_owen), start=1):
+            RaceResult.objects.create(race=race_3, driver=driver, position=position)
+        expected = list(RaceResult.objects.order_by("race__race_date", "position").values_list("id", flat=True))
+
+        pages = self._crawl_cursor_pages(reverse("api-v1:result-list"), {"pagination": "cursor"})
+
+        self.assertEqual([len(page.data["results"]) for page in pages], [3, 3, 1])
+        self.assertEqual([row["id"] for page in pages for row in page.data["results"]], expected)
+        self.assertIsNone(pages[0].data["previous"])
+        previous = self.client.get(pages[-1].data["previous"])
+        self.assertEqual(previous.data["results"], pages[1].data["results"])
+        self.assertEqual(self.client.get(previous.data["previous"]).data["results"], pages[0].data["results"])
+
+    @mock.patch.object(KeysetCursorPagination, "page_size", 2)
+    def test_drivers_cursor_pagination_breaks_points_and_name_ties_by_id(self):
+        for team in (self.team_red, self.team_blue, Team.objects.create(name="Green Line", country="Ireland")):
+            Driver.objects.create(name="Sam Twin", team=team, points=180)
+        expected = list(Driver.objects.order_by("-points", "name", "id").values_list("id", flat=True))
+
+        pages = self._crawl_cursor_pages(reverse("api-v1:driver-list"), {"pagination": "cursor"})
+
+        self.assertEqual([row["id"] for page in pages for row in page.data["results"]], expected)
+
+    def test_invalid_cursor_returns_bad_request(self):
+        for cursor in ("not-a-cursor", "WzAsWzFdXQ==", "WzAsWyJ4IiwieCIsIngiXV0="):
+            response = self.client.get(reverse("api-v1:result-list"), {"cursor": cursor})
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("cursor", response.data["errors"])
+
     def test_duplicate_race_position_is_rejected(self):
         token = self._token_for("admin", "testpass123")
         self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
@@ -0,0 +1,21 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from racing.models import ApiStats, Driver, Team
+
+
+class RepairApiStatsCommandTests(TestCase):
+    def test_repair_recounts_drifted_counters(self):
+        team = Team.objects.create(name="Red Apex", country="Italy")
+        Driver.objects.create(name="Max Fast", team=team)
+        ApiStats.objects.filter(pk=ApiStats.SINGLETON_ID).update(total_drivers=7, total_teams=0)
+
+        stdout = StringIO()
+        call_command("repair_api_stats", stdout=stdout)
+
+        stats = ApiStats.objects.get(pk=ApiStats.SINGLETON_ID)
+        self.assertEqual((stats.total_teams, stats.total_drivers), (1, 1))
+        self.assertIn("total_drivers: 7 -> 1", stdout.getvalue())
+        self.assertIn("2 counter(s) drifted", stdout.getvalue())
@@ -0,0 +1,27 @@
+from django.test import SimpleTestCase
+
+from racing.ranking import championship_outlook
+
+
+class ChampionshipOutlookTests(SimpleTestCase):
+    def statuses(self, points, remaining_races, max_points_per_race=26):
+        rows = championship_outlook([{"points": value} for value in points], remaining_races, max_points_per_race)
+        return [row["status"] for row in rows]
+
+    def test_leader_clinches_when_no_rival_can_reach_them(self):
+        self.assertEqual(self.statuses([100, 47, 10], remaining_races=2), ["clinched", "eliminated", "eliminated"])
+
+    def test_reaching_the_leader_exactly_keeps_a_driver_in_contention(self):
+        self.assertEqual(
+            self.statuses([100, 48, 47], remaining_races=2),
+            ["contender", "contender", "eliminated"],
+        )
+
+    def test_completed_season_crowns_the_leader(self):
+        rows = championship_outlook([{"points": 43}, {"points": 43}], 0, 26)
+
+        self.assertEqual([row["status"] for row in rows], ["clinched", "eliminated"])
+        self.assertEqual([(row["max_points"], row["points_behind"]) for row in rows], [(43, 0), (43, 0)])
+
+    def test_lone_leader_can_still_be_caught_by_unclassified_drivers(self):
+        self.assertEqual(self.statuses([25], remaining_races=1), ["contender"])
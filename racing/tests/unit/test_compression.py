@@ -0,0 +1,44 @@
+import gzip
+
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from racing.middleware import ApiCompressionMiddleware, preferred_encoding
+
+
+@override_settings(API_COMPRESSION_ENABLED=True, API_COMPRESSION_MIN_BYTES=100)
+class ApiCompressionMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.body = b'{"results": [' + b",".join(b'{"name": "Max Fast"}' for _ in range(50)) + b"]}"
+
+    def respond(self, path, body, **headers):
+        response = HttpResponse(body, content_type="application/json")
+        response["ETag"] = '"standings-1"'
+        return ApiCompressionMiddleware(lambda _request: response)(self.factory.get(path, **headers))
+
+    def test_large_api_responses_are_gzipped(self):
+        response = self.respond("/api/v1/drivers/", self.body, HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), self.body)
+        self.assertEqual(response["Content-Length"], str(len(response.content)))
+        self.assertEqual(response["ETag"], 'W/"standings-1"')
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+    def test_small_non_api_and_unaccepted_responses_are_left_alone(self):
+        for path, body, accept_encoding in (
+            ("/api/v1/drivers/", b"{}", "gzip"),
+            ("/admin/", self.body, "gzip"),
+            ("/api/v1/drivers/", self.body, "identity"),
+            ("/api/v1/drivers/", self.body, "gzip;q=0"),
+        ):
+            response = self.respond(path, body, HTTP_ACCEPT_ENCODING=accept_encoding)
+            self.assertFalse(response.has_header("Content-Encoding"), (path, accept_encoding))
+            self.assertEqual(response.content, body)
+
+    def test_preferred_encoding_honours_quality_values(self):
+        self.assertEqual(preferred_encoding("gzip;q=0.5, br", ("br", "gzip")), "br")
+        self.assertEqual(preferred_encoding("gzip, br;q=0.1", ("br", "gzip")), "gzip")
+        self.assertEqual(preferred_encoding("*", ("gzip",)), "gzip")
+        self.assertIsNone(preferred_encoding("", ("br", "gzip")))
@@ -59,3 +59,16 @@ class DriverPointsSyncTests(TestCase):
 
         self.driver_a.refresh_from_db()
         self.assertEqual(self.driver_a.points, 25)
+
+    def test_recalculate_points_uses_constant_number_of_queries(self):
+        RaceResult.objects.create(race=self.race, driver=self.driver_a, position=1, points_earned=25)
+        RaceResult.objects.create(race=self.race, driver=self.driver_b, position=2, points_earned=18)
+        Driver.objects.filter(id__in=[self.driver_a.id, self.driver_b.id]).update(points=0)
+
+        # Points UPDATE, the SELECT of tags to invalidate, stats top_points UPDATE and the totals
+        # SELECT, whatever the driver count.
+        with self.assertNumQueries(4):
+            totals = Driver.recalculate_points_for_ids([self.driver_a.id, self.driver_b.id, 0])
+
+        self.assertEqual(totals, {self.driver_a.id: 25, self.driver_b.id: 18})
+        self.assertEqual(Driver.objects.get(id=self.driver_b.id).points, 18)
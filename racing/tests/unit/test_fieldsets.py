@@ -0,0 +1,48 @@
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from racing.fieldsets import parse_paths, related_paths
+from racing.serializers import DriverSerializer, RaceResultSerializer
+
+
+def serializer_for(serializer_class, query: str = "", method: str = "get"):
+    request = Request(getattr(APIRequestFactory(), method)(f"/api/v1/results/{query}"))
+    return serializer_class(context={"request": request})
+
+
+class ParsePathsTests(SimpleTestCase):
+    def test_builds_nested_tree_from_dotted_paths(self):
+        self.assertEqual(
+            parse_paths(" id, driver.name,driver.team ,,race."),
+            {"id": {}, "driver": {"name": {}, "team": {}}, "race": {}},
+        )
+
+
+class SparseFieldsTests(SimpleTestCase):
+    def test_without_selection_everything_is_embedded(self):
+        serializer = serializer_for(RaceResultSerializer)
+
+        self.assertEqual(related_paths(serializer), ["race", "race__season", "driver", "driver__team"])
+
+    def test_collapsed_relations_need_no_joins(self):
+        serializer = serializer_for(RaceResultSerializer, "?expand=")
+
+        self.assertEqual(related_paths(serializer), [])
+        self.assertEqual(serializer.fields["driver"].source, "driver_id")
+
+    def test_selected_sub_fields_expand_only_their_relation(self):
+        serializer = serializer_for(RaceResultSerializer, "?fields=position,race.season_year&expand=driver.team")
+
+        self.assertEqual(list(serializer.fields), ["position", "race", "race_id", "driver_id"])
+        self.assertEqual(related_paths(serializer), ["race", "race__season"])
+
+    def test_write_requests_ignore_selection(self):
+        serializer = serializer_for(DriverSerializer, "?fields=id", method="post")
+
+        self.assertEqual(list(serializer.fields), ["id", "name", "points", "team", "team_id"])
+
+    def test_write_only_fields_cannot_be_selected(self):
+        with self.assertRaises(ValidationError):
+            serializer_for(DriverSerializer, "?fields=team_id").fields
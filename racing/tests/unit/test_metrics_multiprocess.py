@@ -0,0 +1,102 @@
+import multiprocessing
+import os
+import tempfile
+import threading
+from pathlib import Path
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from racing import metrics
+from racing.metrics_mmap import INITIAL_FILE_SIZE, MmapedDict, read_metrics_file
+
+
+def observe_in_worker():
+    metrics.observe_request("GET", "/api/health/", 200, 40)
+    metrics.increment_inflight_requests()
+
+
+class MmapedDictTests(SimpleTestCase):
+    def test_values_survive_growth_and_reopening(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "counters_1.db"
+            store = MmapedDict(path)
+            for index in range(3000):
+                store.increment(("requests_total", "GET", f"/route/{index}", "200"), 1)
+            store.increment(("requests_total", "GET", "/route/7", "200"), 2.5)
+            store.close()
+
+            self.assertGreater(path.stat().st_size, INITIAL_FILE_SIZE)
+            reopened = MmapedDict(path)
+            reopened.increment(("requests_total", "GET", "/route/7", "200"), 1)
+            values = dict(read_metrics_file(path))
+            reopened.close()
+
+        self.assertEqual(len(values), 3000)
+        self.assertEqual(values[("requests_total", "GET", "/route/7", "200")], 4.5)
+
+
+class MultiprocessMetricsTests(SimpleTestCase):
+    def setUp(self):
+        temporary = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary.cleanup)
+        self.directory = Path(temporary.name)
+        settings_override = override_settings(METRICS_MULTIPROCESS_DIR=str(self.directory))
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        metrics.reset_metrics_state()
+        self.addCleanup(metrics.reset_metrics_state)
+
+    def test_render_merges_files_of_live_and_exited_workers(self):
+        worker = multiprocessing.get_context("fork").Process(target=observe_in_worker)
+        worker.start()
+        worker.join()
+        metrics.observe_request("GET", "/api/health/", 200, 3)
+        metrics.increment_inflight_requests()
+
+        payload = metrics.render_metrics()
+
+        labels = 'method="GET",route="/api/health/"'
+        self.assertIn('motorsport_http_requests_total{method="GET",route="/api/health/",status="200"} 2', payload)
+        self.assertIn('motorsport_http_request_duration_ms_bucket{%s,le="5"} 1' % labels, payload)
+        self.assertIn('motorsport_http_request_duration_ms_bucket{%s,le="50"} 2' % labels, payload)
+        self.assertIn("motorsport_http_request_duration_ms_sum{%s} 43.0" % labels, payload)
+        self.assertIn("motorsport_http_inflight_requests 2", payload)
+
+        metrics.mark_process_dead(worker.pid, self.directory)
+        payload = metrics.render_metrics()
+        self.assertIn("motorsport_http_inflight_requests 1", payload)
+        self.assertIn('motorsport_http_requests_total{method="GET",route="/api/health/",status="200"} 2', payload)
+        self.assertEqual(list(self.directory.glob(f"*_{worker.pid}*.db")), [])
+        self.assertTrue((self.directory / "dead_workers.db").exists())
+
+    def test_files_of_exited_threads_are_folded_into_the_process_file(self):
+        for duration_ms in (3, 7):
+            thread = threading.Thread(target=metrics.observe_request, args=("GET", "/api/health/", 200, duration_ms))
+            thread.start()
+            thread.join()
+        metrics.observe_request("GET", "/api/health/", 200, 40)
+
+        payload = metrics.render_metrics()
+
+        pid = os.getpid()
+        self.assertEqual(len(list(self.directory.glob(f"thread_{pid}_*.db"))), 1)
+        self.assertTrue((self.directory / f"process_{pid}.db").exists())
+        self.assertIn('motorsport_http_requests_total{method="GET",route="/api/health/",status="200"} 3', payload)
+        self.assertIn('motorsport_http_request_duration_ms_sum{method="GET",route="/api/health/"} 50.0', payload)
+
+    def test_process_start_time_is_not_the_first_request_time(self):
+        with mock.patch("racing.metrics.time.time", return_value=metrics._process_start_time + 3600):
+            metrics.observe_request("GET", "/api/health/", 200, 3)
+
+        self.assertIn(
+            f"motorsport_process_start_time_seconds {metrics._process_start_time}\n", metrics.render_metrics()
+        )
+
+    def test_clear_multiprocess_dir_starts_a_fresh_aggregation(self):
+        metrics.observe_request("GET", "/api/health/", 200, 3)
+
+        metrics.reset_metrics_state()
+
+        self.assertEqual(list(self.directory.glob("*.db")), [])
+        self.assertNotIn("motorsport_http_requests_total{", metrics.render_metrics())
@@ -0,0 +1,37 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Q
+from django.test import SimpleTestCase
+
+from racing.models import Driver, RaceResult, Season, Team
+from racing.pagination import keyset_filter, unique_ordering
+
+
+class UniqueOrderingTests(SimpleTestCase):
+    def test_appends_pk_to_non_unique_orderings(self):
+        self.assertEqual(unique_ordering(RaceResult.objects.all()), ["race__race_date", "position", "pk"])
+        self.assertEqual(unique_ordering(Driver.objects.order_by("-points", "name")), ["-points", "name", "pk"])
+
+    def test_keeps_orderings_that_contain_a_unique_field(self):
+        self.assertEqual(unique_ordering(Team.objects.all()), ["name"])
+        self.assertEqual(unique_ordering(Season.objects.order_by("-year")), ["-year"])
+
+    def test_rejects_random_ordering(self):
+        with self.assertRaises(ImproperlyConfigured):
+            unique_ordering(Team.objects.order_by("?"))
+
+
+class KeysetFilterTests(SimpleTestCase):
+    def test_expands_row_comparison_with_field_directions(self):
+        condition = keyset_filter(["-points", "name", "pk"], [180, "Sam", 7])
+
+        expected = (
+            Q(points__lt=180)
+            | (Q(points=180) & Q(name__gt="Sam"))
+            | (Q(points=180) & Q(name="Sam") & Q(pk__gt=7))
+        )
+        self.assertEqual(condition, expected)
+
+    def test_reverse_flips_every_comparison(self):
+        condition = keyset_filter(["-points", "pk"], [180, 7], reverse=True)
+
+        self.assertEqual(condition, Q(points__gt=180) | (Q(points=180) & Q(pk__lt=7)))
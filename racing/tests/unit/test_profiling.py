@@ -0,0 +1,76 @@
+import cProfile
+import pstats
+import tempfile
+from pathlib import Path
+
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from racing.middleware import RequestProfilerMiddleware
+from racing.profiling import ProfileStore, profile_store
+
+
+def profiled_request(factory, request_id):
+    request = factory.get(f"/api/v1/drivers/?request={request_id}")
+    request.request_id = request_id
+    profiler = cProfile.Profile()
+    profiler.enable()
+    sum(range(100))
+    profiler.disable()
+    return request, profiler
+
+
+@override_settings(PROFILER_THRESHOLD_MS=100, PROFILER_MAX_PROFILES=2)
+class ProfileStoreTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def test_keeps_only_the_slowest_profiles_above_the_threshold(self):
+        store = ProfileStore()
+        self.assertFalse(store.admits(99))
+
+        for request_id, duration_ms in (("a", 300), ("b", 150), ("c", 200), ("d", 120)):
+            if store.admits(duration_ms):
+                request, profiler = profiled_request(self.factory, request_id)
+                store.add(request, 200, duration_ms, profiler)
+
+        self.assertEqual([profile.request_id for profile in store.list()], ["a", "c"])
+        self.assertFalse(store.admits(200))
+        self.assertTrue(store.admits(201))
+        self.assertIsNone(store.get("b"))
+
+    def test_profiles_are_pstats_files(self):
+        store = ProfileStore()
+        request, profiler = profiled_request(self.factory, "req-1")
+        store.add(request, 200, 400, profiler)
+
+        profile = store.get("req-1")
+        self.assertEqual(profile.summary()["path"], "/api/v1/drivers/?request=req-1")
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "req-1.pstats"
+            path.write_bytes(profile.data)
+            self.assertGreater(pstats.Stats(str(path)).total_calls, 0)
+
+
+class RequestProfilerMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        profile_store.clear()
+        self.addCleanup(profile_store.clear)
+
+    @override_settings(PROFILER_SAMPLE_RATE=1.0, PROFILER_THRESHOLD_MS=0, PROFILER_MAX_PROFILES=5)
+    def test_stores_sampled_requests_tagged_with_request_id(self):
+        request = self.factory.get("/api/health/")
+        request.request_id = "abc"
+
+        response = RequestProfilerMiddleware(lambda _request: HttpResponse("ok", status=202))(request)
+
+        self.assertEqual(response.status_code, 202)
+        [profile] = profile_store.list()
+        self.assertEqual((profile.request_id, profile.status_code), ("abc", 202))
+
+    @override_settings(PROFILER_SAMPLE_RATE=0.0, PROFILER_THRESHOLD_MS=0)
+    def test_does_nothing_when_sampling_is_disabled(self):
+        RequestProfilerMiddleware(lambda _request: HttpResponse("ok"))(self.factory.get("/api/health/"))
+
+        self.assertEqual(profile_store.list(), [])
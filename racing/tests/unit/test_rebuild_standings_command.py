@@ -0,0 +1,96 @@
+from concurrent.futures import Future
+from datetime import date
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase
+
+from racing.models import Driver, DriverSeasonStanding, Race, RaceResult, Season, Team
+
+
+class InlineExecutor:
+    """Stands in for ``ProcessPoolExecutor``: test databases are not visible to forked workers."""
+
+    def __init__(self, max_workers, initializer):
+        self.max_workers = max_workers
+        initializer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, function, *args):
+        future = Future()
+        future.set_result(function(*args))
+        return future
+
+
+class RebuildStandingsCommandTests(TestCase):
+    def setUp(self):
+        team = Team.objects.create(name="Red Apex", country="Italy")
+        self.driver = Driver.objects.create(name="Max Fast", team=team)
+        self.season = Season.objects.create(year=2026, name="World Championship 2026")
+        race = Race.objects.create(
+            season=self.season,
+            round_number=1,
+            name="Australian Grand Prix",
+            country="Australia",
+            race_date=date(2026, 3, 15),
+        )
+        RaceResult.objects.create(race=race, driver=self.driver, position=1, points_earned=25)
+        # Simulate a bulk data fix that bypassed the model hooks.
+        Driver.objects.filter(id=self.driver.id).update(points=3)
+        DriverSeasonStanding.objects.filter(season=self.season).update(points=1)
+
+    def rebuild(self, *args):
+        stdout = StringIO()
+        call_command("rebuild_standings", *args, stdout=stdout, stderr=StringIO())
+        return stdout.getvalue()
+
+    def test_dry_run_reports_drift_without_keeping_changes(self):
+        output = self.rebuild("--dry-run")
+
+        self.assertIn("1 drifted,", output)
+        self.assertIn("season 2026: 2 drifted row(s)", output)
+        self.assertEqual(DriverSeasonStanding.objects.get(season=self.season).points, 1)
+        self.assertEqual(Driver.objects.get(id=self.driver.id).points, 3)
+
+    def test_rebuild_repairs_selected_season(self):
+        output = self.rebuild("--season", "2026")
+
+        self.assertIn("Rebuilt 1 season(s) with 1 worker(s)", output)
+        self.assertEqual(DriverSeasonStanding.objects.get(season=self.season).points, 25)
+        self.assertEqual(Driver.objects.get(id=self.driver.id).points, 25)
+
+    def test_unknown_season_is_rejected(self):
+        with self.assertRaisesMessage(CommandError, "Unknown season year(s): 1999."):
+            self.rebuild("--season", "1999")
+
+    def test_parallel_rebuild_runs_each_season_in_a_worker(self):
+        command_module = "racing.management.commands.rebuild_standings"
+        with (
+            mock.patch.object(connection, "vendor", "postgresql"),
+            mock.patch(f"{command_module}.ProcessPoolExecutor", InlineExecutor),
+            mock.patch(f"{command_module}.connections.close_all") as close_all,
+        ):
+            output = self.rebuild("--workers", "3")
+
+        close_all.assert_called_once()
+        self.assertIn("Rebuilt 1 season(s) with 3 worker(s)", output)
+        self.assertIn("season 2026: 2 drifted row(s)", output)
+        self.assertEqual(DriverSeasonStanding.objects.get(season=self.season).points, 25)
+
+    def test_sqlite_falls_back_to_one_worker(self):
+        stdout, stderr = StringIO(), StringIO()
+        with mock.patch("racing.management.commands.rebuild_standings.ProcessPoolExecutor") as executor:
+            call_command("rebuild_standings", "--workers", "4", stdout=stdout, stderr=stderr)
+
+        executor.assert_not_called()
+        self.assertIn("SQLite allows a single writer; rebuilding with 1 worker.", stderr.getvalue())
+        self.assertIn("Rebuilt 1 season(s) with 1 worker(s)", stdout.getvalue())
+        self.assertEqual(DriverSeasonStanding.objects.get(season=self.season).points, 25)
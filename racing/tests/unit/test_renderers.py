@@ -0,0 +1,67 @@
+import uuid
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from io import BytesIO
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from racing.renderers import FastJSONParser, FastJSONRenderer
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    payload = {
+        "race_date": date(2026, 3, 15),
+        "updated_at": datetime(2026, 3, 15, 14, 5, 9, 123456, tzinfo=timezone.utc),
+        "start": time(14, 5, 9, 500000),
+        "gap": Decimal("1.250"),
+        "label": gettext_lazy("Not found."),
+        "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "name": "Sergio Pérez ",
+        "points": {1: 25, 2: 18},
+        "results": [{"position": 1, "fastest_lap": True, "team": None}],
+    }
+
+    def test_output_matches_drf_json_renderer(self):
+        self.assertEqual(FastJSONRenderer().render(self.payload), JSONRenderer().render(self.payload))
+
+    def test_indented_and_fallback_rendering_match_drf(self):
+        context = {"indent": 4}
+        self.assertEqual(
+            FastJSONRenderer().render(self.payload, renderer_context=context),
+            JSONRenderer().render(self.payload, renderer_context=context),
+        )
+        with mock.patch("racing.renderers.orjson", None):
+            self.assertEqual(FastJSONRenderer().render(self.payload), JSONRenderer().render(self.payload))
+
+    def test_integers_beyond_64_bits_fall_back_to_stdlib(self):
+        self.assertEqual(FastJSONRenderer().render({"big": 2**70}), JSONRenderer().render({"big": 2**70}))
+
+    def test_non_finite_numbers_behave_like_drf(self):
+        for value in (float("nan"), float("inf"), float("-inf"), Decimal("NaN")):
+            payload = {"results": [{"gap": value, "team": None}]}
+            with self.subTest(value=value):
+                with self.assertRaisesMessage(ValueError, "Out of range float values are not JSON compliant"):
+                    JSONRenderer().render(payload)
+                with self.assertRaisesMessage(ValueError, "Out of range float values are not JSON compliant"):
+                    FastJSONRenderer().render(payload)
+
+                lenient, fast_lenient = JSONRenderer(), FastJSONRenderer()
+                lenient.strict = fast_lenient.strict = False
+                self.assertEqual(fast_lenient.render(payload), lenient.render(payload))
+
+
+class FastJSONParserTests(SimpleTestCase):
+    def test_parses_like_drf_json_parser(self):
+        body = '{"name": "Sergio Pérez", "results": [{"position": 1}]}'.encode()
+
+        self.assertEqual(FastJSONParser().parse(BytesIO(body)), JSONParser().parse(BytesIO(body)))
+
+    def test_invalid_json_raises_parse_error(self):
+        for body in (b"{not json", b'{"gap": NaN}'):
+            with self.assertRaises(ParseError):
+                FastJSONParser().parse(BytesIO(body))
@@ -1,9 +1,12 @@
+import threading
 from unittest.mock import patch
 
+from django.db import connection
 from django.http import HttpResponse
-from django.test import RequestFactory, SimpleTestCase
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.urls import resolve
 
-from racing.metrics import render_metrics, reset_metrics_state
+from racing.metrics import UNMATCHED_ROUTE, observe_request, render_metrics, reset_metrics_state, route_label
 from racing.middleware import RequestIdMiddleware
 from racing.request_context import RequestIdFilter, get_request_id, reset_request_id, set_request_id
 
@@ -24,13 +27,65 @@ class RequestContextTests(SimpleTestCase):
         self.assertEqual(get_request_id(), "-")
 
 
+def resolved_response(request):
+    request.resolver_match = resolve(request.path)
+    return HttpResponse("ok")
+
+
+class MetricsTests(SimpleTestCase):
+    def setUp(self):
+        reset_metrics_state()
+
+    def test_route_label_uses_url_template(self):
+        self.assertEqual(route_label(resolve("/api/v1/drivers/42/")), "/api/v1/drivers/{pk}/")
+        self.assertEqual(route_label(resolve("/api/v1/drivers/by-team/7/")), "/api/v1/drivers/by-team/{team_id}/")
+        self.assertEqual(
+            route_label(resolve("/admin/racing/driver/3/change/")), "/admin/racing/driver/{object_id}/change/"
+        )
+        self.assertEqual(route_label(None), UNMATCHED_ROUTE)
+
+    def test_latency_histogram_buckets_are_cumulative(self):
+        for duration_ms in (3, 5, 40, 20000):
+            observe_request("get", "/api/v1/drivers/{pk}/", 200, duration_ms)
+
+        payload = render_metrics()
+        labels = 'method="GET",route="/api/v1/drivers/{pk}/"'
+        self.assertIn("# TYPE motorsport_http_request_duration_ms histogram", payload)
+        self.assertIn('motorsport_http_request_duration_ms_bucket{%s,le="5"} 2' % labels, payload)
+        self.assertIn('motorsport_http_request_duration_ms_bucket{%s,le="25"} 2' % labels, payload)
+        self.assertIn('motorsport_http_request_duration_ms_bucket{%s,le="50"} 3' % labels, payload)
+        self.assertIn('motorsport_http_request_duration_ms_bucket{%s,le="10000"} 3' % labels, payload)
+        self.assertIn('motorsport_http_request_duration_ms_bucket{%s,le="+Inf"} 4' % labels, payload)
+        self.assertIn("motorsport_http_request_duration_ms_sum{%s} 20048.0" % labels, payload)
+        self.assertIn("motorsport_http_request_duration_ms_count{%s} 4" % labels, payload)
+
+
+    def test_render_merges_per_thread_shards_including_exited_threads(self):
+        def record_requests():
+            for _ in range(250):
+                observe_request("GET", "/api/v1/results/", 200, 12)
+
+        threads = [threading.Thread(target=record_requests) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        observe_request("GET", "/api/v1/results/", 200, 12)
+
+        for _ in range(2):  # The first scrape folds the exited threads' shards away.
+            payload = render_metrics()
+            labels = 'method="GET",route="/api/v1/results/"'
+            self.assertIn('motorsport_http_requests_total{%s,status="200"} 2001' % labels, payload)
+            self.assertIn('motorsport_http_request_duration_ms_bucket{%s,le="25"} 2001' % labels, payload)
+
+
 class RequestIdMiddlewareTests(SimpleTestCase):
     def setUp(self):
         self.factory = RequestFactory()
         reset_metrics_state()
 
     def test_adds_generated_request_id_and_response_header(self):
-        middleware = RequestIdMiddleware(lambda _request: HttpResponse("ok"))
+        middleware = RequestIdMiddleware(resolved_response)
         request = self.factory.get("/api/health/")
 
         with patch("racing.middleware.request_logger.info") as info_mock:
@@ -43,8 +98,19 @@ class RequestIdMiddlewareTests(SimpleTestCase):
         self.assertEqual(get_request_id(), "-")
         info_mock.assert_called_once()
         metrics_payload = render_metrics()
-        self.assertIn('motorsport_http_requests_total{method="GET",path="/api/health/",status="200"} 1', metrics_payload)
-        self.assertIn('motorsport_http_request_duration_ms_count{method="GET",path="/api/health/"} 1', metrics_payload)
+        self.assertIn('motorsport_http_requests_total{method="GET",route="/api/health/",status="200"} 1', metrics_payload)
+        self.assertIn('motorsport_http_request_duration_ms_count{method="GET",route="/api/health/"} 1', metrics_payload)
+
+    def test_unresolved_paths_share_one_series(self):
+        middleware = RequestIdMiddleware(lambda _request: HttpResponse("missing", status=404))
+
+        with patch("racing.middleware.request_logger.info"):
+            for path in ("/nope/1/", "/nope/2/"):
+                middleware(self.factory.get(path))
+
+        self.assertIn(
+            'motorsport_http_requests_total{method="GET",route="unmatched",status="404"} 2', render_metrics()
+        )
 
     def test_uses_incoming_request_id_and_truncates_to_64_characters(self):
         middleware = RequestIdMiddleware(lambda _request: HttpResponse("ok"))
@@ -70,4 +136,43 @@ class RequestIdMiddlewareTests(SimpleTestCase):
         exception_mock.assert_called_once()
         self.assertEqual(get_request_id(), "-")
         metrics_payload = render_metrics()
-        self.assertIn('motorsport_http_requests_total{method="GET",path="/api/health/",status="500"} 1', metrics_payload)
+        self.assertIn('motorsport_http_requests_total{method="GET",route="unmatched",status="500"} 1', metrics_payload)
+
+
+def query_twice(request):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+        cursor.execute("SELECT 2")
+    return resolved_response(request)
+
+
+class RequestQueryTimingTests(SimpleTestCase):
+    databases = {"default"}
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        reset_metrics_state()
+
+    def test_logs_query_count_and_exports_db_time_histogram(self):
+        middleware = RequestIdMiddleware(query_twice)
+
+        with patch("racing.middleware.request_logger.info") as info_mock:
+            response = middleware(self.factory.get("/api/health/"))
+
+        self.assertNotIn("Server-Timing", response)
+        log_format, *log_args = info_mock.call_args.args
+        self.assertIn("db_queries=%s db_ms=%.2f", log_format)
+        self.assertEqual(log_args[-2], 2)
+        self.assertGreater(log_args[-1], 0)
+        self.assertIn(
+            'motorsport_http_request_db_duration_ms_count{method="GET",route="/api/health/"} 1', render_metrics()
+        )
+
+    @override_settings(API_SERVER_TIMING_ENABLED=True)
+    def test_server_timing_header_is_opt_in(self):
+        middleware = RequestIdMiddleware(query_twice)
+
+        with patch("racing.middleware.request_logger.info"):
+            response = middleware(self.factory.get("/api/health/"))
+
+        self.assertRegex(response["Server-Timing"], r'^db;dur=\d+\.\d{2};desc="2 queries", total;dur=\d+$')
@@ -0,0 +1,108 @@
+from datetime import date
+
+from django.test import SimpleTestCase, TestCase
+
+from racing.models import ConstructorRoundStanding, Driver, DriverRoundStanding, Race, RaceResult, Season, Team
+from racing.ranking import assign_positions, cumulative_round_standings
+
+
+class CountbackRankingTests(SimpleTestCase):
+    def test_ties_are_broken_by_full_countback(self):
+        rows = assign_positions(
+            [
+                {"subject_id": 1, "name": "Aaron", "points": 43, "histogram": {1: 1, 3: 1, 8: 1}},
+                {"subject_id": 2, "name": "Zed", "points": 43, "histogram": {1: 1, 2: 1}},
+                {"subject_id": 3, "name": "Mia", "points": 50, "histogram": {4: 5}},
+                {"subject_id": 4, "name": "Bea", "points": 43, "histogram": {1: 1, 3: 1, 8: 1}},
+            ]
+        )
+
+        self.assertEqual([(row["position"], row["subject_id"]) for row in rows], [(1, 3), (2, 2), (3, 1), (4, 4)])
+
+
+class CumulativeRoundStandingsTests(SimpleTestCase):
+    def test_subjects_enter_tables_from_their_first_result(self):
+        results = [
+            {"race_id": 1, "subject": 10, "name": "A", "position": 1, "points_earned": 25},
+            {"race_id": 2, "subject": 20, "name": "B", "position": 1, "points_earned": 25},
+            {"race_id": 2, "subject": 10, "name": "A", "position": 2, "points_earned": 18},
+        ]
+
+        tables = cumulative_round_standings([1, 2], results, "subject", "name")
+
+        self.assertEqual([(row["subject_id"], row["points"]) for row in tables[1]], [(10, 25)])
+        self.assertEqual(
+            [(row["position"], row["subject_id"], row["points"], row["wins"]) for row in tables[2]],
+            [(1, 10, 43, 1), (2, 20, 25, 1)],
+        )
+
+
+class RoundStandingsSyncTests(TestCase):
+    def setUp(self):
+        self.team = Team.objects.create(name="Red Apex", country="Italy")
+        self.driver_a = Driver.objects.create(name="Max Fast", team=self.team)
+        self.driver_b = Driver.objects.create(name="Luca Stone", team=self.team)
+        self.season = Season.objects.create(year=2026, name="World Championship 2026")
+        self.race_1 = self.create_race(1)
+        self.race_2 = self.create_race(2)
+
+    def create_race(self, round_number):
+        return Race.objects.create(
+            season=self.season,
+            round_number=round_number,
+            name=f"Grand Prix {round_number}",
+            country="Italy",
+            race_date=date(2026, 3, round_number),
+        )
+
+    def snapshot(self, race):
+        return list(
+            DriverRoundStanding.objects.filter(race=race)
+            .order_by("position")
+            .values_list("position", "driver_id", "points")
+        )
+
+    def test_result_changes_update_later_rounds(self):
+        RaceResult.objects.create(race=self.race_1, driver=self.driver_b, position=1, points_earned=25)
+        RaceResult.objects.create(race=self.race_2, driver=self.driver_a, position=1, points_earned=25)
+        RaceResult.objects.create(race=self.race_2, driver=self.driver_b, position=2, points_earned=18)
+
+        self.assertEqual(self.snapshot(self.race_1), [(1, self.driver_b.id, 25)])
+        self.assertEqual(self.snapshot(self.race_2), [(1, self.driver_b.id, 43), (2, self.driver_a.id, 25)])
+
+        first = RaceResult.objects.get(race=self.race_1)
+        first.points_earned = 0
+        first.save()
+
+        self.assertEqual(self.snapshot(self.race_2), [(1, self.driver_a.id, 25), (2, self.driver_b.id, 18)])
+        self.assertEqual(
+            list(ConstructorRoundStanding.objects.filter(race=self.race_2).values_list("team_id", "points")),
+            [(self.team.id, 43)],
+        )
+
+    def test_result_moved_to_a_later_round_leaves_the_rounds_before_it(self):
+        RaceResult.objects.create(race=self.race_1, driver=self.driver_a, position=1, points_earned=25)
+        result = RaceResult.objects.create(race=self.race_1, driver=self.driver_b, position=2, points_earned=18)
+
+        result.race = self.race_2
+        result.position = 1
+        result.points_earned = 25
+        result.save()
+
+        self.assertEqual(self.snapshot(self.race_1), [(1, self.driver_a.id, 25)])
+        # Level on every count, so the name settles it.
+        self.assertEqual(self.snapshot(self.race_2), [(1, self.driver_b.id, 25), (2, self.driver_a.id, 25)])
+
+    def test_new_round_carries_cumulative_totals_forward(self):
+        RaceResult.objects.create(race=self.race_1, driver=self.driver_a, position=1, points_earned=25)
+
+        race_3 = self.create_race(3)
+
+        self.assertEqual(self.snapshot(race_3), [(1, self.driver_a.id, 25)])
+
+    def test_deleted_result_drops_snapshot_rows(self):
+        result = RaceResult.objects.create(race=self.race_1, driver=self.driver_a, position=1, points_earned=25)
+
+        result.delete()
+
+        self.assertFalse(DriverRoundStanding.objects.filter(season=self.season).exists())
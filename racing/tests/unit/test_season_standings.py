@@ -0,0 +1,208 @@
+from datetime import date
+from importlib import import_module
+
+from django.apps import apps
+from django.test import TestCase
+
+from racing.models import (
+    ConstructorSeasonStanding,
+    Driver,
+    DriverRoundStanding,
+    DriverSeasonStanding,
+    Race,
+    RaceResult,
+    Season,
+    Team,
+)
+
+
+class SeasonStandingsSyncTests(TestCase):
+    def setUp(self):
+        self.team_red = Team.objects.create(name="Red Apex", country="Italy")
+        self.team_blue = Team.objects.create(name="Blue Arrow", country="UK")
+        self.driver_a = Driver.objects.create(name="Max Fast", team=self.team_red)
+        self.driver_b = Driver.objects.create(name="Luca Stone", team=self.team_red)
+        self.driver_c = Driver.objects.create(name="Owen Pace", team=self.team_blue)
+        self.season = Season.objects.create(year=2026, name="World Championship 2026")
+        self.race_1 = Race.objects.create(
+            season=self.season,
+            round_number=1,
+            name="Australian Grand Prix",
+            country="Australia",
+            race_date=date(2026, 3, 15),
+        )
+        self.race_2 = Race.objects.create(
+            season=self.season,
+            round_number=2,
+            name="Spanish Grand Prix",
+            country="Spain",
+            race_date=date(2026, 4, 19),
+        )
+
+    def driver_table(self):
+        return list(
+            DriverSeasonStanding.objects.filter(season=self.season)
+            .order_by("position")
+            .values_list("position", "driver_id", "points", "wins", "podiums")
+        )
+
+    def constructor_table(self):
+        return list(
+            ConstructorSeasonStanding.objects.filter(season=self.season)
+            .order_by("position")
+            .values_list("position", "team_id", "points", "wins", "podiums")
+        )
+
+    def test_created_results_build_ranked_rows(self):
+        RaceResult.objects.create(race=self.race_1, driver=self.driver_c, position=1, points_earned=25)
+        RaceResult.objects.create(race=self.race_1, driver=self.driver_a, position=2, points_earned=18)
+        RaceResult.objects.create(race=self.race_1, driver=self.driver_b, position=3, points_earned=15)
+
+        self.assertEqual(
+            self.driver_table(),
+            [
+                (1, self.driver_c.id, 25, 1, 1),
+                (2, self.driver_a.id, 18, 0, 1),
+                (3, self.driver_b.id, 15, 0, 1),
+            ],
+        )
+        self.assertEqual(
+            self.constructor_table(),
+            [
+                (1, self.team_red.id, 33, 0, 2),
+                (2, self.team_blue.id, 25, 1, 1),
+            ],
+        )
+
+    def test_updated_result_reranks_season(self):
+        RaceResult.objects.create(race=self.race_1, driver=self.driver_a, position=1, points_earned=25)
+        result = RaceResult.objects.create(race=self.race_1, driver=self.driver_c, position=2, points_earned=18)
+
+        result.points_earned = 30
+        result.save()
+
+        self.assertEqual([row[1] for row in self.driver_table()], [self.driver_c.id, self.driver_a.id])
+        self.assertEqual(self.constructor_table()[0][:3], (1, self.team_blue.id, 30))
+
+    def test_reassigned_and_deleted_results_drop_empty_rows(self):
+        result = RaceResult.objects.create(race=self.race_1, driver=self.driver_a, position=1, points_earned=25)
+
+        result.driver = self.driver_c
+        result.save()
+        self.assertEqual(self.driver_table(), [(1, self.driver_c.id, 25, 1, 1)])
+        self.assertEqual(self.constructor_table(), [(1, self.team_blue.id, 25, 1, 1)])
+
+        result.delete()
+        self.assertEqual(self.driver_table(), [])
+        self.assertEqual(self.constructor_table(), [])
+
+    def test_result_write_renumbers_only_the_points_band(self):
+        RaceResult.objects.create(race=self.race_1, driver=self.driver_a, position=1, points_earned=25)
+        RaceResult.objects.create(race=self.race_1, driver=self.driver_b, position=2, points_earned=18)
+        result = RaceResult.objects.create(race=self.race_1, driver=self.driver_c, position=3, points_earned=15)
+        # The leader sits above the 15..20 band, so a drift on its row must survive the write.
+        DriverSeasonStanding.objects.filter(driver=self.driver_a).update(podiums=9)
+
+        result.points_earned = 20
+        result.save()
+
+        self.assertEqual(
+            self.driver_table(),
+            [
+                (1, self.driver_a.id, 25, 1, 9),
+                (2, self.driver_c.id, 20, 0, 1),
+                (3, self.driver_b.id, 18, 0, 1),
+            ],
+        )
+
+    def test_result_moved_to_another_season_leaves_the_old_table(self):
+        other_season = Season.objects.create(year=2027)
+        other_race = Race.objects.create(
+            season=other_season,
+            round_number=1,
+            name="Bahrain Grand Prix",
+            country="Bahrain",
+            race_date=date(2027, 3, 7),
+        )
+        RaceResult.objects.create(race=self.race_1, driver=self.driver_a, position=1, points_earned=25)
+        result = RaceResult.objects.create(race=self.race_2, driver=self.driver_c, position=1, points_earned=25)
+
+        result.race = other_race
+        result.save()
+
+        self.assertEqual(self.driver_table(), [(1, self.driver_a.id, 25, 1, 1)])
+        self.assertEqual(
+            list(DriverSeasonStanding.objects.filter(season=other_season).values_list("position", "driver_id", "points")),
+            [(1, self.driver_c.id, 25)],
+        )
+
+    def test_driver_team_change_moves_constructor_points(self):
+        RaceResult.objects.create(race=self.race_1, driver=self.driver_a, position=1, points_earned=25)
+
+        self.driver_a.team = self.team_blue
+        self.driver_a.save()
+
+        self.assertEqual(self.constructor_table(), [(1, self.team_blue.id, 25, 1, 1)])
+
+    def test_race_delete_rebuilds_standings_and_points(self):
+        RaceResult.objects.create(race=self.race_1, driver=self.driver_a, position=1, points_earned=25)
+        RaceResult.objects.create(race=self.race_2, driver=self.driver_c, position=1, points_earned=25)
+        RaceResult.objects.create(race=self.race_2, driver=self.driver_a, position=2, points_earned=18)
+
+        self.race_2.delete()
+
+        self.driver_a.refresh_from_db()
+        self.assertEqual(self.driver_a.points, 25)
+        self.assertEqual(self.driver_table(), [(1, self.driver_a.id, 25, 1, 1)])
+        self.assertEqual(self.constructor_table(), [(1, self.team_red.id, 25, 1, 1)])
+
+    def test_rebuild_standings_repairs_drifted_rows(self):
+        RaceResult.objects.create(race=self.race_1, driver=self.driver_a, position=1, points_earned=25)
+        DriverSeasonStanding.objects.filter(season=self.season).update(points=1, position=7)
+        DriverSeasonStanding.objects.create(season=self.season, driver=self.driver_b, points=99)
+
+        Season.rebuild_standings(self.season.id)
+
+        self.assertEqual(self.driver_table(), [(1, self.driver_a.id, 25, 1, 1)])
+
+    def test_equal_points_and_wins_are_ranked_by_countback(self):
+        driver_d = Driver.objects.create(name="Aaron Quick", team=self.team_blue)
+        race_3 = Race.objects.create(
+            season=self.season,
+            round_number=3,
+            name="Monaco Grand Prix",
+            country="Monaco",
+            race_date=date(2026, 5, 10),
+        )
+        RaceResult.objects.create(race=self.race_1, driver=self.driver_c, position=1, points_earned=25)
+        RaceResult.objects.create(race=self.race_1, driver=driver_d, position=3, points_earned=15)
+        RaceResult.objects.create(race=self.race_2, driver=driver_d, position=1, points_earned=25)
+        RaceResult.objects.create(race=self.race_2, driver=self.driver_c, position=2, points_earned=18)
+        RaceResult.objects.create(race=race_3, driver=driver_d, position=8, points_earned=3)
+
+        self.assertEqual([row[1:3] for row in self.driver_table()], [(self.driver_c.id, 43), (driver_d.id, 43)])
+
+    def test_countback_migration_reranks_rows_ranked_by_name(self):
+        driver_d = Driver.objects.create(name="Aaron Quick", team=self.team_blue)
+        RaceResult.objects.create(race=self.race_1, driver=self.driver_c, position=2, points_earned=18)
+        RaceResult.objects.create(race=self.race_1, driver=driver_d, position=3, points_earned=15)
+        RaceResult.objects.create(race=self.race_2, driver=self.driver_c, position=9, points_earned=2)
+        RaceResult.objects.create(race=self.race_2, driver=driver_d, position=6, points_earned=5)
+        expected = self.driver_table()
+        self.assertEqual([row[1:4] for row in expected], [(self.driver_c.id, 20, 0), (driver_d.id, 20, 0)])
+        # Rows as the pre-countback backfill left them: tied on points and wins, ordered by name.
+        DriverSeasonStanding.objects.filter(driver=driver_d).update(position=1)
+        DriverSeasonStanding.objects.filter(driver=self.driver_c).update(position=2)
+        DriverRoundStanding.objects.filter(race=self.race_2).update(position=0)
+
+        import_module("racing.migrations.0012_countback_standing_positions").rerank_standings(apps, None)
+
+        self.assertEqual(self.driver_table(), expected)
+        self.assertEqual(
+            list(
+                DriverRoundStanding.objects.filter(race=self.race_2)
+                .order_by("position")
+                .values_list("position", "driver_id")
+            ),
+            [(1, self.driver_c.id), (2, driver_d.id)],
+        )
@@ -0,0 +1,103 @@
+import threading
+
+from django.test import SimpleTestCase, override_settings
+
+from racing.sql_stats import SqlStatementStats, fingerprint_sql, query_id, render_statement_metrics, statement_stats
+
+
+class FingerprintTests(SimpleTestCase):
+    def test_strips_literals_and_placeholders(self):
+        self.assertEqual(
+            fingerprint_sql("SELECT \"t1\".\"id\" FROM t1 WHERE name = 'O''Neil' AND points > 12.5 LIMIT 21"),
+            'SELECT "t1"."id" FROM t1 WHERE name = ? AND points > ? LIMIT ?',
+        )
+        self.assertEqual(fingerprint_sql("SELECT 1 FROM t WHERE a = %s"), "SELECT ? FROM t WHERE a = ?")
+
+    def test_collapses_in_lists_and_multi_row_values(self):
+        self.assertEqual(
+            fingerprint_sql("SELECT * FROM t WHERE id IN (%s, %s, %s)"),
+            fingerprint_sql("SELECT * FROM t WHERE id IN (7)"),
+        )
+        self.assertEqual(
+            fingerprint_sql("INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s)"),
+            "INSERT INTO t (a, b) VALUES (...)",
+        )
+
+    def test_folds_whitespace(self):
+        self.assertEqual(fingerprint_sql("SELECT  a\n  FROM t "), "SELECT a FROM t")
+
+
+class SqlStatementStatsTests(SimpleTestCase):
+    def test_aggregates_calls_time_and_rows_per_fingerprint(self):
+        stats = SqlStatementStats()
+        stats.record("UPDATE t SET a = %s WHERE id = %s", 2.0, 1)
+        stats.record("UPDATE t SET a = %s WHERE id = %s", 6.0, 3)
+        stats.record("SELECT * FROM t", 1.0, -1)
+
+        top = stats.top(10)
+
+        self.assertEqual([entry["query"] for entry in top], ["UPDATE t SET a = ? WHERE id = ?", "SELECT * FROM t"])
+        self.assertEqual(
+            top[0],
+            {
+                "query_id": query_id("UPDATE t SET a = ? WHERE id = ?"),
+                "query": "UPDATE t SET a = ? WHERE id = ?",
+                "calls": 2,
+                "total_ms": 8.0,
+                "mean_ms": 4.0,
+                "max_ms": 6.0,
+                "rows": 4,
+            },
+        )
+        self.assertEqual(top[1]["rows"], 0)
+
+    @override_settings(SQL_STATS_MAX_ENTRIES=20)
+    def test_evicts_least_costly_fingerprints_when_full(self):
+        stats = SqlStatementStats()
+        for index in range(20):
+            stats.record(f"SELECT * FROM table_{chr(97 + index)}", float(index + 1), 0)
+
+        stats.record("SELECT * FROM newcomer", 0.5, 0)
+
+        self.assertEqual(len(stats), 20)
+        self.assertEqual(stats.evicted, 1)
+        queries = [entry["query"] for entry in stats.top(20)]
+        self.assertNotIn("SELECT * FROM table_a", queries)
+        self.assertIn("SELECT * FROM newcomer", queries)
+        self.assertEqual(queries[0], "SELECT * FROM table_t")
+
+    def test_merges_per_thread_tables_including_exited_threads(self):
+        stats = SqlStatementStats()
+        stats.record("SELECT * FROM t WHERE id = %s", 1.0, 0)
+
+        def worker(duration_ms):
+            for _ in range(100):
+                stats.record("SELECT * FROM t WHERE id = 42", duration_ms, 0)
+
+        threads = [threading.Thread(target=worker, args=(float(index),)) for index in range(1, 5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        [entry] = stats.top(10)
+        self.assertEqual((entry["calls"], entry["total_ms"], entry["max_ms"]), (401, 1001.0, 4.0))
+        self.assertEqual(stats.top(10), [entry])  # Exited threads stay folded in.
+
+        stats.reset()
+        self.assertEqual(stats.top(10), [])
+        stats.record("SELECT 1", 1.0, 0)
+        self.assertEqual(len(stats), 1)
+
+    def test_metrics_expose_top_fingerprints_per_worker(self):
+        statement_stats.reset()
+        self.addCleanup(statement_stats.reset)
+        statement_stats.record("SELECT * FROM t WHERE id = %s", 3.0, 1)
+
+        payload = "\n".join(render_statement_metrics(5))
+
+        label = 'query_id="%s"' % query_id("SELECT * FROM t WHERE id = ?")
+        self.assertIn("# TYPE motorsport_sql_statement_calls_total counter", payload)
+        self.assertRegex(payload, r'motorsport_sql_statement_calls_total\{pid="\d+",%s\} 1\n' % label)
+        self.assertRegex(payload, r'motorsport_sql_statement_duration_ms_total\{pid="\d+",%s\} 3.0' % label)
+        self.assertNotIn("query_id", "\n".join(render_statement_metrics(0)))
@@ -0,0 +1,36 @@
+import threading
+
+from django.test import SimpleTestCase
+
+from racing.thread_shards import ThreadShards
+
+
+class ThreadShardsTests(SimpleTestCase):
+    def test_each_thread_gets_its_own_shard_until_cleared_or_rekeyed(self):
+        shards = ThreadShards(lambda key: [key])
+        first = shards.current("a")
+        self.assertIs(shards.current("a"), first)
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(shards.current("a")))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], first)
+
+        self.assertEqual(shards.current("b"), ["b"])
+        with shards.lock:
+            shards.clear()
+        self.assertIsNot(shards.current("b"), first)
+
+    def test_prune_retires_shards_of_exited_threads_once(self):
+        shards = ThreadShards(lambda key: [])
+        live = shards.current()
+        thread = threading.Thread(target=shards.current)
+        thread.start()
+        thread.join()
+
+        retired = []
+        with shards.lock:
+            self.assertEqual(shards.prune(retired.append), [live])
+            self.assertEqual(shards.prune(retired.append), [live])
+        self.assertEqual(len(retired), 1)
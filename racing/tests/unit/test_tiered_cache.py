@@ -0,0 +1,106 @@
+import threading
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from racing import tiered_cache
+from racing.tiered_cache import LocalLRUCache, get_or_compute, get_or_compute_latest
+
+
+class LocalLRUCacheTests(SimpleTestCase):
+    @override_settings(LOCAL_CACHE_MAX_ENTRIES=2)
+    def test_least_recently_used_entry_is_evicted(self):
+        local = LocalLRUCache()
+        local.set("a", 1, 60)
+        local.set("b", 2, 60)
+        local.get("a")
+        local.set("c", 3, 60)
+
+        self.assertEqual((local.get("a"), local.get("b"), local.get("c")), (1, None, 3))
+
+    def test_expired_entries_are_dropped(self):
+        local = LocalLRUCache()
+        local.set("a", 1, 60)
+
+        with mock.patch("racing.tiered_cache.time.monotonic", return_value=time.monotonic() + 61):
+            self.assertIsNone(local.get("a"))
+        self.assertEqual(len(local), 0)
+
+
+class GetOrComputeTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        tiered_cache.local_cache.clear()
+
+    def test_value_is_computed_once_and_served_from_local_cache(self):
+        compute = mock.Mock(return_value={"points": 25})
+
+        self.assertEqual(get_or_compute("hot", compute, 60), {"points": 25})
+        with mock.patch.object(tiered_cache.cache, "get") as l2_get:
+            self.assertEqual(get_or_compute("hot", compute, 60), {"points": 25})
+
+        l2_get.assert_not_called()
+        compute.assert_called_once()
+
+    def test_stale_value_is_served_while_another_worker_recomputes(self):
+        cache.set("tiered:hot", ("stale", time.time() - 1), 60)
+        cache.add("tiered:lock:hot", True, 10)
+        compute = mock.Mock(return_value="fresh")
+
+        self.assertEqual(get_or_compute("hot", compute, 60), "stale")
+        compute.assert_not_called()
+
+    def test_expired_value_is_refreshed_by_the_lock_winner(self):
+        cache.set("tiered:hot", ("stale", time.time() - 1), 60)
+
+        self.assertEqual(get_or_compute("hot", lambda: "fresh", 60), "fresh")
+        self.assertIsNone(cache.get("tiered:lock:hot"))
+        self.assertEqual(cache.get("tiered:hot")[0], "fresh")
+
+    def test_missing_value_waits_for_the_lock_winner(self):
+        cache.add("tiered:lock:hot", True, 10)
+        compute = mock.Mock(return_value="duplicate")
+
+        def winner_finishes(_seconds):
+            cache.set("tiered:hot", ("winner", time.time() + 60), 120)
+
+        with mock.patch("racing.tiered_cache.time.sleep", side_effect=winner_finishes):
+            self.assertEqual(get_or_compute("hot", compute, 60), "winner")
+        compute.assert_not_called()
+
+    def test_callers_racing_on_a_just_bumped_version_serve_the_latest_value(self):
+        self.assertEqual(get_or_compute("standings:2026:1", lambda: "v1", 60, latest_key="standings:2026"), "v1")
+        tiered_cache.local_cache.clear()
+        computing, release = threading.Event(), threading.Event()
+        results = {}
+
+        def slow_compute():
+            computing.set()
+            release.wait(5)
+            return "v2"
+
+        def winner():
+            results["winner"] = get_or_compute_latest("standings:2026:2", slow_compute, 60, "standings:2026")
+
+        thread = threading.Thread(target=winner)
+        thread.start()
+        self.assertTrue(computing.wait(5))
+        with mock.patch("racing.tiered_cache.time.sleep", side_effect=AssertionError("loser waited")):
+            results["loser"] = get_or_compute_latest(
+                "standings:2026:2", mock.Mock(side_effect=AssertionError("loser recomputed")), 60, "standings:2026"
+            )
+        release.set()
+        thread.join(5)
+
+        self.assertEqual(results, {"winner": ("v2", True), "loser": ("v1", False)})
+        self.assertEqual(get_or_compute_latest("standings:2026:2", mock.Mock(), 60, "standings:2026"), ("v2", True))
+
+    def test_lock_taken_over_after_expiry_is_not_released_by_the_old_holder(self):
+        def compute_past_lock_timeout():
+            cache.set("tiered:lock:hot", "other-worker", 10)  # Our lock expired and someone else took it.
+            return "fresh"
+
+        self.assertEqual(get_or_compute("hot", compute_past_lock_timeout, 60), "fresh")
+        self.assertEqual(cache.get("tiered:lock:hot"), "other-worker")
@@ -1,8 +1,13 @@
+from unittest import mock
+
+from django.core.cache import cache
 from django.test import TestCase
 from rest_framework.exceptions import ValidationError
 
+from racing.caching import season_generation
 from racing.models import Season
-from racing.views import resolve_season
+from racing.tiered_cache import local_cache
+from racing.views import resolve_season, resolve_season_reference_and_generation
 
 
 class ResolveSeasonTests(TestCase):
@@ -29,3 +34,31 @@ class ResolveSeasonTests(TestCase):
     def test_invalid_non_numeric_query_raises_validation_error(self):
         with self.assertRaises(ValidationError):
             resolve_season("latest")
+
+
+class ResolveSeasonReferenceAndGenerationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        local_cache.clear()
+        self.addCleanup(local_cache.clear)
+        self.season_2025 = Season.objects.create(year=2025, name="World Championship 2025")
+        self.season_2026 = Season.objects.create(year=2026, name="World Championship 2026")
+
+    def test_repeat_lookups_read_both_generations_in_one_round_trip(self):
+        resolve_season_reference_and_generation("2026")
+
+        with mock.patch("racing.caching.cache", wraps=cache) as cache_calls:
+            reference, generation = resolve_season_reference_and_generation("2026")
+
+        self.assertEqual(reference, (self.season_2026.id, 2026))
+        self.assertEqual(generation, season_generation(self.season_2026.id))
+        self.assertEqual([call[0] for call in cache_calls.method_calls], ["get_many"])
+
+    def test_a_stale_guess_falls_back_to_the_resolved_season(self):
+        resolve_season_reference_and_generation(None)
+        season_2027 = Season.objects.create(year=2027, name="World Championship 2027")
+
+        reference, generation = resolve_season_reference_and_generation(None)
+
+        self.assertEqual(reference, (season_2027.id, 2027))
+        self.assertEqual(generation, season_generation(season_2027.id))
@@ -0,0 +1,56 @@
+"""Per-thread shards for recorders whose hot path must never wait on another thread."""
+
+import threading
+from collections.abc import Callable
+
+
+class ThreadShards:
+    """Registry handing each thread its own shard, built by ``create(key)``.
+
+    A thread gets a new shard after ``clear()`` or when it asks with another ``key``. ``prune``
+    and ``clear`` must be called holding ``lock``, so callers can update the state they fold
+    exited shards into under the same lock.
+    """
+
+    def __init__(self, create: Callable):
+        self._create = create
+        self.lock = threading.Lock()  # Guards the registry; never taken once a thread has its shard.
+        self._thread_state = threading.local()
+        self._shards = []  # (thread, generation, shard) for every thread that recorded since the last clear.
+        self._generation = 0
+
+    def current(self, key=None):
+        state = self._thread_state
+        if getattr(state, "generation", None) != self._generation or state.key != key:
+            generation = self._generation
+            shard = self._create(key)
+            with self.lock:
+                self._shards.append((threading.current_thread(), generation, shard))
+            state.shard, state.key, state.generation = shard, key, generation
+        return state.shard
+
+    def prune(self, retire: Callable) -> list:
+        """Pass the shards of exited threads to ``retire`` and drop them; return the live shards."""
+        live = []
+        for thread, generation, shard in self._shards:
+            if generation != self._generation:
+                continue
+            if thread.is_alive():
+                live.append((thread, generation, shard))
+            else:
+                retire(shard)
+        self._shards[:] = live
+        return [shard for _, _, shard in live]
+
+    def clear(self) -> list:
+        """Forget every shard; threads start new ones on their next record. Returns the dropped shards."""
+        dropped = [shard for _, _, shard in self._shards]
+        self._shards.clear()
+        self._generation += 1
+        return dropped
+
+    def reset_after_fork(self) -> None:
+        """Start from no shards: after a fork the parent's threads and series are not ours."""
+        self.lock = threading.Lock()  # Another thread may have held it at fork time.
+        self._shards = []
+        self._generation += 1
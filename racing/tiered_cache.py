@@ -0,0 +1,118 @@
+"""Two-tier cache for version-keyed entries: an in-process LRU (L1) in front of the Django cache (L2).
+
+Stale L2 entries are recomputed by one ``cache.add`` lock holder while the others serve the stale value.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+
+L2_KEY = "tiered:{key}"
+LOCK_KEY = "tiered:lock:{key}"
+LATEST_KEY = "tiered:latest:{key}"
+LOCK_TIMEOUT = 10
+WAIT_TIMEOUT = 2
+WAIT_INTERVAL = 0.05
+
+_MISSING = object()
+
+
+class LocalLRUCache:
+    """Thread-safe LRU with per-entry expiry, bounded by entry count."""
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout: float) -> None:
+        max_entries = settings.LOCAL_CACHE_MAX_ENTRIES
+        if max_entries <= 0 or timeout <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + timeout)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+local_cache = LocalLRUCache()
+
+
+def get_or_compute(key: str, compute, timeout: int, latest_key: str | None = None):
+    """Return the value for ``key`` from L1, then L2, computing it at most once per expiry."""
+    return get_or_compute_latest(key, compute, timeout, latest_key)[0]
+
+
+def get_or_compute_latest(key: str, compute, timeout: int, latest_key: str | None = None) -> tuple:
+    """Like ``get_or_compute``, returning ``(value, current)``.
+
+    ``current`` is ``False`` when the value is the last one computed for ``latest_key`` under an
+    older version, so callers can skip validators (ETags) that name the new version.
+    """
+    local_timeout = min(settings.LOCAL_CACHE_TIMEOUT, timeout)
+    value = local_cache.get(key, _MISSING)
+    if value is not _MISSING:
+        return value, True
+
+    l2_key = L2_KEY.format(key=key)
+    lock_key = LOCK_KEY.format(key=key)
+    token = uuid.uuid4().hex
+    envelope = cache.get(l2_key)
+    if envelope is not None:
+        value, fresh_until = envelope
+        if fresh_until > time.time():
+            local_cache.set(key, value, local_timeout)
+            return value, True
+        if not cache.add(lock_key, token, LOCK_TIMEOUT):
+            # Someone else is refreshing; the stale value is still the right version.
+            return value, True
+    elif not cache.add(lock_key, token, LOCK_TIMEOUT):
+        if latest_key is not None:
+            latest = cache.get(LATEST_KEY.format(key=latest_key), _MISSING)
+            if latest is not _MISSING:
+                return latest, False
+        deadline = time.monotonic() + WAIT_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(WAIT_INTERVAL)
+            envelope = cache.get(l2_key)
+            if envelope is not None:
+                local_cache.set(key, envelope[0], local_timeout)
+                return envelope[0], True
+        # The winner died or is too slow; compute without the lock rather than fail.
+        return compute(), True
+
+    try:
+        value = compute()
+        # Keep the value past its soft expiry so stale reads can cover the next recompute.
+        cache.set(l2_key, (value, time.time() + timeout), timeout * 2)
+        if latest_key is not None:
+            cache.set(LATEST_KEY.format(key=latest_key), value, timeout * 2)
+        local_cache.set(key, value, local_timeout)
+    finally:
+        # Not atomic, but it only misfires if the lock expires between these two calls.
+        if cache.get(lock_key) == token:
+            cache.delete(lock_key)
+    return value, True
@@ -16,8 +16,11 @@ from .views import (
     TokenLoginView,
     TokenRefreshScopedView,
     api_stats,
+    championship_progression,
+    championship_status,
     constructor_season_standings,
     driver_season_standings,
+    teammate_head_to_head,
 )
 
 router = DefaultRouter()
@@ -39,5 +42,8 @@ urlpatterns = [
     path("stats/", api_stats, name="api-stats"),
     path("standings/drivers/", driver_season_standings, name="driver-season-standings"),
     path("standings/constructors/", constructor_season_standings, name="constructor-season-standings"),
+    path("standings/progression/", championship_progression, name="championship-progression"),
+    path("standings/championship/", championship_status, name="championship-status"),
+    path("standings/teammates/", teammate_head_to_head, name="teammate-head-to-head"),
     path("", include(router.urls)),
 ]
@@ -1,14 +1,17 @@
+import os
+import re
+
 from django.conf import settings
 from django.db import DatabaseError, connection
-from django.db.models import Count, Max, Q, Sum
-from django.http import HttpResponse
+from django.db.models import Count, F, Sum, Window
+from django.http import Http404, HttpResponse
 from django.middleware.csrf import get_token
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_protect
 from rest_framework import status, viewsets
 from rest_framework.decorators import action, api_view, permission_classes, throttle_classes
 from rest_framework.exceptions import ValidationError
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.throttling import ScopedRateThrottle
 from rest_framework.views import APIView
@@ -19,12 +22,39 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
 
 from .auth_cookies import clear_auth_cookies, set_auth_cookies
+from .caching import (
+    build_etag,
+    etag_matches,
+    season_and_directory_generations,
+    season_directory_generation,
+    season_generation,
+    stats_generation,
+)
+from .columnar import ColumnarListMixin
+from .fieldsets import related_paths
 from .metrics import render_metrics
-from .models import Driver, Race, RaceResult, Season, Team
+from .models import (
+    ApiStats,
+    ConstructorRoundStanding,
+    ConstructorSeasonStanding,
+    Driver,
+    DriverRoundStanding,
+    DriverSeasonStanding,
+    Race,
+    RaceResult,
+    Season,
+    Team,
+)
 from .permissions import IsAdminOrReadOnly
+from .profiling import profile_store
+from .ranking import championship_outlook
+from .response_cache import CachedResponseMixin
+from .tiered_cache import get_or_compute, get_or_compute_latest, local_cache
 from .serializers import (
     ApiStatsSerializer,
     AuthSessionResponseSerializer,
+    ChampionshipProgressionResponseSerializer,
+    ChampionshipStatusResponseSerializer,
     AuthMeSerializer,
     ConstructorSeasonStandingsResponseSerializer,
     CsrfTokenSerializer,
@@ -34,15 +64,32 @@ from .serializers import (
     HealthCheckSerializer,
     LoginSerializer,
     LogoutSerializer,
+    RaceClassificationSerializer,
     RaceResultSerializer,
     RaceSerializer,
     RefreshTokenRequestSerializer,
     RegisterSerializer,
+    RequestProfilesResponseSerializer,
     SeasonSerializer,
     SessionRefreshResponseSerializer,
+    SqlStatementStatsResponseSerializer,
     TeamDetailSerializer,
+    TeammateHeadToHeadResponseSerializer,
     TeamSerializer,
 )
+from .sql_stats import statement_stats
+
+
+AFTER_ROUND_PARAMETER = OpenApiParameter(
+    name="after_round",
+    type=int,
+    location=OpenApiParameter.QUERY,
+    description="Return standings as of the last round not after this round number.",
+    required=False,
+)
+
+SQL_STATS_DEFAULT_LIMIT = 20
+UNSAFE_FILENAME_CHARACTERS_RE = re.compile(r"[^A-Za-z0-9._-]")
 
 
 def parse_optional_int_query_param(
@@ -78,6 +125,115 @@ def resolve_season(query_value: str | None):
     return Season.objects.order_by("-year").first()
 
 
+def season_reference_lookup(query_value: str | None) -> str:
+    season_value = parse_optional_int_query_param(query_value, "season")
+    if season_value is None:
+        return "latest"
+    if len(query_value.strip()) == 4:
+        return f"year:{season_value}"
+    return f"id:{season_value}"
+
+
+def resolve_season_reference(
+    query_value: str | None, directory_generation: int | None = None
+) -> tuple[int, int] | None:
+    """Resolve ``?season=`` to ``(season_id, year)``, cached until a season is written."""
+    lookup = season_reference_lookup(query_value)
+    if directory_generation is None:
+        directory_generation = season_directory_generation()
+
+    def load_reference():
+        season = resolve_season(query_value)
+        return (season.id, season.year) if season else ()
+
+    reference = get_or_compute(
+        f"standings:season-ref:{directory_generation}:{lookup}",
+        load_reference,
+        settings.STANDINGS_CACHE_TIMEOUT,
+    )
+    return tuple(reference) or None
+
+
+def resolve_season_reference_and_generation(query_value: str | None) -> tuple[tuple[int, int] | None, int | None]:
+    """``(reference, season generation)`` for ``?season=``, usually in one cache round-trip.
+
+    The season this lookup resolved to last time in this worker is a guess: its generation is
+    fetched together with the directory generation, and only re-read if the guess was wrong.
+    """
+    hint_key = f"standings:season-ref-hint:{season_reference_lookup(query_value)}"
+    hint = local_cache.get(hint_key)
+    if hint is None:
+        reference = resolve_season_reference(query_value)
+        generation = None
+    else:
+        generation, directory_generation = season_and_directory_generations(hint[0])
+        reference = resolve_season_reference(query_value, directory_generation)
+    if reference is None:
+        return None, None
+    if reference != hint:
+        generation = season_generation(reference[0])
+        local_cache.set(hint_key, reference, settings.LOCAL_CACHE_TIMEOUT)
+    return reference, generation
+
+
+def resolve_round_reference(season_id: int, after_round: int) -> tuple[int | None, int | None]:
+    """Return ``(race_id, round_number)`` of the last round of the season not after ``after_round``."""
+    return (
+        Race.objects.filter(season_id=season_id, round_number__lte=after_round)
+        .order_by("-round_number")
+        .values_list("id", "round_number")
+        .first()
+        or (None, None)
+    )
+
+
+def standings_cache_kind(kind: str, after_round: int | None) -> str:
+    return kind if after_round is None else f"{kind}-after-{after_round}"
+
+
+def season_standings_response(request, kind: str, build_payload) -> Response:
+    """Serve a season payload versioned by the season generation (payload cache + strong ETag).
+
+    ``build_payload(season_id)`` returns the payload fields besides ``season``.
+    """
+    reference, generation = resolve_season_reference_and_generation(request.query_params.get("season"))
+    if reference is None:
+        return Response({"detail": "No seasons available."}, status=status.HTTP_404_NOT_FOUND)
+
+    season_id, season_year = reference
+    etag = build_etag(kind, season_id, generation)
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        payload, current = get_or_compute_latest(
+            f"standings:payload:{kind}:{season_id}:{generation}",
+            lambda: {"season": season_year, **build_payload(season_id)},
+            settings.STANDINGS_CACHE_TIMEOUT,
+            latest_key=f"standings:payload:{kind}:{season_id}",
+        )
+        response = Response(payload, status=status.HTTP_200_OK)
+        if not current:
+            # The previous version, served while it is rebuilt: must not be cached under the new ETag.
+            response["Cache-Control"] = "no-cache"
+            return response
+
+    response["ETag"] = etag
+    response["Cache-Control"] = "no-cache"
+    return response
+
+
+class SeasonScopedCachedResponseMixin(CachedResponseMixin):
+    """Tag ``?season=`` lists with their season so writes elsewhere keep them cached."""
+
+    def get_list_cache_tag(self) -> str:
+        season = self.request.query_params.get("season")
+        if season and season.strip():
+            reference = resolve_season_reference(season)
+            if reference is not None:
+                return f"{self.cache_tag_model}:season:{reference[0]}"
+        return super().get_list_cache_tag()
+
+
 def build_auth_user_payload(user) -> dict[str, int | str | bool]:
     return {
         "id": user.id,
@@ -87,9 +243,11 @@ def build_auth_user_payload(user) -> dict[str, int | str | bool]:
     }
 
 
-class TeamViewSet(viewsets.ModelViewSet):
+class TeamViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     serializer_class = TeamSerializer
     permission_classes = [IsAdminOrReadOnly]
+    cache_tag_model = "team"
+    cache_dependencies = ("driver",)
 
     def get_queryset(self):
         queryset = Team.objects.annotate(driver_count=Count("drivers")).order_by("name")
@@ -107,12 +265,22 @@ class TeamViewSet(viewsets.ModelViewSet):
         return TeamSerializer
 
 
-class DriverViewSet(viewsets.ModelViewSet):
+class DriverViewSet(CachedResponseMixin, ColumnarListMixin, viewsets.ModelViewSet):
     serializer_class = DriverSerializer
     permission_classes = [IsAdminOrReadOnly]
+    cache_tag_model = "driver"
+    cache_dependencies = ("team",)
+    cache_list_dependencies = ("result",)
+    columnar_fields = {
+        "id": "id",
+        "name": "name",
+        "points": "points",
+        "team_id": "team_id",
+        "team_name": "team__name",
+    }
 
     def get_queryset(self):
-        queryset = Driver.objects.select_related("team").all()
+        queryset = Driver.objects.select_related(*related_paths(self.get_serializer()))
 
         team_id = self.request.query_params.get("team")
         team_name = self.request.query_params.get("team_name")
@@ -157,9 +325,11 @@ class DriverViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class SeasonViewSet(viewsets.ModelViewSet):
+class SeasonViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     serializer_class = SeasonSerializer
     permission_classes = [IsAdminOrReadOnly]
+    cache_tag_model = "season"
+    cache_dependencies = ("race",)
 
     def get_queryset(self):
         queryset = Season.objects.annotate(race_count=Count("races"))
@@ -170,12 +340,24 @@ class SeasonViewSet(viewsets.ModelViewSet):
         return queryset
 
 
-class RaceViewSet(viewsets.ModelViewSet):
+class RaceViewSet(SeasonScopedCachedResponseMixin, ColumnarListMixin, viewsets.ModelViewSet):
     serializer_class = RaceSerializer
     permission_classes = [IsAdminOrReadOnly]
+    cache_tag_model = "race"
+    cache_dependencies = ("season",)
+    columnar_fields = {
+        "id": "id",
+        "name": "name",
+        "country": "country",
+        "round_number": "round_number",
+        "race_date": "race_date",
+        "season_year": "season__year",
+    }
 
     def get_queryset(self):
-        queryset = Race.objects.select_related("season").all().order_by("season__year", "round_number")
+        queryset = Race.objects.select_related(*related_paths(self.get_serializer())).order_by(
+            "season__year", "round_number"
+        )
         season = self.request.query_params.get("season")
         country = self.request.query_params.get("country")
         season_value = parse_optional_int_query_param(season, "season")
@@ -189,13 +371,51 @@ class RaceViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(country__icontains=country)
         return queryset
 
+    @extend_schema(
+        request=RaceClassificationSerializer,
+        responses={200: RaceClassificationSerializer, 201: RaceClassificationSerializer},
+    )
+    @action(detail=True, methods=["post", "put"], url_path="results/bulk", url_name="results-bulk")
+    def bulk_results(self, request, pk=None):
+        race = self.get_object()
+        if request.method == "POST" and race.results.exists():
+            raise ValidationError({"results": ["Race already has a classification. Use PUT to replace it."]})
+
+        serializer = RaceClassificationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = race.replace_results(serializer.validated_data["results"])
+
+        payload = RaceClassificationSerializer({"race_id": race.id, "results": results}).data
+        response_status = status.HTTP_201_CREATED if request.method == "POST" else status.HTTP_200_OK
+        return Response(payload, status=response_status)
 
-class RaceResultViewSet(viewsets.ModelViewSet):
+
+class RaceResultViewSet(SeasonScopedCachedResponseMixin, ColumnarListMixin, viewsets.ModelViewSet):
     serializer_class = RaceResultSerializer
     permission_classes = [IsAdminOrReadOnly]
+    cache_tag_model = "result"
+    # Results embed their race (with season year) and driver (with points and team); driver and
+    # team writes bump the tags of the results they appear in (see ``racing.models.result_response_tags``).
+    cache_dependencies = ("race", "season")
+    columnar_fields = {
+        "id": "id",
+        "position": "position",
+        "points_earned": "points_earned",
+        "fastest_lap": "fastest_lap",
+        "race_id": "race_id",
+        "race_name": "race__name",
+        "round_number": "race__round_number",
+        "race_date": "race__race_date",
+        "season_year": "race__season__year",
+        "driver_id": "driver_id",
+        "driver_name": "driver__name",
+        "team_id": "driver__team_id",
+        "team_name": "driver__team__name",
+    }
 
     def get_queryset(self):
-        queryset = RaceResult.objects.select_related("race", "race__season", "driver", "driver__team")
+        # Joins follow the serialized fields, so ?fields= / ?expand= selections skip collapsed relations.
+        queryset = RaceResult.objects.select_related(*related_paths(self.get_serializer()))
         race_id = self.request.query_params.get("race")
         season = self.request.query_params.get("season")
         driver_id = self.request.query_params.get("driver")
@@ -368,43 +588,164 @@ class LogoutView(APIView):
             location=OpenApiParameter.QUERY,
             description="Season year (YYYY) or season id. Uses latest season when omitted.",
             required=False,
-        )
+        ),
+        AFTER_ROUND_PARAMETER,
     ],
     responses={
         200: DriverSeasonStandingsResponseSerializer,
+        304: OpenApiResponse(description="Standings unchanged since the supplied ETag."),
         404: DetailMessageSerializer,
     },
 )
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def driver_season_standings(request):
-    season = resolve_season(request.query_params.get("season"))
-    if not season:
-        return Response({"detail": "No seasons available."}, status=status.HTTP_404_NOT_FOUND)
+    after_round = parse_optional_int_query_param(request.query_params.get("after_round"), "after_round")
+
+    def build_payload(season_id):
+        if after_round is None:
+            standings = DriverSeasonStanding.objects.filter(season_id=season_id)
+            payload = {}
+        else:
+            race_id, round_number = resolve_round_reference(season_id, after_round)
+            standings = DriverRoundStanding.objects.filter(race_id=race_id)
+            payload = {"round": round_number}
+
+        rows = standings.values(
+            "position", "driver_id", "driver__name", "driver__team__name", "points", "wins", "podiums"
+        ).order_by("position")
+        payload["results"] = [
+            {
+                "position": row["position"],
+                "driver_id": row["driver_id"],
+                "driver_name": row["driver__name"],
+                "team_name": row["driver__team__name"],
+                "total_points": row["points"],
+                "wins": row["wins"],
+                "podiums": row["podiums"],
+            }
+            for row in rows
+        ]
+        return payload
+
+    return season_standings_response(request, standings_cache_kind("drivers", after_round), build_payload)
+
 
-    standings = (
-        RaceResult.objects.filter(race__season=season)
-        .values("driver_id", "driver__name", "driver__team__name")
-        .annotate(
-            total_points=Sum("points_earned"),
-            wins=Count("id", filter=Q(position=1)),
-            podiums=Count("id", filter=Q(position__lte=3)),
+@extend_schema(
+    parameters=[
+        OpenApiParameter(
+            name="season",
+            type=int,
+            location=OpenApiParameter.QUERY,
+            description="Season year (YYYY) or season id. Uses latest season when omitted.",
+            required=False,
+        ),
+        AFTER_ROUND_PARAMETER,
+    ],
+    responses={
+        200: ConstructorSeasonStandingsResponseSerializer,
+        304: OpenApiResponse(description="Standings unchanged since the supplied ETag."),
+        404: DetailMessageSerializer,
+    },
+)
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def constructor_season_standings(request):
+    after_round = parse_optional_int_query_param(request.query_params.get("after_round"), "after_round")
+
+    def build_payload(season_id):
+        if after_round is None:
+            standings = ConstructorSeasonStanding.objects.filter(season_id=season_id)
+            payload = {}
+        else:
+            race_id, round_number = resolve_round_reference(season_id, after_round)
+            standings = ConstructorRoundStanding.objects.filter(race_id=race_id)
+            payload = {"round": round_number}
+
+        rows = standings.values("position", "team_id", "team__name", "points", "wins", "podiums").order_by(
+            "position"
         )
-        .order_by("-total_points", "-wins", "driver__name")
-    )
+        payload["results"] = [
+            {
+                "position": row["position"],
+                "team_id": row["team_id"],
+                "team_name": row["team__name"],
+                "total_points": row["points"],
+                "wins": row["wins"],
+                "podiums": row["podiums"],
+            }
+            for row in rows
+        ]
+        return payload
+
+    return season_standings_response(request, standings_cache_kind("constructors", after_round), build_payload)
 
-    payload = [
-        {
-            "driver_id": row["driver_id"],
-            "driver_name": row["driver__name"],
-            "team_name": row["driver__team__name"],
-            "total_points": row["total_points"] or 0,
-            "wins": row["wins"],
-            "podiums": row["podiums"],
-        }
-        for row in standings
-    ]
-    return Response({"season": season.year, "results": payload}, status=status.HTTP_200_OK)
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter(
+            name="season",
+            type=int,
+            location=OpenApiParameter.QUERY,
+            description="Season year (YYYY) or season id. Uses latest season when omitted.",
+            required=False,
+        )
+    ],
+    responses={
+        200: ChampionshipProgressionResponseSerializer,
+        304: OpenApiResponse(description="Progression unchanged since the supplied ETag."),
+        404: DetailMessageSerializer,
+    },
+)
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def championship_progression(request):
+    def build_payload(season_id):
+        rows = (
+            RaceResult.objects.filter(race__season_id=season_id)
+            .annotate(
+                cumulative_points=Window(
+                    Sum("points_earned"),
+                    partition_by=[F("driver_id")],
+                    order_by=F("race__round_number").asc(),
+                )
+            )
+            .values("driver_id", "driver__name", "driver__team__name", "race__round_number", "cumulative_points")
+            .order_by("race__round_number", "driver_id")
+        )
+
+        rounds = []
+        drivers = {}
+        for row in rows:
+            if not rounds or rounds[-1] != row["race__round_number"]:
+                rounds.append(row["race__round_number"])
+            driver = drivers.setdefault(
+                row["driver_id"],
+                {
+                    "driver_id": row["driver_id"],
+                    "driver_name": row["driver__name"],
+                    "team_name": row["driver__team__name"],
+                    "points": {},
+                },
+            )
+            driver["points"][row["race__round_number"]] = row["cumulative_points"]
+
+        # Rounds a driver missed carry the previous cumulative total forward.
+        for driver in drivers.values():
+            cumulative = 0
+            series = []
+            for round_number in rounds:
+                cumulative = driver["points"].get(round_number, cumulative)
+                series.append(cumulative)
+            driver["points"] = series
+
+        ordered_drivers = sorted(
+            drivers.values(),
+            key=lambda driver: (-(driver["points"][-1] if driver["points"] else 0), driver["driver_name"]),
+        )
+        return {"rounds": rounds, "drivers": ordered_drivers}
+
+    return season_standings_response(request, "progression", build_payload)
 
 
 @extend_schema(
@@ -418,34 +759,150 @@ def driver_season_standings(request):
         )
     ],
     responses={
-        200: ConstructorSeasonStandingsResponseSerializer,
+        200: ChampionshipStatusResponseSerializer,
+        304: OpenApiResponse(description="Championship status unchanged since the supplied ETag."),
         404: DetailMessageSerializer,
     },
 )
 @api_view(["GET"])
 @permission_classes([AllowAny])
-def constructor_season_standings(request):
-    season = resolve_season(request.query_params.get("season"))
-    if not season:
-        return Response({"detail": "No seasons available."}, status=status.HTTP_404_NOT_FOUND)
+def championship_status(request):
+    max_points_per_race = settings.CHAMPIONSHIP_MAX_POINTS_PER_RACE
+
+    def build_payload(season_id):
+        # Races without a classification yet are the ones still to be run.
+        remaining_races = Race.objects.filter(season_id=season_id, results__isnull=True).count()
+        rows = championship_outlook(
+            [
+                {
+                    "position": row["position"],
+                    "driver_id": row["driver_id"],
+                    "driver_name": row["driver__name"],
+                    "team_name": row["driver__team__name"],
+                    "points": row["points"],
+                }
+                for row in DriverSeasonStanding.objects.filter(season_id=season_id)
+                .values("position", "driver_id", "driver__name", "driver__team__name", "points")
+                .order_by("position")
+            ],
+            remaining_races,
+            max_points_per_race,
+        )
+        return {
+            "remaining_races": remaining_races,
+            "max_points_per_race": max_points_per_race,
+            "points_available": remaining_races * max_points_per_race,
+            "results": [
+                {
+                    "position": row["position"],
+                    "driver_id": row["driver_id"],
+                    "driver_name": row["driver_name"],
+                    "team_name": row["team_name"],
+                    "total_points": row["points"],
+                    "max_points": row["max_points"],
+                    "points_behind": row["points_behind"],
+                    "status": row["status"],
+                }
+                for row in rows
+            ],
+        }
 
-    standings = (
-        RaceResult.objects.filter(race__season=season)
-        .values("driver__team_id", "driver__team__name")
-        .annotate(total_points=Sum("points_earned"), wins=Count("id", filter=Q(position=1)))
-        .order_by("-total_points", "-wins", "driver__team__name")
-    )
+    return season_standings_response(request, f"championship-{max_points_per_race}", build_payload)
+
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter(
+            name="season",
+            type=int,
+            location=OpenApiParameter.QUERY,
+            description="Season year (YYYY) or season id. Uses latest season when omitted.",
+            required=False,
+        )
+    ],
+    responses={
+        200: TeammateHeadToHeadResponseSerializer,
+        304: OpenApiResponse(description="Head-to-head unchanged since the supplied ETag."),
+        404: DetailMessageSerializer,
+    },
+)
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def teammate_head_to_head(request):
+    def build_payload(season_id):
+        rows = (
+            RaceResult.objects.filter(race__season_id=season_id)
+            .values(
+                "race_id",
+                "driver_id",
+                "driver__name",
+                "driver__team_id",
+                "driver__team__name",
+                "position",
+                "points_earned",
+            )
+            .order_by("race_id", "driver__team_id", "position")
+        )
 
-    payload = [
-        {
-            "team_id": row["driver__team_id"],
-            "team_name": row["driver__team__name"],
-            "total_points": row["total_points"] or 0,
-            "wins": row["wins"],
+        teams = {}
+        pairs = {}
+        race_team_key = None
+        race_team_rows = []
+
+        def compare_teammates(team_rows):
+            # Rows are ordered by finishing position, so the first row of each pair finished ahead.
+            for index, ahead in enumerate(team_rows):
+                for behind in team_rows[index + 1 :]:
+                    driver_a, driver_b = sorted((ahead, behind), key=lambda row: row["driver_id"])
+                    pair = pairs.setdefault(
+                        (ahead["driver__team_id"], driver_a["driver_id"], driver_b["driver_id"]),
+                        {
+                            "driver_a_id": driver_a["driver_id"],
+                            "driver_a_name": driver_a["driver__name"],
+                            "driver_b_id": driver_b["driver_id"],
+                            "driver_b_name": driver_b["driver__name"],
+                            "races": 0,
+                            "driver_a_ahead": 0,
+                            "driver_b_ahead": 0,
+                            "driver_a_points": 0,
+                            "driver_b_points": 0,
+                        },
+                    )
+                    pair["races"] += 1
+                    pair["driver_a_ahead" if ahead is driver_a else "driver_b_ahead"] += 1
+                    pair["driver_a_points"] += driver_a["points_earned"]
+                    pair["driver_b_points"] += driver_b["points_earned"]
+
+        for row in rows:
+            teams.setdefault(row["driver__team_id"], row["driver__team__name"])
+            key = (row["race_id"], row["driver__team_id"])
+            if key != race_team_key:
+                compare_teammates(race_team_rows)
+                race_team_key = key
+                race_team_rows = []
+            race_team_rows.append(row)
+        compare_teammates(race_team_rows)
+
+        pairs_by_team = {}
+        for (team_id, _driver_a_id, _driver_b_id), pair in pairs.items():
+            pair["points_delta"] = pair["driver_a_points"] - pair["driver_b_points"]
+            pairs_by_team.setdefault(team_id, []).append(pair)
+
+        return {
+            "teams": [
+                {
+                    "team_id": team_id,
+                    "team_name": team_name,
+                    "pairs": sorted(
+                        pairs_by_team.get(team_id, []),
+                        key=lambda pair: (pair["driver_a_name"], pair["driver_b_name"]),
+                    ),
+                }
+                for team_id, team_name in sorted(teams.items(), key=lambda item: item[1])
+            ]
         }
-        for row in standings
-    ]
-    return Response({"season": season.year, "results": payload}, status=status.HTTP_200_OK)
+
+    return season_standings_response(request, "teammates", build_payload)
 
 
 @extend_schema(responses={200: HealthCheckSerializer, 503: HealthCheckSerializer})
@@ -480,16 +937,81 @@ def metrics_export(request):
     )
 
 
+@extend_schema(
+    parameters=[
+        OpenApiParameter(
+            name="limit",
+            type=int,
+            location=OpenApiParameter.QUERY,
+            description="Number of statement shapes to return, costliest total time first (default 20).",
+            required=False,
+        )
+    ],
+    responses={200: SqlStatementStatsResponseSerializer, 204: OpenApiResponse(description="Statistics reset.")},
+)
+@api_view(["GET", "DELETE"])
+@permission_classes([IsAdminUser])
+def sql_statement_stats(request):
+    """SQL statement shapes of the worker that answers, by total time; ``DELETE`` starts them afresh."""
+    if request.method == "DELETE":
+        statement_stats.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    limit = parse_optional_int_query_param(request.query_params.get("limit"), "limit") or SQL_STATS_DEFAULT_LIMIT
+    payload = {
+        "pid": os.getpid(),
+        "fingerprints": len(statement_stats),
+        "evicted": statement_stats.evicted,
+        "results": statement_stats.top(limit),
+    }
+    return Response(payload, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    responses={200: RequestProfilesResponseSerializer, 204: OpenApiResponse(description="Profiles discarded.")},
+)
+@api_view(["GET", "DELETE"])
+@permission_classes([IsAdminUser])
+def request_profiles(request):
+    """Sampled profiles of the slowest requests kept by the worker that answers, slowest first."""
+    if request.method == "DELETE":
+        profile_store.clear()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    payload = {"pid": os.getpid(), "results": [profile.summary() for profile in profile_store.list()]}
+    return Response(payload, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    operation_id="profiles_download",
+    responses={(200, "application/octet-stream"): OpenApiResponse(description="pstats file.")},
+)
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def request_profile_download(request, request_id):
+    profile = profile_store.get(request_id)
+    if profile is None:
+        raise Http404("No stored profile for this request ID in this worker.")
+
+    filename = UNSAFE_FILENAME_CHARACTERS_RE.sub("_", request_id)
+    response = HttpResponse(profile.data, content_type="application/octet-stream")
+    response["Content-Disposition"] = f'attachment; filename="{filename}.pstats"'
+    return response
+
+
 @extend_schema(responses={200: ApiStatsSerializer})
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def api_stats(request):
-    stats = {
-        "total_teams": Team.objects.count(),
-        "total_drivers": Driver.objects.count(),
-        "total_seasons": Season.objects.count(),
-        "total_races": Race.objects.count(),
-        "total_results": RaceResult.objects.count(),
-        "top_points": Driver.objects.aggregate(max_points=Max("points"))["max_points"] or 0,
-    }
+    fields = ["total_teams", "total_drivers", "total_seasons", "total_races", "total_results", "top_points"]
+
+    def load_stats():
+        stats = ApiStats.objects.filter(pk=ApiStats.SINGLETON_ID).values(*fields).first()
+        if stats is None:
+            stats = {field: getattr(ApiStats.repair(), field) for field in fields}
+        return stats
+
+    stats = get_or_compute(
+        f"stats:payload:{stats_generation()}", load_stats, settings.STATS_CACHE_TIMEOUT, latest_key="stats:payload"
+    )
     return Response(stats, status=status.HTTP_200_OK)